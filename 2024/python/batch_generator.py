@@ -0,0 +1,188 @@
+import logging
+import multiprocessing
+import random
+
+import numpy as np
+import pandas as pd
+
+from constraint_scheduler import constraint_scheduler
+
+#batch_lar_gen copied into each worker process by the pool initializer
+_worker_gen = None
+
+def _init_worker(batch_gen):
+	"""Stores the batch generator sent to a worker process."""
+	global _worker_gen
+	_worker_gen = batch_gen
+
+def _make_clean_shard(shard):
+	"""Generates the clean rows for one shard in a worker process. shard is a tuple of (row_count, batch_size, SeedSequence)."""
+	row_count, batch_size, seed_seq = shard
+	return _worker_gen.make_seeded_rows(row_count, batch_size=batch_size, seed_seq=seed_seq)
+
+
+class batch_lar_gen(object):
+	"""
+	Generates clean LAR data in batches.
+	A batch of rows is generated with lar_gen.make_rows and validated once with the rules engine.
+	Constraints are applied only to the rows that failed an edit and only those rows are validated again,
+	re-running the edits that read a field changed by the constraints. With scheduled constraints each row gets only
+	the constraints tied to the edits it failed, in dependency order.
+	Functions:
+	- failed_index
+	- failed_edits
+	- validate
+	- repair
+	- clean_rows
+	- make_clean_batch
+	- make_clean_rows
+	- make_seeded_rows
+	- make_sharded_rows
+	"""
+	def __init__(self, lar_gen, rules_engine, lar_constraints, lar_file_config, geographic_data, state_codes, zip_code_list, logging_on=False,
+		scheduled=True):
+		"""
+		lar_gen: lar_gen object used to create LAR rows
+		rules_engine: rules_engine object with TS data loaded
+		lar_constraints: lar_data_constraints object used to repair rows that fail edits
+		state_codes: dictionary of 2 digit state FIPS to state letter code
+		scheduled: if True, rows get the constraints of their failed edits, if False every constraint is applied to every failed row
+		"""
+		self.lar_gen = lar_gen
+		self.rules_engine = rules_engine
+		self.lar_constraints = lar_constraints
+		self.lar_file_config = lar_file_config
+		self.geographic_data = geographic_data
+		self.state_codes = state_codes
+		self.zip_code_list = zip_code_list
+		self.logging_on = logging_on
+		self.scheduled = scheduled
+		self.rules_list = ["s", "v"] #edit categories checked on the first validation and on every repair pass
+		self.scheduler = constraint_scheduler(lar_constraints, rules_engine.edit_registry)
+
+	def failed_index(self, results, lar_df):
+		"""
+		Returns the index labels of the rows in lar_df that failed an edit in the edit_results store.
+		lar_df must be the LAR data loaded in the rules engine, a fail of a TS edit marks every row as failed.
+		"""
+		counts = results.fail_counts()
+		if (counts.fail_count[counts.row_type!="LAR"] > 0).any():
+			return lar_df.index
+		return lar_df.index[results.failing_mask(rows=self.rules_engine.typed.values("uli"))]
+
+	def failed_edits(self, results, lar_df, index):
+		"""
+		Returns a list with the names of the edits failed by each row of lar_df at index.
+		lar_df must be the LAR data loaded in the rules engine.
+		"""
+		by_row = results.failed_edits_by_row(rows=self.rules_engine.typed.values("uli"))
+		return [by_row[position] for position in lar_df.index.get_indexer(index)]
+
+	def validate(self, lar_df, rules_list=None):
+		"""Runs the edits in rules_list, or in self.rules_list if None, against lar_df and returns the edit_results store."""
+		self.rules_engine.reset_results()
+		self.rules_engine.load_lar_data(lar_df)
+		return self.rules_engine.run_edits(rules_list=self.rules_list if rules_list is None else rules_list)
+
+	def repair(self, lar_df, index, failed_edits=None):
+		"""
+		Applies one pass of constraint functions to the rows of lar_df at index. lar_df is modified in place.
+		failed_edits: list with the names of the failed edits of each row, all constraints are applied if None
+		"""
+		self.scheduler.repair(lar_df, index, failed_edits=failed_edits)
+
+	def make_clean_batch(self, n, rng=None):
+		"""Returns a DataFrame of n LAR rows that pass syntax and validity edits."""
+		lar_df = self.lar_gen.make_rows(n, lar_file_config=self.lar_file_config, geographic_data=self.geographic_data,
+			state_codes=self.state_codes, zip_code_list=self.zip_code_list, rng=rng)
+		#ULIs identify rows in the edit report so they must be unique within the batch
+		while lar_df.uli.duplicated().any():
+			lar_df = lar_df[~lar_df.uli.duplicated()]
+			new_rows = self.lar_gen.make_rows(n-len(lar_df), lar_file_config=self.lar_file_config, geographic_data=self.geographic_data,
+				state_codes=self.state_codes, zip_code_list=self.zip_code_list, rng=rng)
+			lar_df = pd.concat([lar_df, new_rows], ignore_index=True)
+		return self.clean_rows(lar_df)
+
+	def clean_rows(self, lar_df):
+		"""
+		Validates lar_df and repairs the failing rows until every row passes syntax and validity edits.
+		lar_df is modified in place and returned. ULIs must be unique.
+		"""
+		#the conditional sampler draws rows that pass syntax and validity edits, quality edits are not checked
+		#so that only rows breaking those edits are repaired. The first validation and the repair passes check the
+		#same edits so the scheduler's pass counts only count repairs of those edits.
+		results = self.validate(lar_df)
+		checked_rows = lar_df
+		failed = self.failed_index(results, checked_rows)
+		constraints_iter = 0
+		while len(failed):
+			if self.logging_on:
+				logging.info("constraints iteration {iter}: {count} rows failing edits".format(iter=constraints_iter, count=len(failed)))
+			repaired_rows = lar_df.loc[failed].copy()
+			self.repair(lar_df, failed, failed_edits=self.failed_edits(results, checked_rows, failed) if self.scheduled else None)
+			checked_rows = lar_df.loc[failed]
+			#only edits reading a field changed by the constraints are run again
+			changed_fields = [field for field in lar_df.columns if not repaired_rows[field].equals(checked_rows[field])]
+			self.rules_engine.load_lar_data(checked_rows)
+			results = self.rules_engine.revalidate(changed_fields, rules_list=self.rules_list)
+			failed = self.failed_index(results, checked_rows)
+			constraints_iter += 1
+		self.scheduler.finish_batch(len(lar_df))
+		if self.logging_on:
+			logging.info(self.scheduler.summary())
+		return lar_df
+
+	def make_clean_rows(self, row_count, batch_size=1000, rng=None):
+		"""Returns a DataFrame of row_count clean LAR rows generated batch_size rows at a time."""
+		batches = []
+		for start in range(0, row_count, batch_size):
+			end = min(start+batch_size, row_count)
+			print("generating rows {start} to {end}".format(start=start, end=end))
+			batches.append(self.make_clean_batch(end-start, rng=rng))
+		if not batches:
+			return self.lar_gen.make_rows(0, lar_file_config=self.lar_file_config, geographic_data=self.geographic_data,
+				state_codes=self.state_codes, zip_code_list=self.zip_code_list)
+		return pd.concat(batches, ignore_index=True)
+
+	def make_seeded_rows(self, row_count, batch_size=1000, seed_seq=None):
+		"""
+		Returns row_count clean LAR rows drawn from the random stream of seed_seq.
+		The constraints sample with the random module so it is seeded from the same stream as the NumPy generator.
+		"""
+		if seed_seq is None:
+			seed_seq = np.random.SeedSequence()
+		random.seed(int(seed_seq.generate_state(1)[0]))
+		return self.make_clean_rows(row_count, batch_size=batch_size, rng=np.random.default_rng(seed_seq))
+
+	def make_sharded_rows(self, row_count, workers=1, seed=None, batch_size=1000):
+		"""
+		Returns row_count clean LAR rows generated in workers processes.
+		The rows are split into one shard per worker and each shard gets an independent random stream spawned from seed,
+		so the same seed and worker count always produce the same rows.
+		ULIs repeated across shards are replaced with new rows drawn from a stream reserved for the merge.
+		"""
+		if workers < 1:
+			raise ValueError("workers must be at least 1, got {workers}".format(workers=workers))
+		seed_seqs = np.random.SeedSequence(seed).spawn(workers+1)
+		shards = [(row_count//workers + (i < row_count%workers), batch_size, seed_seqs[i]) for i in range(workers)]
+		if workers == 1:
+			shard_dfs = [self.make_seeded_rows(*shards[0])]
+		else:
+			#generation scripts run at module level, fork keeps workers from re-running them where it is available
+			start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+			pool = multiprocessing.get_context(start_method).Pool(workers, initializer=_init_worker, initargs=(self,))
+			try:
+				shard_dfs = pool.map(_make_clean_shard, shards)
+			finally:
+				pool.close()
+				pool.join()
+		lar_df = pd.concat(shard_dfs, ignore_index=True)
+
+		merge_seq = seed_seqs[workers]
+		random.seed(int(merge_seq.generate_state(1)[0]))
+		rng = np.random.default_rng(merge_seq)
+		while lar_df.uli.duplicated().any():
+			lar_df = lar_df[~lar_df.uli.duplicated()]
+			print("replacing {count} rows with duplicate ULIs".format(count=row_count-len(lar_df)))
+			lar_df = pd.concat([lar_df, self.make_clean_batch(row_count-len(lar_df), rng=rng)], ignore_index=True)
+		return lar_df
@@ -0,0 +1,74 @@
+#This script compares the constraint repair loop applying every constraint to every failing row with the scheduled loop
+#applying only the constraints of each row's failed edits in dependency order.
+#Both loops clean copies of the same LAR rows, drawn field by field without the conditional sampler so that most rows fail edits.
+#It prints the constraint cycles found by the scheduler and the repair passes per row of each loop.
+#Run from the repository root: python 2024/python/constraint_benchmark.py [--rows 2000]
+
+import argparse
+import json
+import random
+import time
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from batch_generator import batch_lar_gen
+from geo_index import load_geo_index
+from lar_constraints import lar_data_constraints
+import lar_generator
+from rules_engine import rules_engine
+
+config_file = '2024/python/configurations/clean_file_config.yaml'
+bank_config = '2024/python/configurations/bank1_config.yaml'
+geo_config_file = '2024/python/configurations/geographic_data.yaml'
+lar_schema_file = "2024/schemas/lar_schema.json"
+ts_schema_file = "2024/schemas/ts_schema.json"
+
+parser = argparse.ArgumentParser(description="Compares repair passes per row with and without constraint scheduling.")
+parser.add_argument("--rows", type=int, default=2000, help="number of LAR rows repaired by each loop")
+parser.add_argument("--batch_size", type=int, default=500, help="rows validated and repaired together")
+parser.add_argument("--seed", type=int, default=0, help="seed for the generated rows and the constraints")
+parser.add_argument("--geo_config", default=geo_config_file, help="geographic data configuration YAML file")
+args = parser.parse_args()
+
+with open(config_file, 'r') as f:
+	lar_file_config_data = yaml.safe_load(f)
+
+with open(bank_config, 'r') as f:
+	bank_config_data = yaml.safe_load(f)
+lar_file_config_data["lei"]["value"] = bank_config_data["lei"]["value"]
+
+with open(args.geo_config, 'r') as f:
+	geo_config = yaml.safe_load(f)
+
+with open(geo_config["zip_code_file"], 'r') as f:
+	zip_codes = json.load(f)
+zip_codes.append("Exempt")
+
+geographic_data = load_geo_index(geo_config).geographic_data
+
+lar_gen = lar_generator.lar_gen(lar_schema_file=lar_schema_file, ts_schema_file=ts_schema_file)
+engine = rules_engine(config_data=lar_file_config_data, state_codes=geo_config["state_codes"], state_codes_rev=geo_config["state_codes_rev"],
+	geographic_data=geographic_data, full_lar_file_check=False, lar_schema_file=lar_schema_file, ts_schema_file=ts_schema_file)
+engine.load_ts_data(pd.DataFrame(lar_gen.make_ts_row(bank_file_config=bank_config_data), index=[0]))
+lar_constraints = lar_data_constraints(lar_file_config=lar_file_config_data, geographic_data=geographic_data, lar_schema_file=lar_schema_file)
+
+lar_df = lar_gen.make_rows(args.rows, lar_file_config=lar_file_config_data, geographic_data=geographic_data,
+	state_codes=geo_config["state_codes_rev"], zip_code_list=zip_codes, rng=np.random.default_rng(args.seed), conditional=False)
+lar_df = lar_df[~lar_df.uli.duplicated()].reset_index(drop=True)
+
+for scheduled in (False, True):
+	batch_gen = batch_lar_gen(lar_gen=lar_gen, rules_engine=engine, lar_constraints=lar_constraints, lar_file_config=lar_file_config_data,
+		geographic_data=geographic_data, state_codes=geo_config["state_codes_rev"], zip_code_list=zip_codes, scheduled=scheduled)
+	if scheduled:
+		scheduler = batch_gen.scheduler
+		print("{count} constraints, {cycles} cycles".format(count=len(scheduler.order), cycles=len(scheduler.cycles)))
+		for cycle in scheduler.cycles:
+			print("cycle:", ", ".join(cycle))
+	random.seed(args.seed)
+	start = time.time()
+	for batch_start in range(0, len(lar_df), args.batch_size):
+		batch_gen.clean_rows(lar_df.iloc[batch_start:batch_start+args.batch_size].reset_index(drop=True))
+	print("{label}: {seconds:.2f}s, {summary}".format(label="scheduled" if scheduled else "all constraints",
+		seconds=time.time()-start, summary=batch_gen.scheduler.summary()))
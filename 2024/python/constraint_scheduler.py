@@ -0,0 +1,246 @@
+#This file contains a scheduler for the lar_data_constraints repair functions.
+#The fields each constraint reads and writes are found from the row["field"] lookups in its source. Constraints are
+#ordered so that a constraint writing a field runs before the constraints reading it, and constraints that read and
+#write each other's fields in a loop are reported as cycles. Each repair pass applies only the constraints tied to the
+#edits a row still fails, and rows that return to an earlier state are detected as oscillating.
+
+import ast
+import heapq
+import inspect
+from collections import Counter, OrderedDict
+
+import pandas as pd
+
+def subscript_key(node):
+	"""Returns the string key of a subscript such as row["field"], or None if the key is not a string literal."""
+	key = node.slice
+	if isinstance(key, getattr(ast, "Index", ())): #Python 3.8 and earlier wrap the key in ast.Index
+		key = key.value
+	try:
+		key = ast.literal_eval(key)
+	except (ValueError, TypeError):
+		return None
+	return key if isinstance(key, str) else None
+
+def constraint_fields(lar_constraints):
+	"""
+	Returns a dictionary of constraint name to the sets of fields read and written by the constraint through
+	row["field"] lookups, found in the source of the class of lar_constraints.
+	"""
+	fields = {}
+	for func in ast.walk(ast.parse(inspect.getsource(type(lar_constraints)))):
+		if not isinstance(func, ast.FunctionDef):
+			continue
+		reads, writes = set(), set()
+		for node in ast.walk(func):
+			if isinstance(node, ast.Subscript) and isinstance(node.value, ast.Name) and node.value.id == "row":
+				field = subscript_key(node)
+				if field is None:
+					continue
+				if isinstance(node.ctx, ast.Store):
+					writes.add(field)
+				else:
+					reads.add(field)
+		fields[func.name] = (reads, writes)
+	return fields
+
+class constraint_scheduler(object):
+	"""
+	Applies lar_data_constraints functions to failing LAR rows in dependency order, choosing the constraints
+	from the edits each row fails.
+	Functions:
+	- order_constraints
+	- edit_constraints
+	- reset_telemetry
+	- repair_row
+	- repair
+	- finish_batch
+	- summary
+	"""
+	def __init__(self, lar_constraints, edit_registry, cycle_rounds=4):
+		"""
+		lar_constraints: lar_data_constraints object holding the constraint functions
+		edit_registry: edit_registry of the rules engine, used for the fields read by each edit
+		cycle_rounds: most times the constraints of a cycle are applied in one pass while they keep changing the row
+		"""
+		self.lar_constraints = lar_constraints
+		self.edit_registry = edit_registry
+		self.cycle_rounds = cycle_rounds
+		source_fields = constraint_fields(lar_constraints)
+		self.fields = OrderedDict((name, source_fields[name]) for name in lar_constraints.constraints)
+		if not any(reads or writes for reads, writes in self.fields.values()):
+			#without fields there are no dependencies and every row would fall back to full passes
+			raise ValueError("no row fields found in the source of the constraints of {cls}".format(cls=type(lar_constraints).__name__))
+		self.after = {name:set(reader for reader in self.fields if reader != name and self.fields[name][1] & self.fields[reader][0])
+			for name in self.fields} #constraint name to the constraints reading a field it writes
+		self.components = self.order_constraints()
+		self.order = [name for component in self.components for name in component]
+		self.cycles = [component for component in self.components if len(component) > 1]
+		self.position = {name:number for number, name in enumerate(self.order)}
+		self._edit_constraints = {}
+		self.reset_telemetry()
+
+	def reset_telemetry(self):
+		"""Clears the repair pass counts."""
+		self.passes = {} #row index label to the number of repair passes applied to the row in the current batch
+		self.states = {} #row index label to the set of row states seen before each pass in the current batch
+		self.pass_counts = Counter() #number of repair passes to the number of rows that needed them, over finished batches
+		self.oscillations = 0 #passes that started from a row state seen before
+		self.unsettled_cycles = 0 #cycles still changing the row after cycle_rounds rounds
+		self.full_passes = 0
+
+	def order_constraints(self):
+		"""
+		Returns the constraints grouped into strongly connected components, as lists of names in dependency order.
+		A constraint writing a field comes before the constraints reading it. A component of more than one constraint
+		is a cycle of constraints that read fields written by each other, its constraints keep their dir() order.
+		"""
+		names = list(self.fields)
+		number = {name:i for i, name in enumerate(names)}
+		after = self.after
+
+		#strongly connected components with Tarjan's algorithm, a component of more than one constraint is a cycle
+		index, low, stack, on_stack, components = {}, {}, [], set(), []
+		def connect(name):
+			index[name] = low[name] = len(index)
+			stack.append(name)
+			on_stack.add(name)
+			for later in after[name]:
+				if later not in index:
+					connect(later)
+					low[name] = min(low[name], low[later])
+				elif later in on_stack:
+					low[name] = min(low[name], index[later])
+			if low[name] == index[name]:
+				component = []
+				while True:
+					member = stack.pop()
+					on_stack.discard(member)
+					component.append(member)
+					if member == name:
+						break
+				components.append(sorted(component, key=number.get))
+		for name in names:
+			if name not in index:
+				connect(name)
+
+		#order the components by their dependencies, ties broken by dir() order
+		component_of = {name:c for c, component in enumerate(components) for name in component}
+		after_component = [set() for component in components]
+		for writer in names:
+			for reader in after[writer]:
+				if component_of[writer] != component_of[reader]:
+					after_component[component_of[writer]].add(component_of[reader])
+		waiting = [0] * len(components)
+		for later in after_component:
+			for c in later:
+				waiting[c] += 1
+		ready = [(number[components[c][0]], c) for c in range(len(components)) if waiting[c] == 0]
+		heapq.heapify(ready)
+		order = []
+		while ready:
+			c = heapq.heappop(ready)[1]
+			order.append(components[c])
+			for later in after_component[c]:
+				waiting[later] -= 1
+				if waiting[later] == 0:
+					heapq.heappush(ready, (number[components[later][0]], later))
+		return order
+
+	def edit_constraints(self, edit_name):
+		"""
+		Returns the constraints tied to an edit in dependency order: the constraint named for the edit, such as v628_3_const,
+		or for its edit number, such as v632_const for v632_2, and every constraint reading a field they may change.
+		Edits without a named constraint start from the constraints writing a field the edit reads.
+		"""
+		if edit_name not in self._edit_constraints:
+			names = [name for name in (edit_name+"_const", edit_name[:4]+"_const") if name in self.fields][:1]
+			if not names and edit_name in self.edit_registry:
+				fields = self.edit_registry[edit_name].fields
+				names = [name for name in self.fields if fields == "all" or self.fields[name][1].intersection(fields)]
+			#constraints downstream of a changed field are applied again so they are not left broken
+			selected = set(names)
+			while names:
+				names = [reader for name in names for reader in self.after[name] if reader not in selected]
+				selected.update(names)
+			self._edit_constraints[edit_name] = sorted(selected, key=self.position.get)
+		return self._edit_constraints[edit_name]
+
+	def _apply(self, row, names):
+		for name in names:
+			row = getattr(self.lar_constraints, name)(row)
+		return row
+
+	def _apply_scheduled(self, row, names):
+		"""Applies the constraints in the set names component by component, repeating the constraints of a cycle until the row settles."""
+		for component in self.components:
+			selected = [name for name in component if name in names]
+			if len(selected) == 1:
+				row = self._apply(row, selected)
+			elif selected:
+				for rounds in range(self.cycle_rounds):
+					state = tuple(row.values())
+					row = self._apply(row, selected)
+					if tuple(row.values()) == state:
+						break
+				else:
+					self.unsettled_cycles += 1
+		return row
+
+	def repair_row(self, label, row, failed_edits=None):
+		"""
+		Applies one repair pass to a row and returns it.
+		label: index label of the row, used to count passes and to detect oscillation
+		row: OrderedDict of field name to value
+		failed_edits: names of the edits the row failed, all constraints are applied in dir() order if None
+		A row that returns to a state seen before a previous pass, or that is not changed by its constraints,
+		gets all constraints in dir() order for this pass.
+		"""
+		self.passes[label] = self.passes.get(label, 0) + 1
+		state = tuple(row.values())
+		seen = self.states.setdefault(label, set())
+		if state in seen:
+			self.oscillations += 1
+		else:
+			seen.add(state)
+			if failed_edits is not None:
+				row = self._apply_scheduled(row, set(name for edit_name in failed_edits for name in self.edit_constraints(edit_name)))
+				if tuple(row.values()) != state:
+					return row
+		self.full_passes += 1
+		return self._apply(row, self.lar_constraints.constraints)
+
+	def repair(self, lar_df, index, failed_edits=None):
+		"""
+		Applies one repair pass to the rows of lar_df at index. lar_df is modified in place.
+		failed_edits: list with the names of the failed edits of each row in index, all constraints are applied if None
+		"""
+		columns = list(lar_df.columns)
+		if failed_edits is None:
+			failed_edits = [None] * len(index)
+		rows = []
+		for label, values, edit_names in zip(index, lar_df.loc[index].itertuples(index=False, name=None), failed_edits):
+			rows.append(self.repair_row(label, OrderedDict(zip(columns, values)), edit_names))
+		lar_df.loc[index] = pd.DataFrame(rows, index=index, columns=columns)
+
+	def finish_batch(self, rows):
+		"""
+		Adds the pass counts of the current batch to the totals and clears the row states, as the next batch reuses index labels.
+		rows: number of rows in the batch, rows that passed without repair are counted with zero passes
+		"""
+		self.pass_counts.update(self.passes.values())
+		self.pass_counts[0] += rows - len(self.passes)
+		self.passes = {}
+		self.states = {}
+
+	def summary(self):
+		"""Returns a line describing the repair passes per row over the finished batches."""
+		counts = self.pass_counts
+		total = sum(counts.values())
+		if not total:
+			return "no rows checked"
+		mean = sum(passes * count for passes, count in counts.items()) / total
+		histogram = ", ".join("{passes}: {count}".format(passes=passes, count=counts[passes]) for passes in sorted(counts))
+		return ("repair passes per row: mean {mean:.2f}, max {max}, rows by passes {histogram}; {full} full passes, {osc} oscillations, "
+			"{unsettled} unsettled cycles").format(mean=mean, max=max(counts), histogram=histogram, full=self.full_passes,
+			osc=self.oscillations, unsettled=self.unsettled_cycles)
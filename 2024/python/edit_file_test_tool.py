@@ -14,6 +14,7 @@ import pandas as pd
 import yaml
 
 #Edit report configurations are located in configurations/edit_report_config.yaml
+from edit_report_cache import edit_report_cache
 import lar_generator
 from rules_engine import rules_engine
 
@@ -98,6 +99,8 @@ rules_engine = rules_engine(config_data=lar_file_config_data, state_codes=geo_co
 
 #set location for edit report CSV writing
 edit_report_path = filepaths["edit_report_output_filepath"] 
+#reports of files that have not changed since the last run are read from the cache
+report_cache = edit_report_cache(rules_engine, cache_dir=filepaths["edit_report_cache_filepath"])
 
 #get paths to check for clean files (by bank name) 
 #store as list to match edit files format
@@ -140,23 +143,31 @@ def get_file_names(filepaths):
     print(len(file_names), "files found in {filepaths}".format(filepaths=filepaths))
     return file_names
 
+def check_file(file, edits_list):
+    """Checks a file with the edit types in edits_list and returns the edit report DataFrame."""
+    rules_engine.reset_results() #clear previous edit report results
+    ts_df, lar_df = rules_engine.split_ts_row(file) #split TS row from LAR data for dataframe usage
+    #load current file data to rules engine to create edit report
+    rules_engine.load_ts_data(ts_df)
+    rules_engine.load_lar_data(lar_df)
+    #generate edit report
+    return rules_engine.create_edit_report(edits_list)
+
 def generate_edit_report(file_list, save_name, edits_list=["s","v","q","m"], save_path=edit_report_path, 
-                         save_report=True):
+                         save_report=True, use_cache=True):
     """
     file_list: list of files to check against rules engine
     edits_list: list of edit types to check options are s, v, q, m
+    use_cache: read reports of unchanged files from report_cache instead of checking them again
     """
     #set up data frame seed for edit report to use as a base for concatenation
     report_df = pd.DataFrame([], columns=['file_name', 'edit_name', 'row_type', 'field', 'fail_count', 'failed_rows', "file_edit_name"], index=[0])
     for file in file_list: #iterate over clean test files and create report results for each
-        rules_engine.reset_results() #clear previous edit report results
         #print(file) #display current working file
-        ts_df, lar_df = rules_engine.split_ts_row(file) #split TS row from LAR data for dataframe usage
-        #load current file data to rules engine to create edit report
-        rules_engine.load_ts_data(ts_df)
-        rules_engine.load_lar_data(lar_df)
-        #generate edit report
-        new_results_df = rules_engine.create_edit_report(edits_list)
+        if use_cache:
+            new_results_df = report_cache.edit_report(file, edits_list, lambda: check_file(file, edits_list))
+        else:
+            new_results_df = check_file(file, edits_list)
         new_results_df["file_name"] = file #label file_name in report
         new_results_df["file_edit_name"] = new_results_df.file_name.apply(lambda x: x.split("/")[-1].split("_")[-1].replace(".txt",""))
         report_df = pd.concat([report_df, new_results_df])
@@ -0,0 +1,179 @@
+#This script checks that a baseline version of the rules engine and the current version fail the same rows for every edit.
+#The baseline rules_engine.py is read from a git revision or a file and both engines are run on the same TS and LAR data.
+#Data is read from HMDA files passed on the command line. If no files are passed, LAR rows are generated with lar_gen
+#and a share of their values are replaced with NA, Exempt, blank, out of range and malformed entries so that edits fail.
+#Edits that raise an error in the baseline are reported but not compared.
+#Run from the repository root: python 2024/python/edit_parity_check.py --baseline_rev HEAD~1 [data files]
+
+import argparse
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from geo_index import load_geo_index
+import lar_generator
+import rules_engine
+
+config_file = '2024/python/configurations/clean_file_config.yaml'
+bank_config = '2024/python/configurations/bank1_config.yaml'
+geo_config_file = '2024/python/configurations/geographic_data.yaml'
+lar_schema_file = "2024/schemas/lar_schema.json"
+ts_schema_file = "2024/schemas/ts_schema.json"
+rules_engine_path = "2024/python/rules_engine.py"
+
+#values written over generated LAR values, chosen to reach the NA/Exempt/blank and number checks in the edits
+edge_values = np.array(["NA", "Exempt", "", "0", "-1", "0.25", "1.5", "1.2.3", "abc", "8888", "1111", "7777", "17", "62",
+	"250", "901", "1000000", "99999999", "20240230", "20241301", "2024010"], dtype=object)
+#whole numbers only, edits that convert values with int() raise an error in the baseline for the other edge values
+whole_number_values = np.array(["0", "1", "4", "5", "17", "62", "101", "250", "8888", "100000", "637001", "1050001",
+	"2000000", "10000000"], dtype=object)
+
+parser = argparse.ArgumentParser(description="Compares the rows failed by each edit in two versions of the rules engine.")
+parser.add_argument("data_files", nargs="*", help="pipe delimited HMDA files with a TS row followed by LAR rows")
+parser.add_argument("--baseline_rev", default="HEAD", help="git revision of the baseline rules_engine.py")
+parser.add_argument("--baseline_file", default=None, help="path to a baseline rules_engine.py, used instead of --baseline_rev")
+parser.add_argument("--rows", type=int, default=5000, help="number of LAR rows generated when no data files are passed")
+parser.add_argument("--mutation_rate", type=float, default=0.05, help="share of generated LAR values replaced with edge values")
+parser.add_argument("--seed", type=int, default=0, help="seed for generated rows and mutations")
+parser.add_argument("--bank_config", default=bank_config, help="bank configuration YAML file used for the generated TS row")
+parser.add_argument("--geo_config", default=geo_config_file, help="geographic data configuration YAML file")
+args = parser.parse_args()
+
+def load_baseline(baseline_file=None, baseline_rev="HEAD"):
+	"""Imports the rules_engine module from baseline_file, or from rules_engine.py at a git revision, and returns it."""
+	temp_file = None
+	if baseline_file is None:
+		source = subprocess.check_output(["git", "show", "{rev}:{path}".format(rev=baseline_rev, path=rules_engine_path)])
+		handle, temp_file = tempfile.mkstemp(suffix="_rules_engine.py")
+		with os.fdopen(handle, "wb") as f:
+			f.write(source)
+	spec = importlib.util.spec_from_file_location("baseline_rules_engine", baseline_file or temp_file)
+	module = importlib.util.module_from_spec(spec)
+	spec.loader.exec_module(module)
+	if temp_file is not None:
+		os.remove(temp_file)
+	return module
+
+def mutate_rows(lar_df, rate, rng, values=edge_values):
+	"""
+	Returns a copy of lar_df with a share of values replaced by values from values or by values of the same field in other rows.
+	ULIs are not changed as they identify failed rows.
+	"""
+	lar_df = lar_df.copy()
+	for field in lar_df.columns:
+		if field == "uli":
+			continue
+		mutated = rng.random(len(lar_df)) < rate
+		count = int(mutated.sum())
+		#half of the replaced values are from values, half are values of the field in other rows
+		replacements = np.where(rng.random(count) < 0.5, values[rng.integers(0, len(values), count)],
+			lar_df[field].to_numpy(dtype=object)[rng.integers(0, len(lar_df), count)])
+		lar_df.loc[mutated, field] = replacements
+	return lar_df
+
+def run_edit(engine, name):
+	"""Runs one edit and returns its sorted failed rows, or the error type if the edit raised an error."""
+	engine.reset_results()
+	try:
+		getattr(engine, name)()
+	except Exception as e:
+		return "error: " + type(e).__name__
+	#baselines from before the edit_results store keep results as a list of dictionaries
+	records = engine.results.records() if hasattr(engine.results, "records") else engine.results
+	return sorted(row for result in records for row in result["failed_rows"])
+
+def compare_edits(engines, ts_df, lar_df, label):
+	"""
+	Runs every edit of the current engine on both engines and prints the edits with different failed rows.
+	Returns a dictionary of counts of matching, differing and baseline error edits.
+	"""
+	baseline, current = engines
+	for engine in engines:
+		#edits may change the loaded data so each engine gets its own copy
+		engine.load_ts_data(ts_df.copy())
+		engine.load_lar_data(lar_df.copy())
+	counts = {"match": 0, "differ": 0, "baseline error": 0}
+	seconds = [0.0, 0.0]
+	for name in current.edit_registry:
+		if not hasattr(baseline, name):
+			print("{label} {name}: not in baseline".format(label=label, name=name))
+			continue
+		start = time.time()
+		baseline_rows = run_edit(baseline, name)
+		seconds[0] += time.time() - start
+		start = time.time()
+		current_rows = run_edit(current, name)
+		seconds[1] += time.time() - start
+		if isinstance(baseline_rows, str):
+			counts["baseline error"] += 1
+			print("{label} {name}: baseline {error}, current fails {count} rows".format(label=label, name=name,
+				error=baseline_rows, count=len(current_rows) if isinstance(current_rows, list) else current_rows))
+		elif baseline_rows == current_rows:
+			counts["match"] += 1
+		else:
+			counts["differ"] += 1
+			if isinstance(current_rows, str):
+				print("{label} {name}: current {error}".format(label=label, name=name, error=current_rows))
+			else:
+				print("{label} {name}: baseline fails {base} rows, current fails {cur} rows, {diff} rows differ".format(
+					label=label, name=name, base=len(baseline_rows), cur=len(current_rows),
+					diff=len(set(baseline_rows).symmetric_difference(current_rows))))
+	print("{label}: {match} edits match, {differ} differ, {error} baseline errors, baseline {base:.2f}s, current {cur:.2f}s".format(
+		label=label, match=counts["match"], differ=counts["differ"], error=counts["baseline error"],
+		base=seconds[0], cur=seconds[1]))
+	return counts
+
+with open(config_file, 'r') as f:
+	lar_file_config_data = yaml.safe_load(f)
+
+with open(args.bank_config, 'r') as f:
+	bank_config_data = yaml.safe_load(f)
+
+with open(args.geo_config, 'r') as f:
+	geo_config = yaml.safe_load(f)
+
+with open(geo_config["zip_code_file"], 'r') as f:
+	zip_codes = json.load(f)
+zip_codes.append("Exempt")
+
+geographic_data = load_geo_index(geo_config).geographic_data
+
+baseline_module = load_baseline(baseline_file=args.baseline_file, baseline_rev=args.baseline_rev)
+engines = [module.rules_engine(config_data=lar_file_config_data, state_codes=geo_config["state_codes"],
+	state_codes_rev=geo_config["state_codes_rev"], geographic_data=geographic_data,
+	lar_schema_file=lar_schema_file, ts_schema_file=ts_schema_file) for module in (baseline_module, rules_engine)]
+
+data_sets = []
+if args.data_files:
+	for data_file in args.data_files:
+		ts_df, lar_df = engines[1].split_ts_row(data_file, load=False)
+		data_sets.append((data_file, ts_df, lar_df))
+else:
+	print("generating {rows} LAR rows".format(rows=args.rows))
+	rng = np.random.default_rng(args.seed)
+	lar_gen = lar_generator.lar_gen(lar_schema_file=lar_schema_file, ts_schema_file=ts_schema_file)
+	ts_df = pd.DataFrame(lar_gen.make_ts_row(bank_config_data), index=[0])
+	#independent draws fail many edits so both engines report fails for most edits
+	lar_df = lar_gen.make_rows(args.rows, lar_file_config=lar_file_config_data, geographic_data=geographic_data,
+		state_codes=geo_config["state_codes_rev"], zip_code_list=zip_codes, rng=rng, conditional=False)
+	lar_df = lar_df[~lar_df.uli.duplicated()].reset_index(drop=True)
+	data_sets.append(("generated", ts_df, lar_df))
+	data_sets.append(("mutated", ts_df, mutate_rows(lar_df, args.mutation_rate, rng)))
+	data_sets.append(("whole numbers", ts_df, mutate_rows(lar_df, args.mutation_rate, rng, values=whole_number_values)))
+
+differ = 0
+for label, ts_df, lar_df in data_sets:
+	differ += compare_edits(engines, ts_df, lar_df, label)["differ"]
+
+if differ:
+	print("{count} edit results differ from the baseline".format(count=differ))
+	sys.exit(1)
+print("all compared edit results match the baseline")
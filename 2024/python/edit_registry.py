@@ -0,0 +1,35 @@
+#This file contains the decorators used to register edit functions in the rules engine.
+#Edits are collected once when the class is defined so that callers do not need to search dir() for edit names.
+
+from collections import OrderedDict, namedtuple
+
+#metadata stored for each registered edit
+#name: function name, category: s, v, q, or m, row_type: LAR, TS, TS/LAR or macro, fields: data fields read by the edit or "all"
+#file_level: True if the result for a row depends on other rows of the file
+edit_info = namedtuple("edit_info", ["name", "category", "row_type", "fields", "file_level"])
+
+def edit(row_type="LAR", fields=(), file_level=False):
+	"""
+	Marks a function as an edit. The category is the first letter of the function name.
+	row_type: the record type checked by the edit, macro edits use "macro"
+	fields: the data fields read by the edit, "all" for edits that compare whole rows
+	file_level: True for edits that compare rows with each other, such as duplicate checks.
+		Macro edits and edits that are not LAR edits are always checked on the whole file.
+	"""
+	if fields != "all":
+		fields = tuple(fields)
+	def mark(func):
+		func.edit_info = edit_info(name=func.__name__, category=func.__name__[:1], row_type=row_type, fields=fields,
+			file_level=file_level or func.__name__[:1] == "m" or row_type != "LAR")
+		return func
+	return mark
+
+def register_edits(cls):
+	"""Class decorator that stores the marked edit functions of cls in cls.edit_registry, ordered by edit name."""
+	registry = OrderedDict()
+	for name in sorted(vars(cls)):
+		info = getattr(vars(cls)[name], "edit_info", None)
+		if info is not None:
+			registry[name] = info
+	cls.edit_registry = registry
+	return cls
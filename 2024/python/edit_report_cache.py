@@ -0,0 +1,99 @@
+#This file contains an on-disk cache of edit reports for HMDA files.
+#The report of each file is stored in a pickle named by a hash of the file contents, the activity year,
+#a version hash of the rules engine and its inputs, the edits that were run and the mode used to run them.
+#Reports for files that have not changed since the last run are read from the cache instead of checking the file again.
+
+import hashlib
+import json
+import os
+import sys
+
+import pandas as pd
+
+from geo_index import file_hash
+
+#modules whose source decides edit results, hashed with the rules engine module into the engine version
+engine_modules = ["edit_registry.py", "edit_results.py", "lar_columns.py", "macro_aggregates.py", "schema_index.py",
+	"geo_index.py", "utils.py"]
+
+def engine_version(rules_engine):
+	"""
+	Returns a hash of the rules engine source and the data it was set up with: the configuration, the LAR and TS schemas,
+	the census data, the state codes and the full file check setting. Changing any of these makes new cache keys.
+	"""
+	digest = hashlib.sha1()
+	module_dir = os.path.dirname(os.path.abspath(__file__))
+	source_files = [sys.modules[type(rules_engine).__module__].__file__] + [os.path.join(module_dir, module) for module in engine_modules]
+	for source_file in source_files:
+		digest.update(file_hash(source_file).encode("utf-8"))
+	digest.update(json.dumps(rules_engine.config_data, sort_keys=True, default=str).encode("utf-8"))
+	digest.update(rules_engine.lar_schema_df.to_json().encode("utf-8"))
+	digest.update(rules_engine.ts_schema_df.to_json().encode("utf-8"))
+	digest.update(str(int(pd.util.hash_pandas_object(rules_engine.geographic_data, index=False).sum())).encode("utf-8"))
+	digest.update(json.dumps(rules_engine.state_codes, sort_keys=True, default=str).encode("utf-8"))
+	digest.update(json.dumps(rules_engine.state_codes_rev, sort_keys=True, default=str).encode("utf-8"))
+	digest.update(str(rules_engine.full_lar_file_check).encode("utf-8"))
+	return digest.hexdigest()
+
+class edit_report_cache(object):
+	"""
+	Stores edit reports on disk keyed by file contents, year, rules engine version, edit list and run mode.
+	Functions:
+	- key
+	- get
+	- put
+	- edit_report
+	"""
+	def __init__(self, rules_engine, cache_dir):
+		"""
+		rules_engine: rules_engine object used to create the reports, its version is part of every key
+		cache_dir: directory for the cached reports
+		"""
+		self.cache_dir = cache_dir
+		self.year = str(rules_engine.config_data["activity_year"]["value"])
+		self.version = engine_version(rules_engine)
+		self.hits = 0
+		self.misses = 0
+
+	def key(self, data_file, edits_list, mode=""):
+		"""
+		Returns the cache key of the report of data_file for the edits or edit categories in edits_list.
+		mode: description of how the report is made, such as the reader and worker count, reports of each mode are kept apart
+		"""
+		return hashlib.sha1("{hash}|{year}|{version}|{edits}|{mode}".format(hash=file_hash(data_file), year=self.year,
+			version=self.version, edits=",".join(edits_list), mode=mode).encode("utf-8")).hexdigest()
+
+	def _cache_file(self, key):
+		return os.path.join(self.cache_dir, "edit_report_{key}.pkl".format(key=key))
+
+	def get(self, key):
+		"""Returns the cached report DataFrame for a key, or None if it is not cached."""
+		cache_file = self._cache_file(key)
+		if os.path.exists(cache_file):
+			return pd.read_pickle(cache_file)
+		return None
+
+	def put(self, key, report_df):
+		"""Stores a report DataFrame under a key."""
+		if not os.path.exists(self.cache_dir):
+			os.makedirs(self.cache_dir)
+		cache_file = self._cache_file(key)
+		temp_file = cache_file + ".{pid}.tmp".format(pid=os.getpid())
+		report_df.to_pickle(temp_file)
+		os.replace(temp_file, cache_file) #concurrent runs never read a partial cache file
+
+	def edit_report(self, data_file, edits_list, run, mode=""):
+		"""
+		Returns the report of data_file for edits_list from the cache, or calls run to create it and stores the result.
+		run: function with no arguments that checks data_file and returns the report DataFrame
+		mode: description of how run checks the file, passed to key
+		"""
+		key = self.key(data_file, edits_list, mode=mode)
+		report_df = self.get(key)
+		if report_df is not None:
+			self.hits += 1
+			return report_df
+		self.misses += 1
+		report_df = run()
+		self.put(key, report_df)
+		return report_df
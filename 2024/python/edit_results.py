@@ -0,0 +1,145 @@
+#This file contains the store for edit results produced by the rules engine.
+#The result of a LAR edit is kept as a bit-packed row of fail flags over the loaded LAR rows instead of a list of ULIs,
+#so edit reports for large files do not hold a Python string list per edit. ULI lists are only built when asked for.
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+#the result of one edit
+#rows: array of the ULIs of the LAR rows checked, shared by the results for the same data, None for TS results
+#bits: fail flags over rows packed with np.packbits, None for TS results
+edit_result = namedtuple("edit_result", ["edit_name", "row_type", "field", "fail_count", "rows", "bits"])
+
+#columns of the edit report DataFrame
+report_columns = ["edit_name", "row_type", "field", "fail_count", "failed_rows"]
+
+class edit_results(object):
+	"""
+	Edit results stored as a bit-packed fail matrix with one row per LAR edit result and one column per LAR row.
+	Results of TS edits keep only their fail count.
+	Results for different loaded data sets can be kept together. Row queries use the rows of the most recent
+	LAR result unless rows are passed.
+	Functions:
+	- add
+	- extend
+	- entries
+	- fail_counts
+	- failed_mask
+	- failed_ulis
+	- failing_mask
+	- failing_ulis
+	- failed_edits_by_row
+	- records
+	- report_df
+	"""
+	def __init__(self):
+		self.results = []
+		self._positions = {} #edit name to the position of its latest result
+
+	def __len__(self):
+		return len(self.results)
+
+	def add(self, edit_name, field, row_type, fail_count, rows=None, fail_mask=None):
+		"""
+		Adds the result of one edit.
+		rows: array of the ULIs of the LAR rows checked
+		fail_mask: boolean array over rows marking the failed rows, None for TS results
+		"""
+		bits = None if fail_mask is None else np.packbits(fail_mask)
+		self.extend([edit_result(edit_name=edit_name, row_type=row_type, field=field, fail_count=fail_count, rows=rows, bits=bits)])
+
+	def extend(self, results):
+		"""Adds a list of edit_result tuples, such as those returned by entries."""
+		for result in results:
+			self._positions[result.edit_name] = len(self.results)
+			self.results.append(result)
+
+	def entries(self, start=0, stop=None):
+		"""Returns the edit_result tuples from position start to stop."""
+		return self.results[start:stop]
+
+	def _mask(self, result):
+		"""Returns the unpacked fail flags of a LAR result."""
+		return np.unpackbits(result.bits, count=len(result.rows)).astype(bool)
+
+	def _select(self, categories=None, row_types=("LAR",)):
+		"""Returns the results with a fail matrix row for edits in categories, all categories if None."""
+		return [result for result in self.results if result.bits is not None and result.row_type in row_types
+			and (categories is None or result.edit_name[:1] in categories)]
+
+	def fail_counts(self):
+		"""Returns a DataFrame of the edit name, row type, field and fail count of each result."""
+		return pd.DataFrame([result[:4] for result in self.results], columns=report_columns[:4])
+
+	def failed_mask(self, edit_name):
+		"""Returns a boolean array over the checked rows marking the rows failed by the latest result of edit_name."""
+		result = self.results[self._positions[edit_name]]
+		if result.bits is None:
+			raise ValueError("{edit} is not a LAR edit result".format(edit=edit_name))
+		return self._mask(result)
+
+	def failed_ulis(self, edit_name):
+		"""Returns the ULIs of the rows failed by the latest result of edit_name, ["ts"] for a failed TS edit."""
+		result = self.results[self._positions[edit_name]]
+		if result.bits is None:
+			return ["ts"] if result.fail_count > 0 else []
+		return list(result.rows[self._mask(result)])
+
+	def failing_mask(self, categories=None, row_types=("LAR",), rows=None):
+		"""
+		Returns a boolean array over rows marking the rows that failed any edit in categories.
+		rows: ULI array of the checked data, defaults to the rows of the most recent LAR result
+		"""
+		selected = self._select(categories=categories, row_types=row_types)
+		if rows is None:
+			if not selected:
+				return np.zeros(0, dtype=bool)
+			rows = selected[-1].rows
+		bits = [result.bits for result in selected if result.rows is rows]
+		if not bits:
+			return np.zeros(len(rows), dtype=bool)
+		return np.unpackbits(np.bitwise_or.reduce(np.vstack(bits), axis=0), count=len(rows)).astype(bool)
+
+	def failing_ulis(self, categories=None, row_types=("LAR",)):
+		"""Returns the set of ULIs of rows that failed any edit in categories, across all checked data sets."""
+		ulis = set()
+		data_sets = {id(result.rows):result.rows for result in self._select(categories=categories, row_types=row_types)}
+		for rows in data_sets.values():
+			ulis.update(rows[self.failing_mask(categories=categories, row_types=row_types, rows=rows)])
+		return ulis
+
+	def failed_edits_by_row(self, categories=None, row_types=("LAR",), rows=None):
+		"""
+		Returns a list with one entry per row of the names of the edits in categories that the row failed.
+		rows: ULI array of the checked data, defaults to the rows of the most recent LAR result
+		"""
+		selected = self._select(categories=categories, row_types=row_types)
+		if rows is None:
+			if not selected:
+				return []
+			rows = selected[-1].rows
+		selected = [result for result in selected if result.rows is rows]
+		failed = [[] for row in range(len(rows))]
+		for result in selected:
+			if result.fail_count:
+				for position in np.flatnonzero(self._mask(result)):
+					failed[position].append(result.edit_name)
+		return failed
+
+	def records(self, start=0, stop=None):
+		"""Returns results from position start to stop as dictionaries with a failed_rows list of ULIs."""
+		records = []
+		for result in self.results[start:stop]:
+			if result.bits is None:
+				failed_rows = ["ts"] if result.fail_count > 0 else []
+			else:
+				failed_rows = list(result.rows[self._mask(result)])
+			records.append({"edit_name": result.edit_name, "row_type": result.row_type, "field": result.field,
+				"fail_count": result.fail_count, "failed_rows": failed_rows})
+		return records
+
+	def report_df(self):
+		"""Returns the edit report as a DataFrame with one row per result and the failed ULIs of each result."""
+		return pd.DataFrame(self.records(), columns=report_columns)
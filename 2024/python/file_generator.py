@@ -7,6 +7,7 @@ import pandas as pd
 import numpy as np
 import yaml
 
+from geo_index import load_geo_index
 import lar_constraints
 import lar_generator
 from rules_engine import rules_engine
@@ -30,9 +31,6 @@ class FileGenerator(object):
 			# Uses safe_load instead of load.
 			self.geographic = yaml.safe_load(f) 
 
-		with open(self.geographic["geographic_data_file"]) as f:
-			self.geo_data = yaml.safe_load(f)
-
 		#Loads the clean file configuration. 
 		with open(clean_file_config) as f:
 			# Uses safe_load instead of load.
@@ -58,13 +56,10 @@ class FileGenerator(object):
 		#Loads geographic geographic data from filepaths named in the test_filepaths
 		#yaml file. 
 		print("loading geo data to file generator")
-		self.geographic_data = pd.read_csv(self.geographic['geographic_data_file'], delimiter='|', header=None, 
-			names=self.geographic['file_columns'], dtype=object)
-		#create 5 digit County Codes from 2 digit state and 3 digit county
-		self.geographic_data['county_fips'] = self.geographic_data.apply(lambda x: str(x.state_code) + str(x.county), axis=1)
-		#create 11 digit Census Tract codes from 5 digit county and 6 digit tract
-		self.geographic_data["tract_fips"] = self.geographic_data.apply(lambda x: str(x.county_fips) + str(x.tracts), axis=1)
-		self.small_counties = list(self.geographic_data.county_fips[self.geographic_data.small_county=="S"])
+		#County and tract codes are built when the census file is indexed, the index is cached by file hash.
+		self.geo_index = load_geo_index(self.geographic, header=None)
+		self.geographic_data = self.geo_index.geographic_data
+		self.small_counties = sorted(self.geo_index.small_counties) #same small county flags as the rules engine
 		print("geo data loaded to file generator")
 		#Loads schemas for LAR and TS.
 		#Schemas contain valid enumerations, including NA values, for each field in the dataset. 
@@ -114,12 +109,11 @@ class FileGenerator(object):
 		self.lar_validator.load_ts_data(ts_data)
 
 		#Runs the edits against the LAR row and produces edit check results. 
-		for func in dir(self.lar_validator):
-			if func[:1] in ("s", "v") and func[1:4].isdigit()==True:
-				getattr(self.lar_validator, func)(row)
+		for edit_func in self.lar_validator.edits(categories=("s", "v")):
+			edit_func()
 		
 		#Returns edit check results. 
-		return self.lar_validator.results
+		return self.lar_validator.results.report_df()
 
 	def make_clean_lar_row(self, ts_row):
 		"""Uses the lar_gen object and a TS row to create a LAR row that 
@@ -292,20 +286,15 @@ class FileGenerator(object):
 
 			#Produces a report as to which syntax or validity
 			#edits have passed or failed based on logic in the rules_engine.
-			for func in dir(checker):
-				if func[:1] in ("s", "v") and func[1:4].isdigit()==True:
-					getattr(checker, func)()
+			for edit_func in checker.edits(categories=("s", "v")):
+				edit_func()
 			
-			#Creates a results dataframe and keeps the results that 
-			#have failed. 
-			report_df = pd.DataFrame(checker.results)
-			report_df = report_df[(report_df['status']=='failed')]
-
-			# The function ignores TS edits and drops results related
-			# to edit fails from the TS.  
-			report_df = report_df[report_df['row_ids'] != 'TS']
+			#Stores the ULI's of rows that failed syntax or validity edits.
+			#The function ignores TS edits and drops results related
+			#to edit fails from the TS.  
+			unique_uli_list = checker.results.failing_ulis(categories=("s", "v"))
 
-			if len(report_df) == 0:
+			if len(unique_uli_list) == 0:
 				#If there are no syntax or validity edits
 				#the data is written to a new directory for quality 
 				#test files that pass syntax and validity edits. 
@@ -319,42 +308,9 @@ class FileGenerator(object):
 			#The case if there are rows that failed syntax or validity edits.
 			
 			else: 
-				#Creates an empty list for storing row numbers
-				#where edits have failed. 
-				uli_list = []
-
-				#Iterates through each row and appends the list of ULI's
-				#of rows where syntax or validity edits have failed. 
-				for index, row in report_df.iterrows():
-					uli_list.append(row.row_ids)
-
-				#Drops not-a-numbers from the ULI list. 
-				if np.nan in uli_list:
-					uli_list.remove(np.nan)
-
-				#Creates a new list to store the ULI's without nested brackets. 
-				new_list = []
-				for i in range(len(uli_list)):
-					for n in range(len(uli_list[i])):
-						new_list.append(uli_list[i][n])
-
-				#Creates a list that removes ULI's that are repeated. 
-				unique_uli_list = []
-				for i in new_list:
-					if i not in unique_uli_list:
-						unique_uli_list.append(i)
-
-				#Creates a list of row numbers corresponding to the
-				#ULI's that have failed syntax or validity edits. 
-				bad_rows = []
-				for index, row in lar_df.iterrows():
-					if row['uli'] in unique_uli_list:
-						failed_uli = row['uli']
-						bad_rows.append(lar_df[lar_df['uli']==failed_uli].index.values.astype(int)[0])
-
 				#Drops all rows that failed syntax or validity edits
 				#from the original LAR dataframe. 
-				lar_df = lar_df.drop(bad_rows)
+				lar_df = lar_df[~lar_df.uli.isin(unique_uli_list)]
 
 				#Creates new lar rows to the original length of the file
 				#using the utils new lar rows function. 
@@ -404,12 +360,11 @@ class FileGenerator(object):
 
 		#Applies each function in the rules engine that checks for edits
 		#and creates a results list of edits failed or passed. 
-		for func in dir(checker):
-			if func[:1] in ("s", "v", "q") and func[1:4].isdigit()==True:
-				getattr(checker, func)()
+		for edit_func in checker.edits(categories=("s", "v", "q")):
+			edit_func()
 
 		#Creates a dataframe of results from the checker. 
-		report_df = pd.DataFrame(checker.results)
+		report_df = checker.results.report_df()
 
 		#Writes the report to the filepath and name designated in 
 		#the test_fielpaths yaml
@@ -456,27 +411,21 @@ class FileGenerator(object):
 
 		checker.load_data_frames(ts_df, lar_df)
 
-		for func in dir(checker):
-			if func[:1] in ("s", "v") and func[1:4].isdigit()==True:
-				getattr(checker, func)()
+		for edit_func in checker.edits(categories=("s", "v")):
+			edit_func()
 
 	
 		#Produces a report as to which syntax or validity
 		#edits have passed or failed based on logic in the rules_engine.
-		for func in dir(checker):
-			if func[:1] in ("s", "v") and func[1:4].isdigit()==True:
-				getattr(checker, func)()
+		for edit_func in checker.edits(categories=("s", "v")):
+			edit_func()
 		
-		#Creates a results dataframe and keeps the results that 
-		#have failed. 
-		report_df = pd.DataFrame(checker.results)
-		report_df = report_df[(report_df['status']=='failed')].copy()
+		#Stores the ULI's of rows that failed syntax or validity edits.
+		#The function ignores TS edits and drops results related
+		#to edit fails from the TS.  
+		unique_uli_list = checker.results.failing_ulis(categories=("s", "v"))
 
-		# The function ignores TS edits and drops results related
-		# to edit fails from the TS.  
-		report_df = report_df[report_df['row_ids'] != 'TS']
-
-		if len(report_df) == 0:
+		if len(unique_uli_list) == 0:
 			#If there are no syntax or validity edits
 			#the data is written to a new directory for quality 
 			#test files that pass syntax and validity edits. 
@@ -487,21 +436,6 @@ class FileGenerator(object):
 		#The case if there are rows that failed syntax or validity edits.
 		
 		else: 
-			#Creates a list of ULI's corresponding to rows where 
-			#syntax or validity edits have failed. 
-
-			#The resulting list is a list of lists, a list of ulis failed for each
-			#edit failed. 
-			uli_list = list(report_df.row_ids)
-
-			#Converts the list of lists to a single list.
-			single_uli_list = []
-			for i in uli_list:
-				single_uli_list = single_uli_list + i
-
-			#Creates a list that removes ULI's that are repeated. 
-			unique_uli_list = set(single_uli_list)
-
 			#Drops rows in the data containing syntax or validity edits.
 			lar_df = lar_df[lar_df.uli.isin(unique_uli_list)].copy()
 
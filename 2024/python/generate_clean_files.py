@@ -1,11 +1,13 @@
+import argparse
 import json
 import logging
 import os
-import sys
 
 import pandas as pd
 import yaml
 
+from batch_generator import batch_lar_gen
+from geo_index import load_geo_index
 from lar_constraints import lar_data_constraints
 import lar_generator
 from rules_engine import rules_engine
@@ -16,8 +18,12 @@ import utils
 config_file = '2024/python/configurations/clean_file_config.yaml'
 bank_config = '2024/python/configurations/bank1_config.yaml'
 
-if len(sys.argv) == 2:
-	bank_config = sys.argv[1]
+parser = argparse.ArgumentParser(description="Generates a clean LAR file that passes syntax and validity edits.")
+parser.add_argument("bank_config", nargs="?", default=bank_config, help="bank configuration YAML file")
+parser.add_argument("--workers", type=int, default=1, help="number of processes used to generate LAR rows")
+parser.add_argument("--seed", type=int, default=None, help="seed for reproducible output, the same seed and worker count produce the same file")
+args = parser.parse_args()
+bank_config = args.bank_config
 
 geo_config_file='2024/python/configurations/geographic_data.yaml'
 filepaths_file = '2024/python/configurations/test_filepaths.yaml'
@@ -49,12 +55,8 @@ if not os.path.exists(filepaths["log_filepath"]):
 logging.basicConfig(filename=filepaths["log_filepath"]+filepaths['log_filename'], format='%(asctime)s %(message)s', 
 					datefmt='%m/%d/%Y %I:%M:%S %p', filemode=filepaths['log_mode'], level=logging.INFO)
 
-geographic_data = pd.read_csv(geo_config['geographic_data_file'], delimiter='|', header=0,
-	names=geo_config['file_columns'], dtype=object) #instantiate Census file data as dataframe
-
-#create 11 digit Census Tract codes from 5 digit county and 6 digit tract
-geographic_data['county_fips'] = geographic_data.apply(lambda x: str(x.state_code) + str(x.county), axis=1)
-geographic_data["tract_fips"] = geographic_data.apply(lambda x: str(x.county_fips) + str(x.tracts), axis=1)
+#load Census file data with 5 digit county and 11 digit tract codes, reusing the cached copy if the file is unchanged
+geographic_data = load_geo_index(geo_config).geographic_data
 
 with open(geo_config["zip_code_file"], 'r') as f:
 	zip_codes = json.load(f)
@@ -67,57 +69,27 @@ lar_gen = lar_generator.lar_gen(lar_schema_file=lar_schema_file, ts_schema_file=
 lar_file_config_data["lei"]["value"] = bank_config_data["lei"]["value"]
 #instantiate rules engine to check conformity of synthetic data to FIG schema
 rules_engine = rules_engine(config_data=lar_file_config_data, state_codes=geo_config["state_codes"], state_codes_rev=geo_config["state_codes_rev"],
-	geographic_data=geographic_data, full_lar_file_check=False)
+	geographic_data=geographic_data, full_lar_file_check=False, lar_schema_file=lar_schema_file, ts_schema_file=ts_schema_file)
 
 #instantiate constraints logic to force LAR data to conform to FIG schema
-lar_constraints = lar_data_constraints(lar_file_config=lar_file_config_data, geographic_data=geographic_data)
+lar_constraints = lar_data_constraints(lar_file_config=lar_file_config_data, geographic_data=geographic_data, lar_schema_file=lar_schema_file)
 
 #store original row for diff comparison to see what elements are being changed
 
 ts_row = lar_gen.make_ts_row(bank_file_config=bank_config_data) #create TS row, we only need one
 ts_df = pd.DataFrame(ts_row, index=[0])
 rules_engine.load_ts_data(ts_df) #loading ts_row to rules_engine converts it to a dataframe for value checking
-lar_rows = [] #list to hold all OrderedDict LAR records before writing to file
-
-for i in range(bank_config_data["file_length"]["value"]):
-	print("generating row {count}".format(count=i))
-	#create initial LAR row
-	lar_row = lar_gen.make_row(lar_file_config=lar_file_config_data, geographic_data=geographic_data, 
-							   state_codes=geo_config["state_codes_rev"], zip_code_list=zip_codes)
-	rules_engine.load_lar_data(lar_row) #loading lar_row to rules engine converts it to a dataframe for value checking
 
-	#generate error report
-	edit_report_df = rules_engine.create_edit_report(rules_list=["s", "v", "q"])
-	if LOGGING:
-		logging.info("generating row {count}".format(count=i))
-	if DEBUG:
-		print(edit_report_df)
-
-	#apply constraints to force conformity with FIG schema for LAR data
-	constraints_iter = 0
-	while len(edit_report_df[edit_report_df.fail_count>0]):
-		if LOGGING:
-			logging.info(edit_report_df[edit_report_df.fail_count>0]) #log the edit fails for the row
-			logging.info("constraints iteration {}. checking difference in rows".format(constraints_iter))
-		lar_row_start_items = set(lar_row.items()) #capture initial row data before modifications to log difference between initial and changed row
-		
-		for constraint in lar_constraints.constraints: #loop over all constraint functions to force LAR data to conform to FIG spec
-			lar_row = getattr(lar_constraints, constraint)(lar_row) #lar_row is an ordered dict here
-		if LOGGING:
-			logging.info(set(lar_row.items() - lar_row_start_items))
-		constraints_iter += 1
-		#prepare new edit fails report for checking lar generation process this is the loop break condition
-		rules_engine.reset_results()
-		rules_engine.load_lar_data(lar_row)
-		edit_report_df = rules_engine.create_edit_report() 
-		
-
-		if DEBUG:
-			print(len(edit_report_df[edit_report_df.fail_count>0]))
-			print(edit_report_df[edit_report_df.fail_count>0])
-	lar_rows.append(lar_row)
-
-lar_rows_df = pd.DataFrame(lar_rows)
+#generate LAR rows in batches: each batch is validated once and constraints are applied only to failing rows
+#until every row in the batch passes the FIG edits
+#rows are split into one shard per worker, each with its own random stream derived from the seed
+batch_gen = batch_lar_gen(lar_gen=lar_gen, rules_engine=rules_engine, lar_constraints=lar_constraints, lar_file_config=lar_file_config_data,
+	geographic_data=geographic_data, state_codes=geo_config["state_codes_rev"], zip_code_list=zip_codes, logging_on=LOGGING)
+lar_rows_df = batch_gen.make_sharded_rows(row_count=bank_config_data["file_length"]["value"], workers=args.workers, seed=args.seed,
+	batch_size=lar_file_config_data["batch_size"]["value"])
+if args.workers == 1:
+	#worker processes keep their own repair counts
+	print(batch_gen.scheduler.summary())
 
 if DEBUG:
 	rules_engine.load_lar_data(lar_rows_df)
@@ -139,5 +111,5 @@ print(clean_filepath)
 if not os.path.exists(clean_filepath):
 	os.makedirs(clean_filepath)
 
-utils.write_file(path=clean_filepath, name=clean_filename, ts_input=pd.DataFrame(ts_row, index=[0]), lar_input=lar_rows_df)
+utils.write_file(path=clean_filepath, name=clean_filename, ts_input=pd.DataFrame(ts_row, index=[0]), lar_input=lar_rows_df, atomic=True)
 
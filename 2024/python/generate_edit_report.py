@@ -1,3 +1,4 @@
+import argparse
 import json
 import os
 from os.path import join, isfile
@@ -7,9 +8,20 @@ import pandas as pd
 import yaml
 
 #Edit report configurations are located in configurations/edit_report_config.yaml
+from geo_index import load_geo_index
+from edit_report_cache import edit_report_cache
 from rules_engine import rules_engine
+from stream_validator import stream_validator
 
 
+parser = argparse.ArgumentParser(description="Runs the rules engine on the clean and edit test files of a bank and writes edit reports.")
+parser.add_argument("--workers", type=int, default=1, help="number of processes used to run the edits on each clean file")
+parser.add_argument("--chunksize", type=int, default=None,
+	help="if passed, clean files are read and checked this many LAR rows at a time instead of loading the whole file")
+parser.add_argument("--no_cache", action="store_true",
+	help="check every file again instead of reusing reports cached for files that have not changed")
+args = parser.parse_args()
+
 #load configurations
 lar_config_file = '2023/python/configurations/clean_file_config.yaml'
 bank_config = '2023/python/configurations/bank1_config.yaml'
@@ -43,17 +55,42 @@ edit_report_path = filepaths["edit_report_output_filepath"]
 #get paths to check for clean files (by bank name)
 bank_clean_dir = filepaths["clean_filepath"].format(bank_name=bank_config_data["name"]["value"])
 
-geographic_data = pd.read_csv(geo_config['geographic_data_file'], delimiter='|', header=0,
-	names=geo_config['file_columns'], dtype=object) #instantiate Census file data as dataframe
-
-#create 11 digit Census Tract codes from 5 digit county and 6 digit tract
-geographic_data['county_fips'] = geographic_data.apply(lambda x: str(x.state_code) + str(x.county), axis=1)
-geographic_data["tract_fips"] = geographic_data.apply(lambda x: str(x.county_fips) + str(x.tracts), axis=1)
+#load Census file data with 5 digit county and 11 digit tract codes, reusing the cached copy if the file is unchanged
+geographic_data = load_geo_index(geo_config).geographic_data
 
 #instantiate rules engine to test clean and error files
 rules_engine = rules_engine(config_data=lar_file_config_data, state_codes=geo_config["state_codes"], 
 	state_codes_rev=geo_config["state_codes_rev"], geographic_data=geographic_data, full_lar_file_check=True)
 
+#reports of files that have not changed since the last run are read from the cache
+report_cache = edit_report_cache(rules_engine, cache_dir=filepaths.get("edit_report_cache_filepath", edit_report_path+"cache/"))
+
+def cached_report(data_file, edits_list, run, mode=""):
+	"""Returns the edit report of data_file from the report cache unless --no_cache is passed."""
+	if args.no_cache:
+		return run()
+	return report_cache.edit_report(data_file, edits_list, run, mode=mode)
+
+#clean files are streamed in chunks or loaded whole and checked with workers processes, reports of each mode are cached apart
+clean_mode = "stream chunksize={chunksize}".format(chunksize=args.chunksize) if args.chunksize is not None else \
+	"memory workers={workers}".format(workers=args.workers)
+
+def check_clean_file(data_file):
+	"""Checks a clean file with all s, v and q edits and returns the edit report DataFrame."""
+	rules_engine.reset_results() #clear previous edit report results
+	if args.chunksize is not None:
+		return stream_validator(rules_engine, chunksize=args.chunksize).edit_report(data_file, rules_list=("s", "v", "q"))
+	ts_df, lar_df = rules_engine.split_ts_row(data_file)
+	return rules_engine.run_edits(rules_list=("s", "v", "q"), workers=args.workers).report_df()
+
+def check_edit_file(data_file, edit_names):
+	"""Checks a test file with the edits in edit_names and returns the edit report DataFrame."""
+	rules_engine.reset_results() #clear previous edit report results
+	ts_df, lar_df = rules_engine.split_ts_row(data_file)
+	for edit_name in edit_names:
+		getattr(rules_engine, edit_name)()
+	return rules_engine.results.report_df()
+
 #get all files in clean folder(s)
 clean_file_names = listdir(bank_clean_dir)
 clean_file_names = [f for f in listdir(bank_clean_dir) if isfile(join(bank_clean_dir, f))]
@@ -93,14 +130,9 @@ edit_report_df = pd.DataFrame([], columns=['file_name', 'edit_name', 'row_type',
 
 print("starting clean file loop")
 for file in clean_file_names:
-	rules_engine.reset_results() #clear previous edit report results
 	#print(file)
-	ts_df, lar_df = rules_engine.split_ts_row(bank_clean_dir+file)
-	for rule in rules_engine.svq_edit_functions:
-		if rule[:1] in ("s", "v", "q") and rule[1:4].isdigit()==True:
-					getattr(rules_engine, rule)()
-	if len(rules_engine.results)>0:
-		new_results_df = pd.DataFrame(rules_engine.results)
+	new_results_df = cached_report(bank_clean_dir+file, ("s", "v", "q"), lambda: check_clean_file(bank_clean_dir+file), mode=clean_mode)
+	if len(new_results_df)>0:
 		#add filename for edit tracking and reorder columns for concatenation of output
 		new_results_df["file_name"] = file
 		new_results_df = new_results_df[['file_name', 'edit_name', 'row_type', 'field', 'fail_count', 'failed_rows']] 
@@ -110,23 +142,18 @@ print("starting test file loop")
 all_edits = False
 for file in edit_file_names:
 	#print(file)
-	rules_engine.reset_results() #clear previous edit report results
-	ts_df, lar_df = rules_engine.split_ts_row(file)
-	for rule in rules_engine.svq_edit_functions:
-		if all_edits == False: #only test for the edit in the file name
-			if rule in file:
-				#print("in rule", rule)
-				getattr(rules_engine, rule)()
-		else:
-			getattr(rules_engine, rule)()
-
-	if len(rules_engine.results)>0:
-		new_results_df = pd.DataFrame(rules_engine.results)
+	#only test for the edit in the file name unless all_edits is set
+	edit_names = [edit_func.__name__ for edit_func in rules_engine.edits(categories=("s", "v", "q"))
+		if all_edits or edit_func.__name__ in file]
+	new_results_df = cached_report(file, edit_names, lambda: check_edit_file(file, edit_names))
+	if len(new_results_df)>0:
 	#add filename for edit tracking and reorder columns for concatenation of output
 		new_results_df["file_name"] = file
 		new_results_df = new_results_df[['file_name', 'edit_name', 'row_type', 'field', 'fail_count', 'failed_rows']] 
 		edit_report_df = pd.concat([edit_report_df, new_results_df])
 
+if not args.no_cache:
+	print(report_cache.hits, "reports read from cache,", report_cache.misses, "files checked")
 print(len(clean_report_df), "clean file edit report rows")
 print(len(edit_report_df), "edit file edit report rows")
 
@@ -8,6 +8,7 @@ import yaml
 import pandas as pd
 
 
+from geo_index import load_geo_index
 from lar_constraints import lar_data_constraints
 import lar_generator
 from rules_engine import rules_engine
@@ -42,21 +43,13 @@ with open(geo_config_file, 'r') as f:
 with open(bank_config, 'r') as f:
 	bank_config_data = yaml.safe_load(f)
 
-with open(geo_config["geographic_data_file"], 'r') as f:
-	geographic_data = yaml.safe_load(f)
-
 #set quality filepath to the name of the bank being used
 filepaths["quality_filepath"] = filepaths["quality_filepath"].format(bank_name=bank_config_data["name"]["value"]) 
 
 DEBUG = False
 
-#load geographic data
-geographic_data = pd.read_csv(geo_config['geographic_data_file'], delimiter='|', header=0,
-	names=geo_config['file_columns'], dtype=object) #instantiate Census file data as dataframe
-
-#create 11 digit Census Tract codes from 5 digit county and 6 digit tract
-geographic_data['county_fips'] = geographic_data.apply(lambda x: str(x.state_code) + str(x.county), axis=1)
-geographic_data["tract_fips"] = geographic_data.apply(lambda x: str(x.county_fips) + str(x.tracts), axis=1)
+#load Census file data with 5 digit county and 11 digit tract codes, reusing the cached copy if the file is unchanged
+geographic_data = load_geo_index(geo_config).geographic_data
 
 
 test_file_gen = test_data_creator(ts_schema_file=ts_schema_file, lar_schema_file=lar_schema_file, 
@@ -114,22 +107,12 @@ for quality_file in quality_files:
 	checker.reset_results()
 	#generate an edits report for the file
 	#this will mark the rows that need to be removed to ensure the file passes S/V edits
-	for func in dir(checker):
-		if func[:1] in ("s", "v") and func[1:4].isdigit()==True:
-			getattr(checker, func)()
-
-	#capture edit report results
-	report_df = pd.DataFrame(checker.results)
-	report_df = report_df[report_df['row_type'] != 'TS'].copy() #remove records relating to TS fails
-	#remove report rows that did not have fails
-	report_df = report_df[report_df.apply(lambda x: len(x.failed_rows)>0, axis=1)].copy()
+	for edit_func in checker.edits(categories=("s", "v")):
+		edit_func()
 
 	#copy rows that pass S/V edits and remove ones that do not to make a test file free of S/V edits
-	#remove lar rows with S/V fails
-	bad_uli_list = report_df.failed_rows.to_list()
-	#flat_list = [item for sublist in l for item in sublist]
-	bad_uli_list = [uli for sublist in bad_uli_list for uli in sublist]
-	bad_uli_list = set(bad_uli_list) #convert to set to remove duplicates
+	#remove lar rows with S/V fails, TS fails are not included
+	bad_uli_list = checker.results.failing_ulis(categories=("s", "v"))
 	print(len(bad_uli_list), "bad ULIs")
 	print(bad_uli_list)
 	print(len(lar_df), "before dropping bad ulis")
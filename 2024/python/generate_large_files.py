@@ -35,6 +35,7 @@ with open(large_file_config) as f:
 bank_name = bank_config_data['name']['value']
 base_clean_file_length = large_file_settings['large_file_base_length']['value']
 large_file_length = large_file_settings['large_file_write_length']['value']
+chunk_size = large_file_settings['large_file_chunk_size']['value']
 lei = bank_config_data['lei']['value']
 tax_id = bank_config_data['tax_id']['value']
 
@@ -60,17 +61,29 @@ ts_data, lar_data = utils.read_data_file(path=source_filepath,
 ts_data, lar_data = utils.change_bank(ts_data=ts_data, lar_data=lar_data, new_bank_name=bank_name, 
     new_lei=lei, new_tax_id=tax_id)
 
-ts_data, lar_data = utils.new_lar_rows(final_row_count=large_file_length, lar_df=lar_data, ts_df=ts_data)
+#Sets the TS entry count to the large file length.
+ts_data["lar_entries"] = large_file_length
 
-#If a row by row modification yaml file is present in the configuration, the row by row modification function is applied. 
+#Loads the row by row modification yaml file if it is present in the configuration.
+row_by_row = None
 if filepaths["row_level_modification_config"] != None:
-	lar_data = utils.row_by_row_modification(lar_data, yaml_filepath=filepaths["row_level_modification_config"])
+	with open(filepaths["row_level_modification_config"]) as f:
+		row_by_row = yaml.safe_load(f)
 
-#Writes file to the output filepath and name in the large file specifications yaml. 
-utils.write_file(path=output_filepath, ts_input=ts_data, lar_input=lar_data, name=output_filename)
+def large_file_chunks():
+	"""Yields the rows of the large file one chunk at a time, cycling over the base file rows with new ULIs."""
+	for chunk in utils.stream_lar_rows(lar_df=lar_data, row_count=large_file_length, lei=lei, chunksize=chunk_size):
+		#The row by row modifications are applied to the chunk that contains each modified row.
+		if row_by_row is not None:
+			chunk = utils.modify_rows(chunk, row_by_row)
+		print("writing rows {start} to {end}".format(start=chunk.index[0], end=chunk.index[-1]+1))
+		yield chunk
+
+#Streams the file to the output filepath and name in the large file specifications yaml.
+utils.write_file(path=output_filepath, ts_input=ts_data, lar_input=large_file_chunks(), name=output_filename, atomic=True)
 
 #Prints a statement of the file created. 
-statement = (str("{:,}".format(len(lar_data.index))) + 
+statement = (str("{:,}".format(large_file_length)) + 
             " Row File Created for " + str(bank_name) + 
             " File Path: " + str(output_filepath+output_filename))
 print("*********")
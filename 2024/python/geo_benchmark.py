@@ -0,0 +1,49 @@
+#This script times the census tract and county membership checks used by the geography edits and constraints.
+#It compares the per row cost of the list and Series lookups that were used before the census file was indexed
+#with the frozenset lookups in geo_index.
+#Run from the repository root: python 2024/python/geo_benchmark.py
+
+import timeit
+
+import pandas as pd
+import yaml
+
+from geo_index import load_geo_index
+
+geo_config_file = '2024/python/configurations/geographic_data.yaml'
+rows = 1000 #LAR rows checked in each timing
+list_rows = 20 #the list lookup takes milliseconds per row so fewer rows are timed
+
+with open(geo_config_file, 'r') as f:
+	geo_config = yaml.safe_load(f)
+
+geo = load_geo_index(geo_config)
+geographic_data = geo.geographic_data
+#half of the checked tracts are valid, half are not in the census file
+tracts = list(geographic_data.tract_fips.sample(rows//2, random_state=0)) + ["99999999999"] * (rows - rows//2)
+counties = [tract[:5] for tract in tracts]
+tract_series = pd.Series(tracts)
+
+def list_lookup():
+	#v627_const before indexing: lists of all tracts and counties were built for every row
+	for tract, county in zip(tracts[:list_rows], counties[:list_rows]):
+		tract not in list(geographic_data["tract_fips"]) or county not in list(geographic_data["county_fips"])
+
+def set_lookup():
+	#v627_const with geo_index
+	for tract, county in zip(tracts, counties):
+		not geo.is_tract(tract) or not geo.is_county(county)
+
+def series_isin():
+	#v625_2 before indexing: a hash table of all tracts was built on each call
+	tract_series.isin(geographic_data["tract_fips"])
+
+def set_map():
+	#v625_2 with geo_index
+	tract_series.map(geo.is_tract)
+
+print("{count} census tracts, {rows} LAR rows per timing".format(count=len(geo.tracts), rows=rows))
+for name, func, number, func_rows in (("v627_const list lookup", list_lookup, 1, list_rows), ("v627_const set lookup", set_lookup, 100, rows),
+	("v625_2 Series.isin", series_isin, 20, rows), ("v625_2 set map", set_map, 20, rows)):
+	seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+	print("{name}: {per_row:.3f} microseconds per row".format(name=name, per_row=seconds / func_rows * 1e6))
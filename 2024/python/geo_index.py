@@ -0,0 +1,168 @@
+#This file contains an indexed view of the FFIEC census flat file used for geography checks and tract sampling.
+#The census file is parsed once, the county and tract keys are built column-wise, and the result is cached
+#in a binary file keyed by a hash of the census file so later runs skip parsing the text file.
+
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+import utils
+
+#loaded geo indexes keyed by census file path, header setting and cache directory
+_indexes = {}
+
+def load_geo_index(geo_config, header=0, cache_dir=None):
+	"""
+	Returns the geo_index for the census file in a geographic data configuration, building it only on first use.
+	geo_config: dictionary like object usually loaded from geographic_data.yaml
+	header: header argument passed to pd.read_csv for the census file
+	cache_dir: directory for the binary cache, defaults to geographic_cache_dir in geo_config
+	"""
+	if cache_dir is None:
+		cache_dir = geo_config.get("geographic_cache_dir")
+	key = (os.path.abspath(geo_config["geographic_data_file"]), header, cache_dir)
+	if key not in _indexes:
+		geographic_data = read_geographic_data(geo_config["geographic_data_file"], geo_config["file_columns"],
+			header=header, cache_dir=cache_dir)
+		_indexes[key] = geo_index_for(geographic_data)
+	return _indexes[key]
+
+def geo_index_for(geographic_data):
+	"""
+	Returns the geo_index of a census DataFrame, building it on first use.
+	Classes that are passed the census DataFrame share one index. The DataFrame should not be modified after it is indexed.
+	The index is stored as an attribute of the DataFrame so it is freed with the DataFrame, copies of the DataFrame are indexed again.
+	"""
+	index = vars(geographic_data).get("_geo_index")
+	if index is None:
+		index = geo_index(geographic_data)
+		#set on the instance directly, DataFrame.__setattr__ would treat the name as a column
+		object.__setattr__(geographic_data, "_geo_index", index)
+	return index
+
+def file_hash(data_file):
+	"""Returns the SHA-1 hex digest of a file's contents."""
+	digest = hashlib.sha1()
+	with open(data_file, 'rb') as f:
+		for block in iter(lambda: f.read(1<<20), b""):
+			digest.update(block)
+	return digest.hexdigest()
+
+def read_geographic_data(geographic_data_file, file_columns, header=0, cache_dir=None):
+	"""
+	Returns the census file as a DataFrame of strings with county_fips and tract_fips columns added.
+	If cache_dir is passed, the DataFrame is read from a pickle named for the census file hash when one exists
+	and written there otherwise. Changing the census file or its columns makes a new cache file.
+	"""
+	cache_file = None
+	if cache_dir is not None:
+		key = hashlib.sha1("{hash}|{columns}|{header}".format(hash=file_hash(geographic_data_file),
+			columns="|".join(file_columns), header=header).encode("utf-8")).hexdigest()
+		cache_file = os.path.join(cache_dir, "geographic_data_{key}.pkl".format(key=key))
+		if os.path.exists(cache_file):
+			return pd.read_pickle(cache_file)
+
+	geographic_data = pd.read_csv(geographic_data_file, delimiter='|', header=header,
+		names=file_columns, dtype=object) #instantiate Census file data as dataframe
+	#create 5 digit County Codes from 2 digit state and 3 digit county
+	geographic_data["county_fips"] = geographic_data.state_code.astype(str) + geographic_data.county.astype(str)
+	#create 11 digit Census Tract codes from 5 digit county and 6 digit tract
+	geographic_data["tract_fips"] = geographic_data.county_fips + geographic_data.tracts.astype(str)
+
+	if cache_file is not None:
+		if not os.path.exists(cache_dir):
+			os.makedirs(cache_dir)
+		temp_file = cache_file + ".{pid}.tmp".format(pid=os.getpid())
+		geographic_data.to_pickle(temp_file)
+		os.replace(temp_file, cache_file) #concurrent runs never read a partial cache file
+	return geographic_data
+
+class geo_index(object):
+	"""
+	Hashed lookups of census tracts and counties.
+	Small counties are those flagged "1" or "S" in the small_county column, both flags are used across census file years.
+	Tracts are also stored sorted, so the tracts of a county and the counties of a state are contiguous slices.
+	Functions:
+	- is_tract
+	- is_county
+	- is_small_county
+	- state_from_county
+	- tracts_for_county
+	- counties_for_state
+	- sample_tracts
+	- sample_counties
+	"""
+	def __init__(self, geographic_data):
+		"""
+		geographic_data: census DataFrame with county_fips, tract_fips and small_county columns
+		"""
+		self.geographic_data = geographic_data
+		self.tracts = frozenset(geographic_data.tract_fips)
+		self.counties = frozenset(geographic_data.county_fips)
+		self.small_counties = frozenset(geographic_data.county_fips[geographic_data.small_county.isin(["1", "S"])])
+		#the first 2 digits of a county FIPS code are the state FIPS code
+		self.county_states = {county:county[:2] for county in self.counties}
+
+		#sorted tracts grouped by their 5 digit county prefix, and sorted counties grouped by their 2 digit state prefix
+		self.tract_array = np.array(sorted(self.tracts), dtype=object)
+		self.county_array, self.county_starts, self.county_counts = np.unique(
+			np.array([tract[:5] for tract in self.tract_array], dtype=object), return_index=True, return_counts=True)
+		self.state_array, self.state_starts, self.state_counts = np.unique(
+			np.array([county[:2] for county in self.county_array], dtype=object), return_index=True, return_counts=True)
+
+	def is_tract(self, tract):
+		"""Returns True if tract is an 11 digit census tract in the census file."""
+		return tract in self.tracts
+
+	def is_county(self, county):
+		"""Returns True if county is a 5 digit county in the census file."""
+		return county in self.counties
+
+	def is_small_county(self, county):
+		"""Returns True if county is flagged as a small county in the census file."""
+		return county in self.small_counties
+
+	def state_from_county(self, county):
+		"""Returns the 2 digit state FIPS code for a 5 digit county or None if the county is not in the census file."""
+		return self.county_states.get(county)
+
+	def _group_positions(self, keys, key_array, name):
+		"""Returns the positions of keys in the sorted key_array. Raises ValueError for keys that are not present."""
+		keys = np.asarray(keys, dtype=object)
+		positions = np.minimum(np.searchsorted(key_array, keys), max(len(key_array)-1, 0))
+		missing = (key_array[positions] != keys) if len(key_array) else np.ones(len(keys), dtype=bool)
+		if missing.any():
+			raise ValueError("{name} not in the census file: {keys}".format(name=name, keys=sorted(set(keys[missing]))[:10]))
+		return positions
+
+	def tracts_for_county(self, county):
+		"""Returns an array of the census tracts in a 5 digit county."""
+		position = self._group_positions([county], self.county_array, "county")[0]
+		return self.tract_array[self.county_starts[position]:self.county_starts[position]+self.county_counts[position]]
+
+	def counties_for_state(self, state):
+		"""Returns an array of the counties in a 2 digit state FIPS code."""
+		position = self._group_positions([state], self.state_array, "state")[0]
+		return self.county_array[self.state_starts[position]:self.state_starts[position]+self.state_counts[position]]
+
+	def sample_tracts(self, counties, rng=None):
+		"""
+		Returns an array with a random census tract from each county in counties.
+		Tracts are chosen uniformly within each county with the NumPy Generator rng.
+		"""
+		rng = utils.default_rng(rng)
+		positions = self._group_positions(counties, self.county_array, "county")
+		offsets = (rng.random(len(positions)) * self.county_counts[positions]).astype(np.int64)
+		return self.tract_array[self.county_starts[positions] + offsets]
+
+	def sample_counties(self, states, rng=None):
+		"""
+		Returns an array with a random county from each 2 digit state FIPS code in states.
+		Counties are chosen uniformly within each state with the NumPy Generator rng.
+		"""
+		rng = utils.default_rng(rng)
+		positions = self._group_positions(states, self.state_array, "state")
+		offsets = (rng.random(len(positions)) * self.state_counts[positions]).astype(np.int64)
+		return self.county_array[self.state_starts[positions] + offsets]
@@ -0,0 +1,73 @@
+#This file contains typed column views of LAR data for use by rules_engine edits.
+#LAR values are kept as strings in the DataFrame. Numeric fields are also converted once per loaded
+#DataFrame into NumPy arrays so edits can compare values without converting each element in a Python lambda.
+
+import numpy as np
+import pandas as pd
+
+#bits set in the sentinel mask of a field
+NA = 1
+EXEMPT = 2
+BLANK = 4
+NOT_NUMBER = 8 #any other value that is not a number
+
+class lar_columns(object):
+	"""
+	Typed views of the fields of a LAR DataFrame. Each view is built the first time an edit asks for it.
+	Functions:
+	- values
+	- numbers
+	- sentinels
+	- is_number
+	- plain_numbers
+	"""
+	def __init__(self, lar_df):
+		"""
+		lar_df: DataFrame of LAR rows with string values
+		"""
+		self.lar_df = lar_df
+		self._values = {}
+		self._numbers = {}
+		self._sentinels = {}
+		self._plain_numbers = {}
+
+	def values(self, field):
+		"""Returns the string values of the field as an object array."""
+		if field not in self._values:
+			self._values[field] = self.lar_df[field].to_numpy(dtype=object)
+		return self._values[field]
+
+	def numbers(self, field):
+		"""Returns the field as a float array. Values that are not numbers, including NA, Exempt and blank, are NaN."""
+		if field not in self._numbers:
+			self._numbers[field] = pd.to_numeric(self.lar_df[field], errors="coerce").to_numpy(dtype=np.float64)
+		return self._numbers[field]
+
+	def sentinels(self, field):
+		"""
+		Returns a uint8 array of sentinel bits for the field: NA, EXEMPT, BLANK or NOT_NUMBER.
+		Rows with a numeric value have no bits set.
+		"""
+		if field not in self._sentinels:
+			values = self.values(field)
+			mask = np.zeros(len(values), dtype=np.uint8)
+			mask[values=="NA"] = NA
+			mask[values=="Exempt"] = EXEMPT
+			mask[values==""] = BLANK
+			mask[(mask==0) & np.isnan(self.numbers(field))] = NOT_NUMBER
+			self._sentinels[field] = mask
+		return self._sentinels[field]
+
+	def is_number(self, field):
+		"""Returns a boolean array that is True where the field holds a number."""
+		return self.sentinels(field)==0
+
+	def plain_numbers(self, field):
+		"""
+		Returns a boolean array that is True where the field is a number written only with digits and decimal points,
+		the test used by rules_engine.check_number. Signed and exponent forms are False.
+		"""
+		if field not in self._plain_numbers:
+			plain = self.lar_df[field].astype(str).str.match(r"[0-9.]*[0-9][0-9.]*\Z").to_numpy(dtype=bool)
+			self._plain_numbers[field] = plain & self.is_number(field)
+		return self._plain_numbers[field]
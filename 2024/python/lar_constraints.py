@@ -4,16 +4,21 @@ import string
 import pandas as pd
 import yaml
 
+from geo_index import geo_index_for
+from schema_index import load_schema
 
 class lar_data_constraints(object):
 
-	def __init__(self, lar_file_config, geographic_data):
+	def __init__(self, lar_file_config, geographic_data, lar_schema_file="2024/schemas/lar_schema.json"):
 		"""
 		lar_file_cnfig is a dictionary like object usually loaded from clean_file_config.yaml
 		geographic_data is the HMDA Ops cut of the FFIEC Census Flat File
+		lar_schema_file is the JSON LAR schema, its index is shared with lar_gen and rules_engine
 		"""
 		self.config_data = lar_file_config
 		self.geographic_data = geographic_data
+		self.geo_index = geo_index_for(geographic_data)
+		self.lar_schema = load_schema(lar_schema_file)
 		#create list of LAR data constraint functions
 		self.constraints = []
 		for func in dir(self):
@@ -135,7 +140,7 @@ class lar_data_constraints(object):
 		"""1) If County and Census Tract are not reported NA, they must be a valid combination of information.
 		   The first five digits of the Census Tract must match the reported five digit County FIPS code. """
 		if row["tract"] != "NA" and row["county"] != "NA":
-			if row["tract"] not in list(self.geographic_data["tract_fips"]) or row["county"] not in list(self.geographic_data['county_fips']):
+			if not self.geo_index.is_tract(row["tract"]) or not self.geo_index.is_county(row["county"]):
 				row["tract"] = random.choice(self.geographic_data["tract_fips"])
 				row["county"] = row["tract"][:5]
 				print(row["tract"], row["county"])
@@ -145,9 +150,8 @@ class lar_data_constraints(object):
 		"""1) Ethnicity of Applicant or Borrower: 1 must equal 1, 11, 12, 13, 14, 2, 3, or 4, and cannot be left blank,
 			   unless an ethnicity is provided in Ethnicity of Applicant or Borrower: Free Form Text Field for Other
 			   Hispanic or Latino."""
-		eth_enums = ["1", "11", "12", "13", "14", "2", "3", "4"]
 		if row["app_eth_1"] =="" and row["app_eth_free"] =="":
-			row["app_eth_1"] = random.choice(eth_enums)
+			row["app_eth_1"] = random.choice(self.lar_schema.str_vals(field="app_eth_1"))
 		return row
 
 	def v628_2_const(self, row):
@@ -223,7 +227,7 @@ class lar_data_constraints(object):
 			left blank, unless an ethnicity is provided in Ethnicity of Co-Applicant or Co-Borrower: Free Form Text
 			Field for Other Hispanic or Latino."""
 		if row["co_app_eth_1"] == "" and row["co_app_eth_free"] == "":
-			row["co_app_eth_1"] = random.choice(["1","11", "12", "13", "14", "2", "3", "4", "5"])
+			row["co_app_eth_1"] = random.choice(self.lar_schema.str_vals(field="co_app_eth_1"))
 		return row
 
 	def v631_2_const(self, row):
@@ -306,7 +310,7 @@ class lar_data_constraints(object):
 			Field for American Indian or Alaska Native Enrolled or Principal Tribe, Race of Applicant or Borrower:
 			Free Form Text Field for Other Asian, or Race of Applicant or Borrower: Free Form Text Field for Other Pacific Islander."""
 		if row["app_race_1"] ==  "" and row["app_race_native_text"]== "" and row["app_race_asian_text"]== "" and row["app_race_islander_text"] == "":
-			row["app_race_1"] = random.choice(("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "6", "7"))
+			row["app_race_1"] = random.choice(self.lar_schema.str_vals(field="app_race_1"))
 		return row
 
 	def v635_2_const(self, row):
@@ -388,7 +392,7 @@ class lar_data_constraints(object):
 		4) If Race of Co-Applicant or Co-Borrower: 1 equals 6, 7, or 8, then Race of Co-Applicant or Co-Borrower: 2; 
 			Race of Co-Applicant or Co-Borrower: 3; Race of Co-Applicant or Co-Borrower: 4; and Race of CoApplicant or Co-Borrower: 5 must be left blank."""
 		if row["co_app_race_1"] =="" and row["co_app_race_native_text"]=="" and row["co_app_race_asian_text"]=="" and row["co_app_race_islander_text"]=="":
-			row["co_app_race_1"] = random.choice(("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "6", "7", "8"))
+			row["co_app_race_1"] = random.choice(self.lar_schema.str_vals(field="co_app_race_1"))
 		#each code must only be used once
 		race_enums = ["1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "6", "7","8"]
 		race_fields = [row["co_app_race_1"], row["co_app_race_2"], row["co_app_race_3"], row["co_app_race_4"], row["co_app_race_5"]]
@@ -587,9 +591,9 @@ class lar_data_constraints(object):
 			Borrower, Name and Version of Credit Scoring Model: Conditional Free Form Text Field for Code 8
 			must not be blank, and the reverse must be true."""
 
-		if row["app_score_name"] in ("1", "2", "3", "4", "5", "6", "7", "9"):
+		if row["app_score_name"] in ("1111", "1", "2", "3", "4", "5", "6", "7", "9"):
 			row["app_score_code_8"] = ""
-		elif row["app_score_code_8"] =="" and row["app_score_name"] not in ("1", "2", "3", "4", "5", "6", "7", "9"):
+		elif row["app_score_code_8"] =="" and row["app_score_name"] not in ("1111", "1", "2", "3", "4", "5", "6", "7", "9"):
 			row["app_score_name"] = random.choice(("1", "2", "3", "4", "5", "6", "7", "9"))
 		elif row["app_score_name"] == "8" and row["app_score_code_8"] =="":
 			row["app_score_code_8"] = ''.join(random.choice(string.ascii_uppercase + string.digits) for _ in range(25))
@@ -641,9 +645,9 @@ class lar_data_constraints(object):
 		2) If Co-Applicant or Co-Borrower, Name and Version of Credit Scoring Model equals 8, then Co-Applicant
 			or Co-Borrower, Name and Version of Credit Scoring Model: Conditional Free Form Text Field for Code 8
 			must not be left blank, and the reverse must be true."""
-		if row["co_app_score_name"] in ("1", "2", "3", "4", "5", "6", "7", "9", "10"):
+		if row["co_app_score_name"] in ("1111", "1", "2", "3", "4", "5", "6", "7", "9", "10"):
 			row["co_app_score_code_8"] = ""
-		elif row["co_app_score_code_8"] == "" and row["co_app_score_name"] not in ("1", "2", "3", "4", "5", "6", "7", "9", "10"):
+		elif row["co_app_score_code_8"] == "" and row["co_app_score_name"] not in ("1111", "1", "2", "3", "4", "5", "6", "7", "9", "10"):
 			row["co_app_score_name"] = random.choice(("1", "2", "3", "4", "5", "6", "7", "9", "10"))
 		elif row["co_app_score_name"] == "8" and row["co_app_score_code_8"] =="":
 			row["co_app_score_code_8"] = ''.join(random.choice(string.ascii_uppercase + string.digits) for _ in range(25))
@@ -724,10 +728,10 @@ class lar_data_constraints(object):
 		4) If Open-End Line of Credit equals 1, then Total Loan Costs must be NA.
 		5) If Business or Commercial Purpose equals 1, then Total Loan Costs must be NA.
 		6) If Action Taken equals 2, 3, 4, 5, 7 or 8, then Total Loan Costs must be NA."""
-		if row["loan_costs"] !="NA":
+		if row["loan_costs"] not in ("NA", "Exempt"):
 			if float(row["loan_costs"]) <0:
 				row["loan_costs"] = "10"
-		if row["points_fees"] != "NA":
+		if row["points_fees"] not in ("NA", "Exempt"):
 			if float(row["points_fees"] )>=0:
 				row["loan_costs"] = "NA"
 		if row["reverse_mortgage"] == "1":
@@ -752,7 +756,7 @@ class lar_data_constraints(object):
 			row["points_fees"] = "NA"
 		if row["business_purpose"] == "1":
 			row["points_fees"] = "NA"
-		if row["loan_costs"] != "NA":
+		if row["loan_costs"] not in ("NA", "Exempt"):
 			if float(row["loan_costs"]) >=0:
 				row["points_fees"] = "NA"
 		return row
@@ -1177,9 +1181,7 @@ class lar_data_constraints(object):
 			row["co_app_credit_score"] = "1111"
 			row["app_score_name"] = "1111"
 			row["co_app_score_name"] = "1111"
-			row["app_score_name"] = ""
 			row["app_score_code_8"] = ""
-			row["co_app_score_name"] = ""
 			row["co_app_score_code_8"] = ""
 		return row
 
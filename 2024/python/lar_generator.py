@@ -1,12 +1,14 @@
 import json
 import os
+import numpy as np
 import pandas as pd
 import random
-import string
-import time
 import yaml
 
 from collections import OrderedDict
+from geo_index import geo_index_for
+from lar_sampler import conditional_sampler
+from schema_index import load_schema
 import utils
 
 class lar_gen(object):
@@ -21,7 +23,20 @@ class lar_gen(object):
 	- tract_from_county
 	- make_ts_row
 	- make_row
+	- make_rows
+	- enum_array
+	- range_and_enum_array
+	- day_ordinals
+	- ordinal_dates
+	- date_array
+	- date_pair_array
+	- char_string_array
 	"""
+	#free text fields of make_row and the exclusive upper bound of their string lengths
+	text_fields = OrderedDict([("app_eth_free", 100), ("co_app_eth_free", 100), ("app_race_native_text", 100), ("app_race_asian_text", 100),
+		("app_race_islander_text", 100), ("co_app_race_native_text", 100), ("co_app_race_asian_text", 100), ("co_app_race_islander_text", 100),
+		("app_score_code_8", 100), ("co_app_score_code_8", 100), ("denial_code_9", 255), ("mlo_id", 25), ("aus_code_5", 255), ("aus_code_16", 255)])
+
 	def __init__(self, lar_schema_file="2023/schemas/lar_schema.json", ts_schema_file="2023/schemas/ts_schema.json"):
 	#, config_file='configurations/clean_file_config.yaml', geo_config_file='configurations/geographic_data.yaml'):
 		"""
@@ -33,13 +48,13 @@ class lar_gen(object):
 		print("start initialization of LAR generator")
 
 		#load Schemas for valid values for fields for LAR and TS
-		with open(lar_schema_file, 'r') as f:
-			lar_schema_json = json.load(f)
-		self.lar_schema_df = pd.DataFrame(lar_schema_json)
-
-		with open(ts_schema_file, 'r') as f:
-			ts_schema_json = json.load(f)
-		self.ts_schema_df = pd.DataFrame(ts_schema_json)
+		#schema indexes are shared with the rules engine and constraints so each file is only parsed once
+		self.lar_schema = load_schema(lar_schema_file)
+		self.ts_schema = load_schema(ts_schema_file)
+		self.lar_schema_df = self.lar_schema.schema_df
+		self.ts_schema_df = self.ts_schema.schema_df
+		#cross-field edit rules applied to the columns drawn by make_rows
+		self.sampler = conditional_sampler(strings=self.char_string_array)
 
 		#with open(self.geo_config["zip_code_file"], 'r') as f:
 		#	self.zip_codes = json.load(f)
@@ -47,86 +62,51 @@ class lar_gen(object):
 		#self.state_codes_rev = self.geo_config["state_codes_rev"]
 		#cleanup unneeded variables
 		#del self.geo_config
-		del lar_schema_json
-		del ts_schema_json
 		print("LAR generator initialization complete")
 
 	def date_gen(self, activity_year, valid=True):
-		"""Generates and returns a semi-valid date string or an invalid date string. Does not check days per month."""
-		months = list(range(1,13))
-		days = list(range(1,32))
+		"""Generates and returns a valid date string in the activity year or an invalid date string."""
 		if valid:
-			valid_date = False
-			while valid_date == False:
-				date = str(activity_year)+str(random.choice(months)).zfill(2)+str(random.choice(days)).zfill(2)
-				try:
-					time.strptime(date,'%Y%m%d')
-					valid_date = True
-				except:
-					valid_date = False
-		else:
-			date = str(lar_file_config["calendar_year"]["value"])+str(16)+str(33)
-		return date
+			return self.date_array(1, utils.default_rng(), activity_year=activity_year)[0]
+		return str(activity_year)+str(16)+str(33)
 
 	def get_schema_val(self, schema="LAR", position=0, item=0, field=None):
 		"""Returns a value from the valid_vals list in the schema for the named field. Default is the first value in the list."""
 		if not field:
 			raise ValueError("must specify which field")
 		if schema=="LAR":
-			return self.lar_schema_df.valid_vals[self.lar_schema_df.field==field].iloc[position][item]
+			return self.lar_schema.valid_vals(field=field)[item]
 		elif schema=="TS":
-			return self.ts_schema_df.valid_vals[self.ts_schema_df.field==field].iloc[position][item]
+			return self.ts_schema.valid_vals(field=field)[item]
 		else:
 			pass
 
 	def get_schema_list(self, schema="LAR", field=None, empty=False):
 		"""
-		Returns the list of valid values for the specified schema and field. 
-		Optionally adds blanks to the list of values.
+		Returns the tuple of valid values for the specified schema and field. 
+		Optionally adds a blank to the values.
 		"""
 		
 		if not field:
 			raise ValueError("must specify which field")
 
 		if schema=="LAR":
-			if empty:
-				schema_enums = self.lar_schema_df.valid_vals[self.lar_schema_df.field==field].iloc[0]
-				schema_enums.append("")
-				return schema_enums
-			else: 
-				return self.lar_schema_df.valid_vals[self.lar_schema_df.field==field].iloc[0]
+			return self.lar_schema.valid_vals(field=field, empty=empty)
 
 		elif schema=="TS":
-			if empty:
-				schema_enums = self.ts_schema_df.valid_vals[self.ts_schema_df.field==field].iloc[0]
-				schema_enums.append("")
-				return schema_enums
-			else:
-				return self.ts_schema_df.valid_vals[self.ts_schema_df.field==field].iloc[0]
+			return self.ts_schema.valid_vals(field=field, empty=empty)
 
 	def range_and_enum(self, field=None, rng_min=1, rng_max=100, dtype="int", empty=False):
 		"""
-		Returns a list of integers or floats. 
-		if na is True the returned list will contain NA
-		if empty is True the returned list will contain an empty string
+		Returns a range_spec of integers or floats that random.choice can draw from without building the list.
+		NA values from the schema are included if present
+		if empty is True the selection list will contain an empty string
 		"""
+		return self.lar_schema.range_and_enum(field=field, rng_min=rng_min, rng_max=rng_max, dtype=dtype, empty=empty)
 
-		lst=[]
-		lst = self.get_schema_list(field=field) #get NA values from schema if present
-		if dtype=="int":
-			for i in range(rng_min, rng_max):
-				lst.append(i)
-		elif dtype=="float":
-			for i in range(rng_min, rng_max):
-				lst.append(i*1.01)
-		if empty:
-			lst.append("")
-		return lst
-
-	def tract_from_county(self, county):
+	def tract_from_county(self, county, geographic_data, rng=None):
 		"""Returns a Census Tract FIPS that is valid for the passed county."""
-		valid_tracts = [tract for tract in self.tract_list if tract[:5]==county]
-		return random.choice(valid_tracts)
+		return geo_index_for(geographic_data).sample_tracts([county], rng=rng)[0]
 
 	def make_ts_row(self, bank_file_config):
 		"""Creates a TS row as a dictionary and returns it."""
@@ -153,12 +133,18 @@ class lar_gen(object):
 	def make_row(self, lar_file_config, geographic_data, state_codes, zip_code_list):
 		"""Make num_rows LAR rows and return them as a list of ordered dicts"""
 		valid_lar_row = OrderedDict() 
-		valid_lar_row["record_id"] = str(self.lar_schema_df.valid_vals[self.lar_schema_df.field=="record_id"].iloc[0][0])
+		#free text fields are cut from one block of random characters
+		rng = utils.default_rng()
+		text = OrderedDict(zip(self.text_fields, utils.char_string_array(rng.integers(0, list(self.text_fields.values())), rng)))
+		valid_lar_row["record_id"] = str(self.get_schema_val(field="record_id"))
 		valid_lar_row["lei"] = lar_file_config["lei"]["value"]
-		valid_lar_row["uli"] = valid_lar_row['lei'] + utils.char_string_gen(23)
-		valid_lar_row["uli"] = valid_lar_row["uli"] + utils.check_digit_gen(ULI=valid_lar_row["uli"])
-		valid_lar_row["uli"] = random.choice([valid_lar_row["uli"], utils.char_string_gen(22)])
-		valid_lar_row["app_date"] = str(self.date_gen(activity_year=lar_file_config["activity_year"]["value"]))
+		#half of ULIs are built from the LEI with a check digit, the choice is drawn from the same Generator as the ULI
+		if rng.integers(0, 2) == 0:
+			valid_lar_row["uli"] = utils.uli_array(lei=valid_lar_row["lei"], n=1, rng=rng)[0]
+		else:
+			valid_lar_row["uli"] = utils.char_string_array([22], rng)[0]
+		app_date, action_date = self.date_pair_array(1, rng, activity_year=lar_file_config["activity_year"]["value"])
+		valid_lar_row["app_date"] = app_date[0]
 		valid_lar_row["loan_type"] = str(random.choice(self.get_schema_list(field="loan_type")))
 		valid_lar_row["loan_purpose"] = str(random.choice(self.get_schema_list(field="loan_purpose")))
 		valid_lar_row["preapproval"] = str(random.choice(self.get_schema_list(field="preapproval")))
@@ -166,7 +152,7 @@ class lar_gen(object):
 		valid_lar_row["occ_type"] = str(random.choice(self.get_schema_list(field="occ_type")))
 		valid_lar_row["loan_amount"] = str(random.choice(range(1, lar_file_config["max_amount"]["value"])))
 		valid_lar_row["action_taken"] = str(random.choice(self.get_schema_list(field='action_taken')))
-		valid_lar_row["action_date"] = str(self.date_gen(activity_year=lar_file_config["activity_year"]["value"]))
+		valid_lar_row["action_date"] = action_date[0]
 		valid_lar_row["street_address"] = random.choice([lar_file_config["street_addy"]["value"], lar_file_config["street_addy"]["value"], "Exempt"])
 		valid_lar_row["city"] = lar_file_config["city"]["value"]
 		valid_lar_row["state"] = "" #placeholder to preserve LAR order
@@ -180,13 +166,13 @@ class lar_gen(object):
 		valid_lar_row["app_eth_3"] = str(random.choice(self.get_schema_list(field="app_eth_3", empty=True)))
 		valid_lar_row["app_eth_4"] = str(random.choice(self.get_schema_list(field="app_eth_4", empty=True)))
 		valid_lar_row["app_eth_5"] = str(random.choice(self.get_schema_list(field="app_eth_5", empty=True)))
-		valid_lar_row["app_eth_free"] = utils.char_string_gen(random.choice(range(100)))
+		valid_lar_row["app_eth_free"] = text["app_eth_free"]
 		valid_lar_row["co_app_eth_1"] = str(random.choice(self.get_schema_list(field="co_app_eth_1", empty=True)))
 		valid_lar_row["co_app_eth_2"] = str(random.choice(self.get_schema_list(field="co_app_eth_2", empty=True)))
 		valid_lar_row["co_app_eth_3"] = str(random.choice(self.get_schema_list(field="co_app_eth_3", empty=True)))
 		valid_lar_row["co_app_eth_4"] = str(random.choice(self.get_schema_list(field="co_app_eth_4", empty=True)))
 		valid_lar_row["co_app_eth_5"] = str(random.choice(self.get_schema_list(field="co_app_eth_5", empty=True)))
-		valid_lar_row["co_app_eth_free"] = utils.char_string_gen(random.choice(range(100)))
+		valid_lar_row["co_app_eth_free"] = text["co_app_eth_free"]
 		valid_lar_row["app_eth_basis"] = str(random.choice(self.get_schema_list(field="app_eth_basis")))
 		valid_lar_row["co_app_eth_basis"] = str(random.choice(self.get_schema_list(field="co_app_eth_basis")))
 		valid_lar_row["app_race_1"] = str(random.choice(self.get_schema_list(field="app_race_1", empty=True)))
@@ -194,17 +180,17 @@ class lar_gen(object):
 		valid_lar_row["app_race_3"] = str(random.choice(self.get_schema_list(field="app_race_3", empty=True)))
 		valid_lar_row["app_race_4"] = str(random.choice(self.get_schema_list(field="app_race_4", empty=True)))
 		valid_lar_row["app_race_5"] = str(random.choice(self.get_schema_list(field="app_race_5", empty=True)))
-		valid_lar_row["app_race_native_text"] = utils.char_string_gen(random.choice(range(100)))
-		valid_lar_row["app_race_asian_text"] = utils.char_string_gen(random.choice(range(100)))
-		valid_lar_row["app_race_islander_text"] = utils.char_string_gen(random.choice(range(100)))
+		valid_lar_row["app_race_native_text"] = text["app_race_native_text"]
+		valid_lar_row["app_race_asian_text"] = text["app_race_asian_text"]
+		valid_lar_row["app_race_islander_text"] = text["app_race_islander_text"]
 		valid_lar_row["co_app_race_1"] = str(random.choice(self.get_schema_list(field="co_app_race_1", empty=True)))
 		valid_lar_row["co_app_race_2"] = str(random.choice(self.get_schema_list(field="co_app_race_2", empty=True)))
 		valid_lar_row["co_app_race_3"] = str(random.choice(self.get_schema_list(field="co_app_race_3", empty=True)))
 		valid_lar_row["co_app_race_4"] = str(random.choice(self.get_schema_list(field="co_app_race_4", empty=True)))
 		valid_lar_row["co_app_race_5"] = str(random.choice(self.get_schema_list(field="co_app_race_5", empty=True)))
-		valid_lar_row["co_app_race_native_text"] = utils.char_string_gen(random.choice(range(100)))
-		valid_lar_row["co_app_race_asian_text"] = utils.char_string_gen(random.choice(range(100)))
-		valid_lar_row["co_app_race_islander_text"] = utils.char_string_gen(random.choice(range(100)))
+		valid_lar_row["co_app_race_native_text"] = text["co_app_race_native_text"]
+		valid_lar_row["co_app_race_asian_text"] = text["co_app_race_asian_text"]
+		valid_lar_row["co_app_race_islander_text"] = text["co_app_race_islander_text"]
 		valid_lar_row["app_race_basis"] = str(random.choice(self.get_schema_list(field="app_race_basis")))
 		valid_lar_row["co_app_race_basis"] = str(random.choice(self.get_schema_list(field="co_app_race_basis")))
 		valid_lar_row["app_sex"] = str(random.choice(self.get_schema_list(field="app_sex")))
@@ -221,14 +207,14 @@ class lar_gen(object):
 		valid_lar_row["app_credit_score"] = str(random.choice(self.range_and_enum(field="app_credit_score", rng_min=lar_file_config["min_credit_score"]["value"], rng_max=lar_file_config["max_credit_score"]["value"])))
 		valid_lar_row["co_app_credit_score"] = str(random.choice(self.range_and_enum(field="co_app_credit_score", rng_min=lar_file_config["min_credit_score"]["value"], rng_max=lar_file_config["max_credit_score"]["value"])))
 		valid_lar_row["app_score_name"] = str(random.choice(self.get_schema_list(field="app_score_name")))
-		valid_lar_row["app_score_code_8"] = str(utils.char_string_gen(random.choice(range(100))))
+		valid_lar_row["app_score_code_8"] = text["app_score_code_8"]
 		valid_lar_row["co_app_score_name"] = str(random.choice(self.get_schema_list(field="co_app_score_name")))
-		valid_lar_row["co_app_score_code_8"] = utils.char_string_gen(random.choice(range(100)))
+		valid_lar_row["co_app_score_code_8"] = text["co_app_score_code_8"]
 		valid_lar_row["denial_1"] = str(random.choice(self.get_schema_list(field="denial_1")))
 		valid_lar_row["denial_2"] = str(random.choice(self.get_schema_list(field="denial_2", empty=True)))
 		valid_lar_row["denial_3"] = str(random.choice(self.get_schema_list(field="denial_3", empty=True)))
 		valid_lar_row["denial_4"] = str(random.choice(self.get_schema_list(field="denial_4", empty=True)))
-		valid_lar_row["denial_code_9"] = utils.char_string_gen(random.choice(range(255)))
+		valid_lar_row["denial_code_9"] = text["denial_code_9"]
 		valid_lar_row["loan_costs"] = str(random.choice(self.range_and_enum(field="loan_costs",rng_max=lar_file_config["loan_costs"]["value"])))
 		valid_lar_row["points_fees"] = str(random.choice(self.range_and_enum(field="points_fees", rng_max=lar_file_config["points_and_fees"]["value"])))
 		valid_lar_row["origination_fee"] = str(random.choice(self.range_and_enum(field="origination_fee", rng_max=lar_file_config["orig_charges"]["value"])))
@@ -251,21 +237,175 @@ class lar_gen(object):
 		valid_lar_row["affordable_units"] = str(random.choice(self.range_and_enum(field="affordable_units", rng_min=0, rng_max=int(valid_lar_row["total_units"]))))
 		valid_lar_row["app_submission"] = str(random.choice(self.get_schema_list(field="app_submission")))
 		valid_lar_row["initially_payable"] = str(random.choice(self.get_schema_list(field="initially_payable")))
-		valid_lar_row["mlo_id"] = utils.char_string_gen(random.choice(range(25)))
+		valid_lar_row["mlo_id"] = text["mlo_id"]
 		valid_lar_row["aus_1"] = str(random.choice(self.get_schema_list(field="aus_1")))
 		valid_lar_row["aus_2"] = str(random.choice(self.get_schema_list(field="aus_2", empty=True)))
 		valid_lar_row["aus_3"] = str(random.choice(self.get_schema_list(field="aus_3", empty=True)))
 		valid_lar_row["aus_4"] = str(random.choice(self.get_schema_list(field="aus_4", empty=True)))
 		valid_lar_row["aus_5"] = str(random.choice(self.get_schema_list(field="aus_5", empty=True)))
-		valid_lar_row["aus_code_5"] = utils.char_string_gen(random.choice(range(255)))
+		valid_lar_row["aus_code_5"] = text["aus_code_5"]
 		valid_lar_row["aus_result_1"] = str(random.choice(self.get_schema_list(field="aus_result_1")))
 		valid_lar_row["aus_result_2"] = str(random.choice(self.get_schema_list(field="aus_result_2", empty=True)))
 		valid_lar_row["aus_result_3"] = str(random.choice(self.get_schema_list(field="aus_result_3", empty=True)))
 		valid_lar_row["aus_result_4"] = str(random.choice(self.get_schema_list(field="aus_result_4", empty=True)))
 		valid_lar_row["aus_result_5"] = str(random.choice(self.get_schema_list(field="aus_result_5", empty=True)))
-		valid_lar_row["aus_code_16"] = utils.char_string_gen(random.choice(range(255)))
+		valid_lar_row["aus_code_16"] = text["aus_code_16"]
 		valid_lar_row["reverse_mortgage"] = str(random.choice(self.get_schema_list(field="reverse_mortgage")))
 		valid_lar_row["open_end_credit"] = str(random.choice(self.get_schema_list(field="open_end_credit")))
 		valid_lar_row["business_purpose"] = str(random.choice(self.get_schema_list(field="business_purpose")))
 
-		return valid_lar_row
\ No newline at end of file
+		return valid_lar_row
+
+	def enum_array(self, n, rng, field=None, empty=False):
+		"""Returns an array of n values drawn uniformly from the schema list for the field."""
+		enums = self.lar_schema.str_vals(field=field, empty=empty)
+		return np.array(enums, dtype=object)[rng.integers(0, len(enums), size=n)]
+
+	def range_and_enum_array(self, n, rng, field=None, rng_min=1, rng_max=100, dtype="int", empty=False):
+		"""
+		Returns an array of n values drawn uniformly from the same selection list as range_and_enum.
+		rng_max may be an array of length n to give each row its own upper bound.
+		"""
+		if np.ndim(rng_max) == 0:
+			return self.range_and_enum(field=field, rng_min=rng_min, rng_max=rng_max, dtype=dtype, empty=empty).sample(n, rng)
+		return self.range_and_enum(field=field, rng_min=rng_min, dtype=dtype, empty=empty).sample(n, rng, rng_max=rng_max)
+
+	def day_ordinals(self, size, rng, activity_year):
+		"""Returns an array of the given size of day of year ordinals drawn uniformly from the activity year, 0 is January 1."""
+		start = np.datetime64("{year}-01-01".format(year=activity_year))
+		days = (np.datetime64("{year}-01-01".format(year=int(activity_year)+1)) - start).astype(int)
+		return rng.integers(0, days, size=size)
+
+	def ordinal_dates(self, ordinals, activity_year):
+		"""Returns an array of YYYYMMDD date strings for day of year ordinals of the activity year."""
+		dates = np.datetime64("{year}-01-01".format(year=activity_year)) + ordinals
+		months = dates.astype("datetime64[M]")
+		date_nums = int(activity_year)*10000 + (months.astype(int) % 12 + 1)*100 + (dates - months).astype(int) + 1
+		return date_nums.astype(str).astype(object)
+
+	def date_array(self, n, rng, activity_year):
+		"""Returns an array of n valid YYYYMMDD date strings drawn uniformly from the activity year."""
+		return self.ordinal_dates(self.day_ordinals(n, rng, activity_year), activity_year)
+
+	def date_pair_array(self, n, rng, activity_year):
+		"""
+		Returns arrays of n application dates and n action dates in the activity year, each action date on or after its application date.
+		Each pair is two ordinals drawn from the year, the earlier one is the application date.
+		"""
+		ordinals = np.sort(self.day_ordinals((n, 2), rng, activity_year), axis=1)
+		return self.ordinal_dates(ordinals[:, 0], activity_year), self.ordinal_dates(ordinals[:, 1], activity_year)
+
+	def char_string_array(self, lengths, rng):
+		"""Returns an array of uppercase alphanumeric strings, one per entry in lengths."""
+		return utils.char_string_array(lengths, rng)
+
+	def make_rows(self, n, lar_file_config, geographic_data, state_codes, zip_code_list, rng=None, conditional=True):
+		"""
+		Makes n LAR rows at once and returns them as a DataFrame with columns in LAR order.
+		Values are drawn from the same selection lists as make_row, sampled column by column with NumPy.
+		rng: numpy Generator used for sampling, a new unseeded Generator is used if none is passed
+		conditional: if True, values breaking a cross-field edit are drawn again from their allowed values with the conditional sampler,
+		if False every field is drawn independently
+		"""
+		if rng is None:
+			rng = np.random.default_rng()
+		year = lar_file_config["activity_year"]["value"]
+		enum = lambda field, empty=False: self.enum_array(n, rng, field=field, empty=empty)
+		ranged = lambda field, **kwargs: self.range_and_enum_array(n, rng, field=field, **kwargs)
+		#free text fields are cut from one block of random characters, split back out by field
+		max_lens = np.array(list(self.text_fields.values()))[:, None]
+		text_values = utils.char_string_array(rng.integers(0, max_lens, size=(len(max_lens), n)).ravel(), rng).reshape(len(max_lens), n)
+		text = OrderedDict(zip(self.text_fields, text_values))
+
+		lar_rows = OrderedDict()
+		lar_rows["record_id"] = enum("record_id")
+		lar_rows["lei"] = np.full(n, lar_file_config["lei"]["value"], dtype=object)
+		lar_rows["uli"] = self.char_string_array(np.full(n, 22), rng)
+		lei_uli = rng.integers(0, 2, size=n)==0 #half of ULIs are built from the LEI with a check digit
+		lar_rows["uli"][lei_uli] = utils.uli_array(lei=lar_file_config["lei"]["value"], n=int(lei_uli.sum()), rng=rng)
+		app_dates, action_dates = self.date_pair_array(n, rng, activity_year=year)
+		lar_rows["app_date"] = app_dates
+		lar_rows["loan_type"] = enum("loan_type")
+		lar_rows["loan_purpose"] = enum("loan_purpose")
+		lar_rows["preapproval"] = enum("preapproval")
+		lar_rows["const_method"] = enum("const_method")
+		lar_rows["occ_type"] = enum("occ_type")
+		lar_rows["loan_amount"] = rng.integers(1, lar_file_config["max_amount"]["value"], size=n).astype(str).astype(object)
+		lar_rows["action_taken"] = enum("action_taken")
+		lar_rows["action_date"] = action_dates
+		street = lar_file_config["street_addy"]["value"]
+		lar_rows["street_address"] = np.array([street, street, "Exempt"], dtype=object)[rng.integers(0, 3, size=n)]
+		lar_rows["city"] = np.full(n, lar_file_config["city"]["value"], dtype=object)
+		lar_rows["state"] = None #placeholder to preserve LAR order
+		lar_rows["zip_code"] = np.array(zip_code_list, dtype=object)[rng.integers(0, len(zip_code_list), size=n)]
+		lar_rows["county"] = None #placeholder to preserve LAR order
+		tracts = pd.Series(np.asarray(geographic_data["tract_fips"], dtype=object)[rng.integers(0, len(geographic_data), size=n)])
+		lar_rows["tract"] = tracts.values
+		lar_rows["state"] = tracts.str[:2].map(state_codes).values
+		lar_rows["county"] = tracts.str[:5].values
+		for prefix in ("app_", "co_app_"):
+			for i in range(1, 6):
+				lar_rows[prefix + "eth_{i}".format(i=i)] = enum(prefix + "eth_{i}".format(i=i), empty=True)
+			lar_rows[prefix + "eth_free"] = text[prefix + "eth_free"]
+		lar_rows["app_eth_basis"] = enum("app_eth_basis")
+		lar_rows["co_app_eth_basis"] = enum("co_app_eth_basis")
+		for prefix in ("app_", "co_app_"):
+			for i in range(1, 6):
+				lar_rows[prefix + "race_{i}".format(i=i)] = enum(prefix + "race_{i}".format(i=i), empty=True)
+			for race_text in ("race_native_text", "race_asian_text", "race_islander_text"):
+				lar_rows[prefix + race_text] = text[prefix + race_text]
+		for field in ("app_race_basis", "co_app_race_basis", "app_sex", "co_app_sex", "app_sex_basis", "co_app_sex_basis"):
+			lar_rows[field] = enum(field)
+		lar_rows["app_age"] = ranged("app_age", rng_max=lar_file_config["max_age"]["value"])
+		lar_rows["co_app_age"] = ranged("co_app_age", rng_max=lar_file_config["max_age"]["value"])
+		lar_rows["income"] = rng.integers(1, lar_file_config["max_income"]["value"], size=n).astype(str).astype(object)
+		lar_rows["purchaser_type"] = enum("purchaser_type")
+		lar_rows["rate_spread"] = ranged("rate_spread", rng_max=lar_file_config["max_rs"]["value"], dtype="float")
+		lar_rows["hoepa"] = enum("hoepa")
+		lar_rows["lien"] = enum("lien")
+		lar_rows["app_credit_score"] = ranged("app_credit_score", rng_min=lar_file_config["min_credit_score"]["value"], rng_max=lar_file_config["max_credit_score"]["value"])
+		lar_rows["co_app_credit_score"] = ranged("co_app_credit_score", rng_min=lar_file_config["min_credit_score"]["value"], rng_max=lar_file_config["max_credit_score"]["value"])
+		lar_rows["app_score_name"] = enum("app_score_name")
+		lar_rows["app_score_code_8"] = text["app_score_code_8"]
+		lar_rows["co_app_score_name"] = enum("co_app_score_name")
+		lar_rows["co_app_score_code_8"] = text["co_app_score_code_8"]
+		lar_rows["denial_1"] = enum("denial_1")
+		for field in ("denial_2", "denial_3", "denial_4"):
+			lar_rows[field] = enum(field, empty=True)
+		lar_rows["denial_code_9"] = text["denial_code_9"]
+		lar_rows["loan_costs"] = ranged("loan_costs", rng_max=lar_file_config["loan_costs"]["value"])
+		lar_rows["points_fees"] = ranged("points_fees", rng_max=lar_file_config["points_and_fees"]["value"])
+		lar_rows["origination_fee"] = ranged("origination_fee", rng_max=lar_file_config["orig_charges"]["value"])
+		lar_rows["discount_points"] = ranged("discount_points", rng_max=lar_file_config["discount_points"]["value"], empty=True)
+		lar_rows["lender_credits"] = ranged("lender_credits", rng_max=lar_file_config["lender_credits"]["value"], empty=True)
+		lar_rows["interest_rate"] = ranged("interest_rate", rng_max=lar_file_config["interest_rate"]["value"], dtype="float")
+		lar_rows["prepayment_penalty"] = ranged("prepayment_penalty", rng_max=lar_file_config["penalty_max"]["value"])
+		lar_rows["dti"] = ranged("dti", rng_max=lar_file_config["dti"]["value"])
+		lar_rows["cltv"] = ranged("cltv", rng_max=lar_file_config["cltv"]["value"])
+		lar_rows["loan_term"] = ranged("loan_term", rng_max=lar_file_config["loan_term"]["value"])
+		lar_rows["intro_rate"] = ranged("intro_rate", rng_max=lar_file_config["intro_rate"]["value"])
+		for field in ("balloon", "int_only_pmts", "neg_amort", "non_amort_features"):
+			lar_rows[field] = enum(field)
+		lar_rows["property_value"] = ranged("property_value", rng_min=lar_file_config["prop_val_min"]["value"], rng_max=lar_file_config["prop_val_max"]["value"])
+		lar_rows["manufactured_type"] = enum("manufactured_type")
+		lar_rows["manufactured_interest"] = enum("manufactured_interest")
+		lar_rows["total_units"] = ranged("total_units", rng_min=1, rng_max=lar_file_config["max_units"]["value"])
+		lar_rows["affordable_units"] = ranged("affordable_units", rng_min=0, rng_max=lar_rows["total_units"].astype(int))
+		lar_rows["app_submission"] = enum("app_submission")
+		lar_rows["initially_payable"] = enum("initially_payable")
+		lar_rows["mlo_id"] = text["mlo_id"]
+		lar_rows["aus_1"] = enum("aus_1")
+		for field in ("aus_2", "aus_3", "aus_4", "aus_5"):
+			lar_rows[field] = enum(field, empty=True)
+		lar_rows["aus_code_5"] = text["aus_code_5"]
+		lar_rows["aus_result_1"] = enum("aus_result_1")
+		for field in ("aus_result_2", "aus_result_3", "aus_result_4", "aus_result_5"):
+			lar_rows[field] = enum(field, empty=True)
+		lar_rows["aus_code_16"] = text["aus_code_16"]
+		lar_rows["reverse_mortgage"] = enum("reverse_mortgage")
+		lar_rows["open_end_credit"] = enum("open_end_credit")
+		lar_rows["business_purpose"] = enum("business_purpose")
+
+		if conditional:
+			self.sampler.apply(lar_rows, rng)
+		return pd.DataFrame(lar_rows, dtype=object)
@@ -0,0 +1,314 @@
+#This file contains a conditional sampling model for LAR rows built from the cross-field rules of the syntax and validity edits.
+#Each rule names the field it draws, the fields it reads and the rows where the field is limited to an allowed set of values.
+#Rules are applied column by column in dependency order: action taken is drawn before preapproval, denial reasons,
+#credit scores and the other fields limited by it, and no rule changes a field after a rule reading it has run.
+#Rows generated this way pass most edits on the first check and the constraint repair loop is left for the rules not modeled here.
+
+import heapq
+
+import numpy as np
+import pandas as pd
+
+#edit codes shared by several rules
+exemption_codes = ("NA", "Exempt")
+eth_codes = ("1", "11", "12", "13", "14", "2")
+race_codes = ("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5")
+race_observed_codes = ("1", "2", "3", "4", "5")
+aus_result_codes = ("1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12", "13", "14", "15", "16", "18", "19", "20",
+	"21", "22", "23", "24")
+
+def isin(values, codes):
+	"""Returns a boolean array marking the entries of values found in codes."""
+	return pd.Series(values, dtype=object).isin(codes).to_numpy()
+
+def numbers(values):
+	"""Returns a float array of values with NaN where a value is not a number."""
+	return pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(dtype=float)
+
+def is_number(values):
+	"""Returns a boolean array marking the entries of values that are numbers."""
+	return ~np.isnan(numbers(values))
+
+class choice_values(object):
+	"""Allowed values drawn uniformly from a list of codes."""
+	def __init__(self, *codes):
+		self.codes = np.array(codes, dtype=object)
+
+	def allowed(self, values):
+		return isin(values, self.codes)
+
+	def sample(self, n, rng, strings):
+		return self.codes[rng.integers(0, len(self.codes), size=n)]
+
+class text_values(object):
+	"""Allowed values are non-blank text of up to max_len characters."""
+	def __init__(self, max_len):
+		self.max_len = max_len
+
+	def allowed(self, values):
+		return np.asarray(values, dtype=object) != ""
+
+	def sample(self, n, rng, strings):
+		return strings(rng.integers(1, self.max_len+1, size=n), rng)
+
+class number_values(object):
+	"""Allowed values are whole numbers from rng_min to rng_max or one of codes."""
+	def __init__(self, rng_min, rng_max, codes=()):
+		self.rng_min = rng_min
+		self.rng_max = rng_max
+		self.codes = codes
+
+	def allowed(self, values):
+		nums = numbers(values)
+		return ((nums >= self.rng_min) & (nums <= self.rng_max) & (nums == np.floor(nums))) | isin(values, self.codes)
+
+	def sample(self, n, rng, strings):
+		return rng.integers(self.rng_min, self.rng_max+1, size=n).astype(str).astype(object)
+
+class sampling_rule(object):
+	"""
+	Limits field to values on the rows where when is True. Rows holding a value that is not allowed are drawn again.
+	edit: name of the edit the rule comes from
+	field: field drawn by the rule
+	given: fields read by when, they are drawn before field
+	when: function of the column dictionary returning a boolean array of the rows the rule applies to
+	values: choice_values, text_values or number_values with the allowed values
+	"""
+	def __init__(self, edit, field, given, when, values):
+		self.edit = edit
+		self.writes = (field,)
+		self.reads = tuple(given)
+		self.field = field
+		self.when = when
+		self.values = values
+
+	def apply(self, cols, rng, strings):
+		redraw = np.asarray(self.when(cols), dtype=bool) & ~self.values.allowed(cols[self.field])
+		if redraw.any():
+			cols[self.field][redraw] = self.values.sample(int(redraw.sum()), rng, strings)
+
+class distinct_rule(object):
+	"""Blanks repeated codes in a group of fields so each code is reported once. The first field is never blanked."""
+	def __init__(self, edit, fields):
+		self.edit = edit
+		self.writes = tuple(fields[1:])
+		self.reads = tuple(fields[:1])
+		self.fields = fields
+
+	def apply(self, cols, rng, strings):
+		for i in range(1, len(self.fields)):
+			column = cols[self.fields[i]]
+			repeated = np.zeros(len(column), dtype=bool)
+			for earlier in self.fields[:i]:
+				repeated |= (column == cols[earlier])
+			column[repeated & (column != "")] = ""
+
+def lar_rules():
+	"""Returns the sampling rules of the LAR edits in declaration order. Rules drawing the same field are applied in this order."""
+	rules = []
+	def rule(edit, field, given, when, *codes):
+		values = codes[0] if len(codes) == 1 and not isinstance(codes[0], str) else choice_values(*codes)
+		rules.append(sampling_rule(edit, field, given, when, values))
+
+	#loan purpose, reverse mortgage, open-end credit and affordable units limit action taken to rows that allow preapproval 2
+	rule("v692_2", "affordable_units", ("total_units",), lambda c: numbers(c["total_units"]) < 5, *exemption_codes)
+	no_preapproval = lambda c: (~isin(c["loan_purpose"], ("1",)) | is_number(c["affordable_units"]) |
+		(c["reverse_mortgage"]=="1") | (c["open_end_credit"]=="1"))
+	preapproval_given = ("loan_purpose", "affordable_units", "reverse_mortgage", "open_end_credit")
+	rule("v613_2", "action_taken", preapproval_given, no_preapproval, "1", "2", "3", "4", "5", "6")
+	rule("v613_2", "preapproval", ("action_taken",), lambda c: isin(c["action_taken"], ("7", "8")), "1")
+	rule("v613_3", "preapproval", ("action_taken",), lambda c: isin(c["action_taken"], ("3", "4", "5", "6")), "2")
+	rule("v614_1", "preapproval", preapproval_given, no_preapproval, "2")
+	rule("v610_2", "app_date", ("action_taken",), lambda c: c["action_taken"]=="6", "NA")
+
+	#the exemption election fields are all 1111 or none are
+	for field in ("int_only_pmts", "neg_amort", "non_amort_features"):
+		rule("v715", field, ("balloon",), lambda c: c["balloon"]=="1111", "1111")
+		rule("v715", field, ("balloon",), lambda c: c["balloon"]!="1111", "1", "2")
+	rule("v693_2", "app_submission", ("action_taken",), lambda c: c["action_taken"]=="6", "1111", "3")
+	rule("v693_3", "app_submission", ("action_taken",), lambda c: c["action_taken"]!="6", "1111", "1", "2")
+	rule("v714", "initially_payable", ("app_submission",), lambda c: c["app_submission"]=="1111", "1111")
+	not_exempt = lambda c: c["app_submission"]!="1111"
+	rule("v694_2", "initially_payable", ("app_submission", "action_taken"), lambda c: not_exempt(c) & (c["action_taken"]=="6"), "3")
+	rule("v694_3", "initially_payable", ("app_submission", "action_taken"), lambda c: not_exempt(c) & (c["action_taken"]=="1"),
+		"1", "2")
+	rule("v714", "initially_payable", ("app_submission",), not_exempt, "1", "2", "3")
+	for field in ("city", "zip_code"):
+		rule("v709", field, ("street_address",), lambda c: c["street_address"]=="Exempt", "Exempt")
+
+	#fields that must be NA or Exempt for action taken, reverse mortgage, open-end credit and business purpose
+	not_originated = lambda c: isin(c["action_taken"], ("2", "3", "4", "5", "7", "8"))
+	no_costs = lambda c: not_originated(c) | (c["reverse_mortgage"]=="1") | (c["open_end_credit"]=="1") | (c["business_purpose"]=="1")
+	costs_given = ("action_taken", "reverse_mortgage", "open_end_credit", "business_purpose")
+	rule("v672", "loan_costs", costs_given, no_costs, *exemption_codes)
+	for edit, field in (("v674", "origination_fee"), ("v675", "discount_points"), ("v676", "lender_credits")):
+		rule(edit, field, costs_given, no_costs, *exemption_codes)
+	rule("v712", "points_fees", ("loan_costs",), lambda c: c["loan_costs"]=="Exempt", "Exempt")
+	rule("v673_5", "points_fees", ("loan_costs",), lambda c: is_number(c["loan_costs"]), "NA")
+	points_given = ("loan_costs", "action_taken", "reverse_mortgage", "business_purpose")
+	rule("v673", "points_fees", points_given, lambda c: (c["loan_costs"]=="NA") & (isin(c["action_taken"], ("2", "3", "4", "5", "6",
+		"7", "8")) | (c["reverse_mortgage"]=="1") | (c["business_purpose"]=="1") | (c["points_fees"]=="Exempt")), "NA")
+	rule("v656_2", "purchaser_type", ("action_taken",), not_originated, "0")
+	rule("v658_2", "hoepa", ("action_taken",), not_originated, "3")
+	rule("v657", "rate_spread", ("action_taken", "reverse_mortgage"), lambda c: isin(c["action_taken"], ("3", "4", "5", "6", "7")) |
+		(c["reverse_mortgage"]=="1"), *exemption_codes)
+	rule("v677_2", "interest_rate", ("action_taken",), lambda c: isin(c["action_taken"], ("3", "4", "5", "7")), *exemption_codes)
+	rule("v682_2", "loan_term", ("reverse_mortgage",), lambda c: c["reverse_mortgage"]=="1", *exemption_codes)
+	rule("v678", "prepayment_penalty", ("action_taken", "reverse_mortgage", "business_purpose"), lambda c: (c["action_taken"]=="6") |
+		(c["reverse_mortgage"]=="1") | (c["business_purpose"]=="1"), *exemption_codes)
+	rule("v678_5", "prepayment_penalty", ("loan_term",), lambda c: numbers(c["prepayment_penalty"]) > numbers(c["loan_term"]), "NA")
+	rule("v679", "dti", ("action_taken", "affordable_units"), lambda c: isin(c["action_taken"], ("4", "5", "6")) |
+		is_number(c["affordable_units"]), *exemption_codes)
+	rule("v681_2", "cltv", ("action_taken",), lambda c: isin(c["action_taken"], ("4", "5", "6")), *exemption_codes)
+	rule("v688_2", "property_value", ("action_taken",), lambda c: isin(c["action_taken"], ("4", "5")), *exemption_codes)
+	rule("v654_2", "income", ("affordable_units",), lambda c: is_number(c["affordable_units"]), "NA")
+	rule("v695", "mlo_id", (), lambda c: np.ones(len(c["mlo_id"]), dtype=bool), number_values(1, 9999999, codes=exemption_codes))
+
+	#manufactured home fields follow construction method and affordable units
+	site_built = lambda c: (c["const_method"]=="1") | is_number(c["affordable_units"])
+	rule("v689", "manufactured_type", ("const_method", "affordable_units"), site_built, "1111", "3")
+	rule("v690", "manufactured_interest", ("const_method", "affordable_units"), site_built, "1111", "5")
+
+	#credit scores, scoring model names and the code 8 text
+	for prefix, edit in (("app_", "v663"), ("co_app_", "v664")):
+		rule(edit, prefix+"credit_score", ("action_taken",), lambda c: isin(c["action_taken"], ("4", "5", "6")), "8888")
+	rule("v710_1", "co_app_credit_score", ("app_credit_score",), lambda c: c["app_credit_score"]=="1111", "1111")
+	for prefix, edits in (("app_", ("v661", "v662")), ("co_app_", ("v666", "v667"))):
+		score, name = prefix+"credit_score", prefix+"score_name"
+		rule(edits[0], name, (score,), lambda c, score=score: c[score]=="8888", "9")
+		rule(edits[0], name, (score,), lambda c, score=score: c[score]=="9999", "10")
+		rule(edits[0], name, (score,), lambda c, score=score: c[score]=="1111", "1111")
+		rule(edits[0], name, (score,), lambda c, score=score: ~isin(c[score], ("8888", "9999", "1111")),
+			"1", "2", "3", "4", "5", "6", "7", "8")
+		rule(edits[1], prefix+"score_code_8", (name,), lambda c, name=name: c[name]=="8", text_values(100))
+		rule(edits[1], prefix+"score_code_8", (name,), lambda c, name=name: c[name]!="8", "")
+
+	#reasons for denial and the code 9 text
+	denied = lambda c: isin(c["action_taken"], ("3", "7"))
+	rule("v670_1", "denial_1", ("action_taken",), denied, "1", "2", "3", "4", "5", "6", "7", "8", "9")
+	rule("v670_3", "denial_1", ("action_taken",), lambda c: ~denied(c), "1111", "10")
+	for field in ("denial_2", "denial_3", "denial_4"):
+		rule("v669_4", field, ("denial_1",), lambda c: isin(c["denial_1"], ("10", "1111")), "")
+	rules.append(distinct_rule("v669_3", ["denial_1", "denial_2", "denial_3", "denial_4"]))
+	denials = ("denial_1", "denial_2", "denial_3", "denial_4")
+	other_denial = lambda c: np.logical_or.reduce([c[field]=="9" for field in denials])
+	rule("v671_1", "denial_code_9", denials, other_denial, text_values(255))
+	rule("v671_2", "denial_code_9", denials, lambda c: ~other_denial(c), "")
+
+	#ethnicity, race and sex follow the basis of visual observation or surname
+	for prefix, edits in (("app_", ("v629", "v628")), ("co_app_", ("v632", "v631"))):
+		basis, first = prefix+"eth_basis", prefix+"eth_1"
+		rule(edits[0], first, (basis,), lambda c, basis=basis: c[basis]=="1", "1", "2")
+		rule(edits[0], first, (basis,), lambda c, basis=basis: c[basis]=="2", *(eth_codes+("3",)))
+		rule(edits[0], first, (basis,), lambda c, basis=basis: c[basis]=="3", *(eth_codes+("3", "4")))
+		rule(edits[0], first, (basis,), lambda c, basis=basis: c[basis]=="4", "5")
+		others = [prefix+"eth_{i}".format(i=i) for i in range(2, 6)]
+		for field in others:
+			rule(edits[1], field, (first,), lambda c, first=first: isin(c[first], ("3", "4", "5")), "")
+			if field != others[0]:
+				rule(edits[0], field, (basis,), lambda c, basis=basis: c[basis]=="1", "")
+		#the second code of an observed ethnicity is the one of 1 and 2 not reported first, blank is allowed for applicants only
+		second = ("1", "2", "") if prefix == "app_" else ("1", "2")
+		rule(edits[0], others[0], (basis, first), lambda c, basis=basis, first=first: (c[basis]=="1") & (c[first]=="1"),
+			*[code for code in second if code != "1"])
+		rule(edits[0], others[0], (basis, first), lambda c, basis=basis, first=first: (c[basis]=="1") & (c[first]=="2"),
+			*[code for code in second if code != "2"])
+		rules.append(distinct_rule(edits[1]+"_3", [first]+others))
+	for prefix, edits in (("app_", ("v636", "v635")), ("co_app_", ("v639", "v638"))):
+		basis, first = prefix+"race_basis", prefix+"race_1"
+		rule(edits[0], first, (basis,), lambda c, basis=basis: c[basis]=="1", *race_observed_codes)
+		rule(edits[0], first, (basis,), lambda c, basis=basis: c[basis]=="2", *(race_codes+("6",)))
+		rule(edits[0], first, (basis,), lambda c, basis=basis: c[basis]=="3", *(race_codes+("6", "7")))
+		rule(edits[0], first, (basis,), lambda c, basis=basis: c[basis]=="4", "8")
+		others = [prefix+"race_{i}".format(i=i) for i in range(2, 6)]
+		for field in others:
+			rule(edits[1], field, (first,), lambda c, first=first: isin(c[first], ("6", "7", "8")), "")
+			rule(edits[0], field, (basis,), lambda c, basis=basis: c[basis]=="1", *(race_observed_codes+("",)))
+		rules.append(distinct_rule(edits[1]+"_3", [first]+others))
+	for prefix, edits in (("app_", ("v643", "v644_1", "v645")), ("co_app_", ("v647", "v648_1", "v649"))):
+		basis, sex = prefix+"sex_basis", prefix+"sex"
+		rule(edits[0], sex, (basis,), lambda c, basis=basis: c[basis]=="1", "1", "2")
+		rule(edits[1], sex, (basis,), lambda c, basis=basis: c[basis]=="2", "1", "2", "3", "6")
+		rule(edits[2], sex, (basis,), lambda c, basis=basis: c[basis]=="3", "1", "2", "3", "4", "6")
+		rule("v650", sex, (basis,), lambda c, basis=basis: c[basis]=="4", "5")
+
+	#automated underwriting systems and results are reported in pairs
+	rule("v704_1", "aus_1", ("action_taken",), lambda c: c["action_taken"]=="6", "1111", "6")
+	rule("v713_1", "aus_result_1", ("aus_1",), lambda c: c["aus_1"]=="1111", "1111")
+	rule("v700_1", "aus_result_1", ("aus_1",), lambda c: c["aus_1"]=="6", "17")
+	rule("v700_2", "aus_result_1", ("aus_1",), lambda c: ~isin(c["aus_1"], ("1111", "6")), *aus_result_codes)
+	for i in range(2, 6):
+		aus, result = "aus_{i}".format(i=i), "aus_result_{i}".format(i=i)
+		rule("v713_2", aus, ("aus_1",), lambda c: isin(c["aus_1"], ("1111", "6")), "")
+		rule("v701", result, (aus,), lambda c, aus=aus: c[aus]=="", "")
+		rule("v696_3", result, (aus,), lambda c, aus=aus: c[aus]!="", *aus_result_codes)
+	aus_fields = ["aus_{i}".format(i=i) for i in range(1, 6)]
+	result_fields = ["aus_result_{i}".format(i=i) for i in range(1, 6)]
+	other_aus = lambda c: np.logical_or.reduce([c[field]=="5" for field in aus_fields])
+	other_result = lambda c: np.logical_or.reduce([c[field]=="16" for field in result_fields])
+	rule("v702_1", "aus_code_5", aus_fields, other_aus, text_values(255))
+	rule("v702_2", "aus_code_5", aus_fields, lambda c: ~other_aus(c), "")
+	rule("v703_1", "aus_code_16", result_fields, other_result, text_values(255))
+	rule("v703_2", "aus_code_16", result_fields, lambda c: ~other_result(c), "")
+	return rules
+
+def order_rules(rules):
+	"""
+	Returns rules sorted so that every rule drawing a field comes before the rules reading it.
+	Rules drawing the same field keep their declaration order. Ties are broken by declaration order.
+	Raises ValueError if the rules read and draw fields in a cycle.
+	"""
+	writers = {}
+	for number, rule in enumerate(rules):
+		for field in rule.writes:
+			writers.setdefault(field, []).append(number)
+	after = [set() for rule in rules]
+	for field, numbers in writers.items():
+		for earlier, later in zip(numbers, numbers[1:]):
+			after[earlier].add(later)
+	for number, rule in enumerate(rules):
+		for field in rule.reads:
+			for writer in writers.get(field, []):
+				if writer != number and field not in rule.writes:
+					after[writer].add(number)
+	waiting = [0] * len(rules)
+	for later in after:
+		for number in later:
+			waiting[number] += 1
+	ready = [number for number in range(len(rules)) if waiting[number] == 0]
+	heapq.heapify(ready)
+	ordered = []
+	while ready:
+		number = heapq.heappop(ready)
+		ordered.append(rules[number])
+		for later in after[number]:
+			waiting[later] -= 1
+			if waiting[later] == 0:
+				heapq.heappush(ready, later)
+	if len(ordered) < len(rules):
+		cycle = sorted(set(rules[number].edit for number in range(len(rules)) if waiting[number] > 0))
+		raise ValueError("sampling rules read and draw fields in a cycle: {edits}".format(edits=", ".join(cycle)))
+	return ordered
+
+class conditional_sampler(object):
+	"""
+	Redraws LAR columns so that cross-field edits hold, applying the rules in dependency order.
+	Functions:
+	- apply
+	"""
+	def __init__(self, strings, rules=None):
+		"""
+		strings: function taking an array of lengths and a numpy Generator and returning random text of those lengths
+		rules: sampling rules, the LAR edit rules from lar_rules are used if None
+		"""
+		self.strings = strings
+		self.rules = order_rules(lar_rules() if rules is None else rules)
+
+	def apply(self, cols, rng):
+		"""
+		Redraws the values of cols that break a rule. cols is a dictionary of field name to numpy object array and is modified in place.
+		rng: numpy Generator used for the new draws
+		"""
+		for rule in self.rules:
+			rule.apply(cols, rng, self.strings)
+		return cols
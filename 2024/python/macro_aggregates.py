@@ -0,0 +1,105 @@
+#This file contains the counts used by the macro edits, computed in one pass over the LAR data.
+#Counts from chunks or shards of a file can be merged and the macro thresholds are checked from the merged counts,
+#so the rules engine and the stream validator use the same threshold logic.
+
+import numpy as np
+
+#rows counted by each macro edit and reported when the edit fails
+macro_filters = {
+	"m634": lambda lar_df: (lar_df.action_taken=="1")&(lar_df.loan_purpose=="1"),
+	"m635": lambda lar_df: lar_df.action_taken=="2",
+	"m636": lambda lar_df: lar_df.action_taken=="4",
+	"m637": lambda lar_df: lar_df.action_taken=="5",
+	"m638": lambda lar_df: lar_df.action_taken.isin(["1","2","3","4","5","6"]),
+	"m639": lambda lar_df: lar_df.preapproval=="1",
+	"m640": lambda lar_df: lar_df.income!="NA",
+	"m646": lambda lar_df: exemption_mask(lar_df),
+	"m647": lambda lar_df: exemption_mask(lar_df),
+}
+
+def exemption_mask(lar_df):
+	"""Returns a boolean array marking rows with an exemption code (Exempt or 1111) in any field."""
+	values = lar_df.to_numpy(dtype=object)
+	return ((values=="Exempt")|(values=="1111")).any(axis=1)
+
+class macro_aggregate(object):
+	"""
+	Counts of LAR rows used to check the macro edits.
+	Functions:
+	- from_lar
+	- merge
+	- failed_edits
+	- fails
+	"""
+	def __init__(self, rows=0, action_taken=None, purchase_originations=0, preapprovals=0, income_under_10=0,
+		exemption_rows=0):
+		"""
+		rows: number of LAR rows
+		action_taken: dictionary of action taken value to row count
+		purchase_originations: rows with action taken 1 and loan purpose 1
+		preapprovals: rows with preapproval 1
+		income_under_10: rows with a numeric income below 10
+		exemption_rows: rows with an exemption code in any field
+		"""
+		self.rows = rows
+		self.action_taken = action_taken if action_taken is not None else {}
+		self.purchase_originations = purchase_originations
+		self.preapprovals = preapprovals
+		self.income_under_10 = income_under_10
+		self.exemption_rows = exemption_rows
+
+	@classmethod
+	def from_lar(cls, lar_df, typed):
+		"""
+		Counts the rows of lar_df.
+		typed: lar_columns views of lar_df, used for the numeric income values
+		"""
+		action_taken = typed.values("action_taken")
+		actions, action_counts = np.unique(action_taken.astype(str), return_counts=True)
+		return cls(rows=len(lar_df), action_taken=dict(zip(actions.tolist(), action_counts.tolist())),
+			purchase_originations=int(((action_taken=="1")&(typed.values("loan_purpose")=="1")).sum()),
+			preapprovals=int((typed.values("preapproval")=="1").sum()),
+			income_under_10=int((typed.numbers("income") < 10).sum()),
+			exemption_rows=int(exemption_mask(lar_df).sum()))
+
+	def merge(self, other):
+		"""Returns the counts of the rows counted by this aggregate and by other."""
+		action_taken = dict(self.action_taken)
+		for action, count in other.action_taken.items():
+			action_taken[action] = action_taken.get(action, 0) + count
+		return macro_aggregate(rows=self.rows+other.rows, action_taken=action_taken,
+			purchase_originations=self.purchase_originations+other.purchase_originations,
+			preapprovals=self.preapprovals+other.preapprovals, income_under_10=self.income_under_10+other.income_under_10,
+			exemption_rows=self.exemption_rows+other.exemption_rows)
+
+	def fails(self, edit_name, federal_agency=None):
+		"""
+		Returns True if the counts fail the macro edit edit_name.
+		federal_agency: agency code from the TS row, used by m647
+		"""
+		rows = self.rows
+		actions = self.action_taken
+		if edit_name == "m634":
+			return rows > 25 and (self.purchase_originations * 1.0) / rows > .95
+		if edit_name == "m635":
+			return rows > 0 and (actions.get("2", 0) * 1.0) / rows > .15
+		if edit_name == "m636":
+			return rows > 0 and (actions.get("4", 0) * 1.0) / rows > .30
+		if edit_name == "m637":
+			return rows > 0 and (actions.get("5", 0) * 1.0) / rows > .15
+		if edit_name == "m638":
+			applications = sum(actions.get(action, 0) for action in ["1","2","3","4","5","6"])
+			return applications > 0 and (actions.get("1", 0) * 1.0) / applications < .20
+		if edit_name == "m639":
+			return self.preapprovals > 1000 and actions.get("7", 0) < 1
+		if edit_name == "m640":
+			return rows > 0 and (self.income_under_10 * 1.0) / rows > .20
+		if edit_name == "m646":
+			return self.exemption_rows > 0
+		if edit_name == "m647":
+			return federal_agency == "7" and self.exemption_rows > 0
+		raise ValueError("{edit} is not a macro edit".format(edit=edit_name))
+
+	def failed_edits(self, edit_names=macro_filters, federal_agency=None):
+		"""Returns the names in edit_names of the macro edits failed by the counts."""
+		return [edit_name for edit_name in edit_names if self.fails(edit_name, federal_agency=federal_agency)]
@@ -0,0 +1,71 @@
+#This script times the draws from the numeric range fields of a LAR row and measures the memory they allocate.
+#It compares building the selection list of schema values and range values for every row, as lar_gen did before
+#schema indexing, and drawing from the built tuple with drawing from a range_spec, which computes the drawn value only.
+#Run from the repository root: python 2024/python/range_benchmark.py
+
+import random
+import timeit
+import tracemalloc
+
+import numpy as np
+import yaml
+
+from schema_index import load_schema
+
+lar_config_file = '2024/python/configurations/clean_file_config.yaml'
+lar_schema_file = "2024/schemas/lar_schema.json"
+rows = 20 #rows timed for the list build, it takes milliseconds per row
+spec_rows = 10000 #rows timed for the range_spec draws
+batch_rows = 100000 #rows drawn at once with range_spec.sample
+
+with open(lar_config_file, 'r') as f:
+	lar_file_config = yaml.safe_load(f)
+
+lar_schema = load_schema(lar_schema_file)
+#range fields of make_row with the largest ranges
+fields = [("property_value", lar_file_config["prop_val_min"]["value"], lar_file_config["prop_val_max"]["value"], False),
+	("loan_costs", 1, lar_file_config["loan_costs"]["value"], False),
+	("points_fees", 1, lar_file_config["points_and_fees"]["value"], False),
+	("discount_points", 1, lar_file_config["discount_points"]["value"], True)]
+
+def build_list(field, rng_min, rng_max, empty):
+	"""Builds the selection list as range_and_enum did before range_spec."""
+	vals = list(lar_schema.valid_vals(field=field))
+	vals.extend(range(rng_min, rng_max))
+	if empty:
+		vals.append("")
+	return vals
+
+def list_draws():
+	for row in range(rows):
+		for field, rng_min, rng_max, empty in fields:
+			str(random.choice(build_list(field, rng_min, rng_max, empty)))
+
+def spec_draws():
+	for row in range(spec_rows):
+		for field, rng_min, rng_max, empty in fields:
+			str(random.choice(lar_schema.range_and_enum(field=field, rng_min=rng_min, rng_max=rng_max, empty=empty)))
+
+def batch_draws():
+	rng = np.random.default_rng(0)
+	for field, rng_min, rng_max, empty in fields:
+		lar_schema.range_and_enum(field=field, rng_min=rng_min, rng_max=rng_max, empty=empty).sample(batch_rows, rng)
+
+def peak_bytes(func):
+	"""Returns the largest amount of memory held at once while func runs."""
+	tracemalloc.start()
+	func()
+	peak = tracemalloc.get_traced_memory()[1]
+	tracemalloc.stop()
+	return peak
+
+print("range fields:", ", ".join("{field} ({count} values)".format(field=field, count=len(lar_schema.range_and_enum(field=field,
+	rng_min=rng_min, rng_max=rng_max, empty=empty))) for field, rng_min, rng_max, empty in fields))
+tuple_bytes = peak_bytes(lambda: [tuple(build_list(*field)) for field in fields])
+print("built tuples held for the run: {mb:.1f} MB".format(mb=tuple_bytes / 1e6))
+#per row draws free each row's allocations before the next row, so their peak is the allocation of one row
+for name, func, func_rows, peak_rows in (("list built per row", list_draws, rows, 1), ("range_spec per row", spec_draws, spec_rows, 1),
+	("range_spec.sample batch", batch_draws, batch_rows, batch_rows)):
+	seconds = min(timeit.repeat(func, number=1, repeat=3))
+	print("{name}: {per_row:.3f} microseconds per row, {kb:.3f} KB peak allocation per row".format(name=name,
+		per_row=seconds / func_rows * 1e6, kb=peak_bytes(func) / peak_rows / 1e3))
@@ -6,14 +6,50 @@
 from collections import OrderedDict
 from datetime import datetime
 import json
+import multiprocessing
+import re
 import string
 import time
 import yaml
 
+import numpy as np
 import pandas as pd
 
+from edit_registry import edit, register_edits
+from edit_results import edit_results
+from geo_index import geo_index_for
+from lar_columns import lar_columns, NA, EXEMPT, BLANK
+from macro_aggregates import macro_aggregate, macro_filters
+from schema_index import load_schema
 import utils
 
+#rules_engine and its loaded LAR data copied into each worker process by the pool initializer
+_worker_engine = None
+_worker_lar_df = None
+
+def _init_worker(engine):
+	"""Stores the rules engine sent to a worker process and the LAR data loaded in it."""
+	global _worker_engine, _worker_lar_df
+	_worker_engine = engine
+	_worker_lar_df = engine.lar_df
+
+def _run_edit_partition(task):
+	"""
+	Runs edits on a row range of the loaded LAR data in a worker process. task is a tuple of (start, stop, edit names).
+	Returns a dictionary of edit name to the edit_result tuples it added, without the ULI array of the rows.
+	"""
+	start, stop, names = task
+	engine = _worker_engine
+	engine.lar_df = _worker_lar_df.iloc[start:stop]
+	engine.reset_results()
+	partition_results = {}
+	for name in names:
+		start_result = len(engine.results)
+		getattr(engine, name)()
+		partition_results[name] = [result._replace(rows=None) for result in engine.results.entries(start_result)]
+	return partition_results
+
+@register_edits
 class rules_engine(object):
 	"""
 	Contains the business rules of the HMDA Platform for a given year
@@ -32,24 +68,25 @@ class rules_engine(object):
 		self.state_codes = state_codes
 		self.state_codes_rev = state_codes_rev
 		self.geographic_data = geographic_data
+		self.geo_index = geo_index_for(geographic_data) #hashed tract and county lookups shared with lar_data_constraints
 		print("opening json schema files")
 
-		with open(lar_schema_file, 'r') as f:
-			lar_schema_json = json.load(f)
-		self.lar_schema_df = pd.DataFrame(lar_schema_json)
-
-		with open(ts_schema_file, 'r') as f:
-			ts_schema_json = json.load(f)
-		self.ts_schema_df = pd.DataFrame(ts_schema_json)
+		#schema indexes are shared with lar_gen and lar_data_constraints
+		self.lar_schema = load_schema(lar_schema_file)
+		self.ts_schema = load_schema(ts_schema_file)
+		self.lar_schema_df = self.lar_schema.schema_df
+		self.ts_schema_df = self.ts_schema.schema_df
 
 		print("schema loaded")
-		self.results = []
-
-		self.svq_edit_functions = []
-
-		for func in dir(self):
-			if func[:1] in ("s", "v", "q") and func[1:4].isdigit()==True:
-				self.svq_edit_functions.append(func)
+		self.results = edit_results() #bit-packed fail flags of each edit, see edit_results.py
+
+		#edit functions are registered with the edit decorator, dispatch lists are built on first use
+		self._edit_lists = {}
+		self._edit_results = {} #results of the last run of each edit, used by revalidate
+		self._typed = None #typed columns of the loaded LAR data, see the typed property
+		self._macro = None #macro edit counts of the loaded LAR data, see the macro property
+		self.file_lei = None #LEI of the first row of the file for v609 when LAR data is loaded in chunks
+		self.svq_edit_functions = [edit_func.__name__ for edit_func in self.edits(categories=("s", "v", "q"))]
 		print("rules engine finished initializing")
 
 
@@ -58,7 +95,7 @@ class rules_engine(object):
 		Takes a dataframe of LAR data and stores it as a class variable.
 		attempts a converstion to dataframe if passed object is not a dataframe
 		"""
-		if type(lar_df) != "pandas.core.frame.DataFrame":
+		if not isinstance(lar_df, pd.DataFrame):
 	
 			try: 
 				lar_df = pd.DataFrame(lar_df, index=[0])
@@ -70,6 +107,26 @@ class rules_engine(object):
 		else:
 			self.lar_df = lar_df
 
+	@property
+	def typed(self):
+		"""
+		Returns lar_columns views of the loaded LAR data, with float values and NA/Exempt/blank masks for numeric fields.
+		The views are rebuilt when a different DataFrame is loaded. Data changed in place after loading is not seen.
+		"""
+		if self._typed is None or self._typed.lar_df is not self.lar_df:
+			self._typed = lar_columns(self.lar_df)
+		return self._typed
+
+	@property
+	def macro(self):
+		"""
+		Returns the macro_aggregate counts of the loaded LAR data used by the macro edits.
+		The counts are computed once for each loaded DataFrame.
+		"""
+		if self._macro is None or self._macro[0] is not self.lar_df:
+			self._macro = (self.lar_df, macro_aggregate.from_lar(self.lar_df, self.typed))
+		return self._macro[1]
+
 	def load_ts_data(self, ts_df):
 		"""
 		Takes a dataframe of TS data and stores it as a class variable. TS data must be a single row.
@@ -84,79 +141,147 @@ class rules_engine(object):
 
 	def reset_results(self):
 		"""
-		Resets results list to empty.
+		Resets results to empty.
 		"""
-		self.results = []
+		self.results = edit_results()
 
 	def split_ts_row(self, data_file, load=True):
 		"""
 		Separates TS and LAR portions of a file and returns each as a dataframe.
 		"""
 
-		with open(data_file, 'r') as infile:
-			ts_row = infile.readline().strip("\n")
-			ts_data = []
-			ts_data.append(ts_row.split("|"))
-
-			lar_rows = infile.readlines()
-			lar_data = [line.strip("\n").split("|") for line in lar_rows]
-
-			ts_df = pd.DataFrame(data=ts_data, dtype=object, columns=list(self.ts_schema_df.field))
-			lar_df  = pd.DataFrame(data=lar_data, dtype=object, columns=list(self.lar_schema_df.field))
+		ts_df, lar_df = utils.read_hmda_file(data_file, lar_fields=list(self.lar_schema.fields), ts_fields=list(self.ts_schema.fields))
 		if load == True:	
 			self.lar_df = lar_df
 			self.ts_df = ts_df
 		
 		return ts_df, lar_df
 
-	def create_edit_report(self, rules_list=["s","v"]):
+	def create_edit_report(self, rules_list=["s","v"], workers=1):
 		"""
-		Uses the self.results list generated by results wrapper to create a dataframe showing:
+		Uses the self.results store filled by results wrapper to create a dataframe showing:
 		edit_name
 		fail_count
 		row_type
 		data_fields
 		Row IDS (as ULI or TS)
 		"""
-		rules = dir(self)
-		rules = [rule for rule in rules if rule[:1] in rules_list]
-		for rule in rules:
-			if rule[:1] in rules_list and rule[1:4].isdigit()==True:
-				getattr(self, rule)()
-		res_df = pd.DataFrame(self.results)
-		return res_df
+		return self.run_edits(rules_list=rules_list, workers=workers).report_df()
+
+	def run_edits(self, rules_list=["s","v"], workers=1):
+		"""
+		Runs the edits in rules_list and returns the edit_results store without building ULI lists.
+		workers: number of processes used to run the edits, see run_edits_parallel
+		"""
+		if workers > 1 and len(self.lar_df) > 0:
+			return self.run_edits_parallel(rules_list=rules_list, workers=workers)
+		for edit_func in self.edits(categories=rules_list):
+			self.run_edit(edit_func)
+		return self.results
+
+	def run_edits_parallel(self, rules_list=["s","v"], workers=2):
+		"""
+		Runs the edits in rules_list in workers processes and returns the edit_results store.
+		The loaded LAR data is split into one row range per worker and each range is checked with all row-local edits.
+		File-level edits (duplicate checks, macro and TS edits) run on the whole file as one more task in the pool.
+		Worker processes are forked where available so they read the loaded data from memory shared with this process.
+		Results are stored in the same order as a serial run.
+		"""
+		names = [edit_func.__name__ for edit_func in self.edits(categories=rules_list)]
+		row_local = [name for name in names if not self.edit_registry[name].file_level]
+		file_level = [name for name in names if self.edit_registry[name].file_level]
+		#row ranges start at multiples of 8 so packed fail flags of the ranges can be joined without unpacking
+		row_count = len(self.lar_df)
+		bounds = sorted(set(min(row_count, (row_count*i//workers + 7)//8*8) for i in range(workers)) | {row_count})
+		tasks = [(start, stop, row_local) for start, stop in zip(bounds, bounds[1:])] + [(0, row_count, file_level)]
+
+		#generation scripts run at module level, fork keeps workers from re-running them where it is available
+		start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+		pool = multiprocessing.get_context(start_method).Pool(workers, initializer=_init_worker, initargs=(self,))
+		try:
+			partitions = pool.map(_run_edit_partition, tasks)
+		finally:
+			pool.close()
+			pool.join()
+
+		rows = self.typed.values("uli")
+		for name in names:
+			parts = [partition[name] for partition in partitions if name in partition]
+			merged = []
+			for results in zip(*parts):
+				result = results[0]
+				if result.bits is not None:
+					result = result._replace(rows=rows, bits=np.concatenate([part.bits for part in results]),
+						fail_count=sum(part.fail_count for part in results))
+				merged.append(result)
+			self._edit_results[name] = merged
+			self.results.extend(merged)
+		return self.results
+
+	def run_edit(self, edit_func):
+		"""Runs an edit function and stores the results it added for use by revalidate."""
+		start = len(self.results)
+		edit_func()
+		self._edit_results[edit_func.__name__] = self.results.entries(start)
+
+	def revalidate(self, changed_fields, rules_list=["s","v"]):
+		"""
+		Re-runs only the edits that read one of changed_fields and returns the merged edit_results store.
+		Results for the other edits are taken from the last run, limited to the ULIs in the loaded LAR data.
+		The loaded LAR data must be the rows of the last run or a subset of them after modification.
+		A changed ULI re-runs all edits as ULIs identify failed rows.
+		"""
+		changed_fields = set(changed_fields)
+		rows = self.typed.values("uli")
+		loaded_rows = pd.Index(rows)
+		self.results = edit_results()
+		for edit_func in self.edits(categories=rules_list):
+			fields = self.edit_registry[edit_func.__name__].fields
+			previous = self._edit_results.get(edit_func.__name__)
+			if previous is None or "uli" in changed_fields or fields == "all" or changed_fields.intersection(fields):
+				self.run_edit(edit_func)
+			else:
+				kept = []
+				for result in previous:
+					if result.bits is not None and result.rows is not rows:
+						#loaded rows are failed if a row with the same ULI failed in the last run
+						failed_ulis = result.rows[np.unpackbits(result.bits, count=len(result.rows)).astype(bool)]
+						fail_mask = loaded_rows.isin(failed_ulis)
+						result = result._replace(rows=rows, bits=np.packbits(fail_mask), fail_count=int(fail_mask.sum()))
+					kept.append(result)
+				self._edit_results[edit_func.__name__] = kept
+				self.results.extend(kept)
+		return self.results
+
+	def edits(self, categories=("s", "v", "q", "m"), row_type=None):
+		"""
+		Returns the bound edit functions in edit name order.
+		categories: edit categories to include, any of s, v, q, m
+		row_type: if passed, only edits checking this record type (LAR, TS, or macro) are returned
+		"""
+		key = (frozenset(categories), row_type)
+		if key not in self._edit_lists:
+			self._edit_lists[key] = [getattr(self, name) for name, info in self.edit_registry.items()
+				if info.category in categories and (row_type is None or row_type in info.row_type.split("/"))]
+		return self._edit_lists[key]
 
 	def results_wrapper(self, fail_df, field_name, edit_name, row_type="LAR"):
 		"""
-		Creates results dictionary/JSON object used in checking which LAR/TS rows failed edit checks
+		Adds the result of an edit to the edit_results store used in checking which LAR/TS rows failed edit checks
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="LAR")
+		fail_df must be a subset of the rows of the loaded LAR or TS data.
 		"""
-		if len(fail_df) > 0:
-			fail_count = len(fail_df)
-			result = "failed"
-
-			if row_type == "LAR":
-				failed_rows = list(fail_df.uli)
-				#self.update_results(edit_name=edit_name, edit_field_results=result, row_type=row_type, fields=field_name, row_ids=failed_rows, fail_count=count)
+		if row_type == "LAR":
+			#failed rows are flagged by their position in the loaded LAR data
+			if len(fail_df) > 0:
+				fail_mask = self.lar_df.index.isin(fail_df.index)
 			else:
-				failed_rows = ["ts"]
-				#Adding an edit report row for an edit related to the Transmittal Sheet. As TS is one row, the fail count is set to 1.  
-				#self.update_results(edit_name=edit_name, edit_field_results=result, row_type=row_type, fields=field_name, row_ids='TS', fail_count=1)
+				fail_mask = np.zeros(len(self.lar_df), dtype=bool)
+			self.results.add(edit_name=edit_name, field=field_name, row_type=row_type, fail_count=int(fail_mask.sum()),
+				rows=self.typed.values("uli"), fail_mask=fail_mask)
 		else:
-			result = "passed"
-			fail_count = 0
-			failed_rows = []
-
-		results_dict = {
-			"edit_name": edit_name,
-			"row_type": row_type,
-			"field": field_name,
-			"fail_count": fail_count,
-			"failed_rows": failed_rows
-		}
-
-		self.results.append(results_dict)
-			#self.update_results(edit_name=edit_name, edit_field_results=result, row_type=row_type, fields=field_name, row_ids=[], fail_count=0)
+			#TS results keep the count of rows in fail_df, the report lists "ts" as the failed row
+			self.results.add(edit_name=edit_name, field=field_name, row_type=row_type, fail_count=len(fail_df))
 
 
 	def valid_date(self, date):
@@ -171,19 +296,6 @@ class rules_engine(object):
 		except:
 			return False
 
-	def check_dupes(self, row, fields=[]):
-		"""
-		Checks for duplicate entries in the list of fields
-		"""
-		dct = {i:row[fields[i]] for i in range(len(fields))}
-		result = "pass"
-		for key, value in dct.items():
-			for key2, value2 in dct.items():
-				if not key == key2:
-					if value == value2 and value2 != "":
-						result = "fail"
-		return result
-
 	def check_number(self, field, min_val=None, max_val=None):
 		"""
 		Checks if a passed field contains only digits.
@@ -210,54 +322,75 @@ class rules_engine(object):
 		except:
 			return False #passed value is not a number
 
-	def compare_nums(self, row, fields=[]):
+	def valid_dates(self, dates):
 		"""
-		Checks if field_1 is greater than field_2
+		Column version of valid_date.
+		Returns a boolean Series that is True where the date is a valid date in YYYYMMDD format.
 		"""
-		try:
-			field_1 = float(row[fields[0]])
-			field_2 = float(row[fields[1]])
-			if field_1 > field_2:
-				return True
-			else:
-				return False
-		except:
-			return False
+		return pd.to_datetime(dates, format="%Y%m%d", errors="coerce").notna()
 
-	def check_counts(self, row, fields_1, fields_2, vals_1, vals_2):
+	def check_numbers(self, values, min_val=None, max_val=None):
 		"""
-		Checks if two sets of fields have the same count of entries
+		Column version of check_number. Returns a tuple of boolean Series (passed, failed) for the values,
+		marking the rows where check_number returns True and the rows where it returns False.
+		When max_val is passed, check_number returns None for values that are not digits or are out of range,
+		these rows are in neither Series.
 		"""
-		count_1 = 0
-		count_2 = 0
-		for field in fields_1:
-			if row[field] in vals_1:
-				count_1 +=1
-		for field in fields_2:
-			if row[field] in vals_2:
-				count_2 +=1
-		if count_1 == count_2:
-			return True
-		else:
-			return False
+		digits = values.str.replace(".", "", regex=False)
+		is_str = digits.notna()
+		digit = digits.str.isdigit().fillna(False).astype(bool)
+		number = pd.to_numeric(values.where(digit), errors="coerce")
+		if min_val is None and max_val is None:
+			return digit, ~digit
+		#values that are not strings and digit values float() can not read, such as 1.2.3, raise in check_number and return False
+		error = ~is_str | (digit & number.isna())
+		in_range = digit & ~error
+		if min_val is not None:
+			in_range &= number > min_val
+		if max_val is not None:
+			in_range &= number < max_val
+		if max_val is None:
+			return in_range, ~in_range
+		return in_range, error
 
-	def years_between(self, date1, date2, thresh=2):
+	def check_dupes(self, fields=[]):
+		"""
+		Returns a boolean Series that is True for rows with the same non-blank entry in two of the fields.
 		"""
-		date1: initial date (application date)
-		date2: second date (action date)
+		dupes = pd.Series(False, index=self.lar_df.index)
+		for i, field in enumerate(fields):
+			for field2 in fields[i+1:]:
+				dupes |= (self.lar_df[field]==self.lar_df[field2])&(self.lar_df[field]!="")
+		return dupes
 
-		Returns a year approximation of the time between two dates
+	def compare_nums(self, fields=[]):
 		"""
-		if self.valid_date(date1) and self.valid_date(date2):
-			date1 = datetime.strptime(date1, "%Y%m%d")
-			date2 = datetime.strptime(date2, "%Y%m%d")
-			delta_years = abs((date2 - date1).days)/365
-			if delta_years > thresh:
-				return False
-		else:
-			return True
+		Returns a boolean array that is True for rows where the first field is a number greater than the second field.
+		"""
+		return self.typed.numbers(fields[0]) > self.typed.numbers(fields[1])
+
+	def check_counts(self, fields_1, fields_2, vals_1, vals_2):
+		"""
+		Returns a boolean Series that is True for rows where the count of fields_1 entries in vals_1
+		equals the count of fields_2 entries in vals_2.
+		"""
+		count_1 = sum(self.lar_df[field].isin(vals_1).astype(int) for field in fields_1)
+		count_2 = sum(self.lar_df[field].isin(vals_2).astype(int) for field in fields_2)
+		return count_1==count_2
+
+	def years_between(self, dates1, dates2):
+		"""
+		dates1: initial dates (application date)
+		dates2: second dates (action date)
+
+		Returns a year approximation of the time between each pair of dates, NaN where either date is invalid.
+		"""
+		dates1 = pd.to_datetime(dates1, format="%Y%m%d", errors="coerce")
+		dates2 = pd.to_datetime(dates2, format="%Y%m%d", errors="coerce")
+		return (dates2 - dates1).dt.days.abs()/365
 
 	#### Edit Rules from FIG
+	@edit(row_type="TS", fields=("record_id",))
 	def s300_1(self):
 		"""
 		1) The first row of your file must begin with a 1
@@ -267,6 +400,7 @@ class rules_engine(object):
 		fail_df = self.ts_df[self.ts_df.record_id!="1"]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
+	@edit(fields=("record_id",))
 	def s300_2(self):
 		"""
 		2) Any subsequent rows [of your file must begin with a 2
@@ -276,6 +410,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[self.lar_df.record_id!="2"]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="LAR")
 
+	@edit(row_type="TS", fields=("lei",))
 	def s301(self):
 		"""
 		The LEI in this row does not match the reported LEI in the transmittal sheet (the first row of your file). Please update your file accordingly.
@@ -285,6 +420,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[self.lar_df.lei!=self.ts_df.at[0,"lei"]]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 	
+	@edit(row_type="TS", fields=("calendar_year",))
 	def s302(self):
 		"""
 		The reported Calendar Year does not match the filing year indicated at the start of the filing.
@@ -292,12 +428,13 @@ class rules_engine(object):
 		field = "activity_year"
 		edit_name = "s302"
 		year = str(self.config_data["activity_year"]["value"])
-		self.ts_df.calendar_year = self.ts_df.calendar_year.apply(str)
+		self.ts_df.calendar_year = self.ts_df.calendar_year.astype(str)
 		fail_df = self.ts_df[self.ts_df.calendar_year.isin([self.config_data["activity_year"]["value"]])]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
 	#S303 note: this requires panel data to implement the check and is beyond the scope of this project
 
+	@edit(row_type="TS/LAR", fields=("lar_entries",))
 	def s304(self):
 		"""
 		The reported Total Number of Entries Contained in Submission does not match the total number of LAR records in the HMDA file.
@@ -316,6 +453,7 @@ class rules_engine(object):
 		else:
 			pass
 
+	@edit(fields="all", file_level=True)
 	def s305(self):
 		"""A duplicate transaction has been reported. No transaction can be an exact duplicate in a LAR file."""
 		edit_name = "s305"
@@ -324,6 +462,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[self.lar_df.duplicated(keep=False)==True] #pull frame of duplicates
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("uli", "action_taken"), file_level=True)
 	def s306(self):
 		"""
 		If Action Taken equals 1, a duplicate ULI cannot be reported
@@ -334,15 +473,17 @@ class rules_engine(object):
 		fail_df = fail_df[fail_df.duplicated(subset=["uli"], keep=False)==True]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="LAR")
 
+	@edit(fields=("lei",))
 	def v600(self):
 		"""
 		1) The required format for LEI is alphanumeric with 20 characters, and it cannot be left blank.
 		"""
 		field = "LEI"
 		edit_name = "v600"
-		fail_df = self.lar_df[(self.lar_df.lei=="")|(self.lar_df.lei.map(lambda x: len(x))!=20)]
+		fail_df = self.lar_df[(self.lar_df.lei=="")|(self.lar_df.lei.str.len()!=20)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="LAR")
 
+	@edit(row_type="TS", fields=("inst_name",))
 	def v601_1(self):
 		"""
 		The following data fields are required, and cannot be left blank. A blank value(s) was provided.
@@ -353,6 +494,7 @@ class rules_engine(object):
 		fail_df = self.ts_df[self.ts_df.inst_name==""]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
+	@edit(row_type="TS", fields=("contact_name",))
 	def v601_2(self):
 		"""T
 		he following data fields are required, and cannot be left blank. A blank value(s) was provided.
@@ -363,6 +505,7 @@ class rules_engine(object):
 		fail_df = self.ts_df[self.ts_df.contact_name==""]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
+	@edit(row_type="TS", fields=("contact_email",))
 	def v601_3(self):
 		"""
 		The following data fields are required, and cannot be left blank. A blank value(s) was provided.
@@ -373,6 +516,7 @@ class rules_engine(object):
 		fail_df = self.ts_df[self.ts_df.contact_email==""]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
+	@edit(row_type="TS", fields=("contact_street_address",))
 	def v601_4(self):
 		"""
 		The following data fields are required, and cannot be left blank. A blank value(s) was provided.
@@ -383,6 +527,7 @@ class rules_engine(object):
 		fail_df = self.ts_df[self.ts_df.contact_street_address==""]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
+	@edit(row_type="TS", fields=("office_city",))
 	def v601_5(self):
 		"""
 		The following data fields are required, and cannot be left blank. A blank value(s) was provided.
@@ -393,6 +538,7 @@ class rules_engine(object):
 		fail_df = self.ts_df[self.ts_df.office_city==""]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
+	@edit(row_type="TS", fields=("calendar_quarter",))
 	def v602(self):
 		"""
 		An invalid Calendar Quarter was reported. 1) Calendar Quarter must equal 4, and cannot be left blank.
@@ -400,10 +546,11 @@ class rules_engine(object):
 		field = "calendar_quarter"
 		edit_name = "v602"
 		fail_df = self.ts_df.copy()
-		fail_df.calendar_quarter = fail_df.calendar_quarter.apply(lambda x: int(x))
+		fail_df.calendar_quarter = fail_df.calendar_quarter.astype(int)
 		fail_df = fail_df[(fail_df.calendar_quarter!=4)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
+	@edit(row_type="TS", fields=("contact_tel",))
 	def v603(self):
 		"""
 		An invalid Contact Person's Telephone Number was provided.
@@ -411,10 +558,11 @@ class rules_engine(object):
 		"""
 		edit_name = "v603"
 		field = "contact_tel"
-		fail_df = self.ts_df[(self.ts_df.contact_tel.map(lambda x: len(x))!=12)|
-							 (self.ts_df.contact_tel.map(lambda x: x.replace("-","").isdigit())==False)]
+		fail_df = self.ts_df[(self.ts_df.contact_tel.str.len()!=12)|
+							 (self.ts_df.contact_tel.str.replace("-", "", regex=False).str.isdigit()==False)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
+	@edit(row_type="TS", fields=("office_state",))
 	def v604(self):
 		"""
 		An invalid Contact Person's Office State was provided. Please review the information below and update your file accordingly.
@@ -426,6 +574,7 @@ class rules_engine(object):
 		fail_df = self.ts_df[~(self.ts_df.office_state.isin(self.state_codes.keys()))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
+	@edit(row_type="TS", fields=("office_zip",))
 	def v605(self):
 		"""
 		An invalid Contact Person's ZIP Code was provided. Please review the information below and update your file accordingly.
@@ -433,9 +582,10 @@ class rules_engine(object):
 		"""
 		edit_name = "v605"
 		field = "office_zip"
-		fail_df = self.ts_df[~(self.ts_df.office_zip.map(lambda x: len(x) in (5,10)))|(self.ts_df.office_zip.map(lambda x: x.replace("-","").isdigit())==False)]
+		fail_df = self.ts_df[~(self.ts_df.office_zip.str.len().isin([5,10]))|(self.ts_df.office_zip.str.replace("-", "", regex=False).str.isdigit()==False)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
+	@edit(row_type="TS", fields=("lar_entries",))
 	def v606(self):
 		"""
 		The reported Total Number of Entries Contained in Submission is not in the valid format.
@@ -444,9 +594,11 @@ class rules_engine(object):
 		"""
 		field = "lar_entries"
 		edit_name = "v606"
-		fail_df = self.ts_df[(self.ts_df.lar_entries.map(lambda x: self.check_number(x, min_val=0))==False)]
+		passed, failed = self.check_numbers(self.ts_df.lar_entries, min_val=0)
+		fail_df = self.ts_df[failed]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
+	@edit(row_type="TS", fields=("tax_id",))
 	def v607(self):
 		"""
 		An invalid Federal Taxpayer Identification Number was provided.
@@ -454,8 +606,8 @@ class rules_engine(object):
 		"""
 		edit_name = "v607"
 		field = "tax_id"
-		fail_df = self.ts_df[(self.ts_df.tax_id.map(lambda x: len(x))!=10)|
-							 (self.ts_df.tax_id.map(lambda x: x.replace("-","").isdigit())==False)]
+		fail_df = self.ts_df[(self.ts_df.tax_id.str.len()!=10)|
+							 (self.ts_df.tax_id.str.replace("-", "", regex=False).str.isdigit()==False)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
 	#def v608_1(self):
@@ -487,6 +639,7 @@ class rules_engine(object):
 	#	fail_df = fail_df[(fail_df.uli=="")|(fail_df.uli.apply(lambda x: len(x)>22))]
 	#	self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("uli", "lei"), file_level=True) #compares ULIs to the LEI of the first row
 	def v609(self):
 		"""
 		An invalid ULI was reported. Please review the information below and update your file accordingly.
@@ -498,14 +651,14 @@ class rules_engine(object):
 		"""
 		edit_name = "v609"
 		field = "ULI"
-		check_digit = utils.check_digit_gen #establish check digit function alias
-
 		#limit check digit checking to records with a ULI
-		fail_df = self.lar_df[self.lar_df.uli.apply(lambda x: x[:20]==self.lar_df.lei.iloc[0])]
-		#get dataframe of check digit failures
-		fail_df = fail_df[fail_df.uli.map(lambda x: str(x)[-2:]) != fail_df.uli.map(lambda x: check_digit(ULI=str(x)[:-2]))]
+		file_lei = self.file_lei if self.file_lei is not None else self.lar_df.lei.iloc[0]
+		fail_df = self.lar_df[self.lar_df.uli.str[:20]==file_lei]
+		#get dataframe of check digit failures, check digits are computed for all ULIs at once
+		fail_df = fail_df[fail_df.uli.str[-2:].values != utils.check_digit_array(fail_df.uli.str[:-2].values)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_date",))
 	def v610_1(self):
 		"""
 		An invalid date field was reported.
@@ -513,9 +666,10 @@ class rules_engine(object):
 		"""
 		edit_name = "v610_1"
 		field = "app_date"
-		fail_df = self.lar_df[(self.lar_df.app_date!="NA")&(self.lar_df.app_date.map(lambda x: self.valid_date(x))==False)]
+		fail_df = self.lar_df[(self.lar_df.app_date!="NA")&(self.valid_dates(self.lar_df.app_date)==False)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_date", "action_taken"))
 	def v610_2(self):
 		"""
 		An invalid date field was reported.
@@ -527,6 +681,7 @@ class rules_engine(object):
 				((self.lar_df.action_taken=="6")&(self.lar_df.app_date!="NA"))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("loan_type",))
 	def v611(self):
 		"""
 		An invalid Loan Type was reported.
@@ -538,6 +693,7 @@ class rules_engine(object):
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
 
+	@edit(fields=("loan_purpose",))
 	def v612_1(self):
 		"""
 		An invalid Loan Purpose was reported.
@@ -548,6 +704,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~self.lar_df.loan_purpose.isin(("1", "2", "31", "32", "4", "5"))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("loan_purpose", "preapproval"))
 	def v612_2(self):
 		"""
 		An invalid Loan Purpose was reported.
@@ -558,6 +715,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[((self.lar_df.preapproval=="1")&(self.lar_df.loan_purpose!="1"))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("preapproval",))
 	def v613_1(self):
 		"""
 		An invalid Preapproval data field was provided.
@@ -568,6 +726,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.preapproval.isin(("1", "2")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("preapproval", "action_taken"))
 	def v613_2(self):
 		"""
 		An invalid Preapproval data field was provided.
@@ -578,6 +737,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.action_taken.isin(("7", "8")))&(self.lar_df.preapproval!="1")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("preapproval", "action_taken"))
 	def v613_3(self):
 		"""
 		An invalid Preapproval data field was provided.
@@ -588,6 +748,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.action_taken.isin(("3", "4", "5", "6")))&(self.lar_df.preapproval!="2")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("preapproval", "action_taken"))
 	def v613_4(self):
 		"""
 		An invalid Preapproval data field was provided.
@@ -598,6 +759,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.preapproval=="1")&(~(self.lar_df.action_taken.isin(("1","2","7","8"))))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("preapproval", "loan_purpose"))
 	def v614_1(self):
 		"""
 		An invalid Preapproval was provided.
@@ -608,6 +770,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.loan_purpose.isin(("2", "4", "31", "32", "5")))&(self.lar_df.preapproval!="2")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 	
+	@edit(fields=("preapproval", "affordable_units"))
 	def v614_2(self):
 		"""
 		An invalid Preapproval was provided.
@@ -615,9 +778,10 @@ class rules_engine(object):
 		"""
 		field = "preapproval"
 		edit_name = "v614_2"
-		fail_df = self.lar_df[(self.lar_df.affordable_units.map(lambda x: x.isdigit())==True)&(self.lar_df.preapproval!="2")]
+		fail_df = self.lar_df[(self.lar_df.affordable_units.str.isdigit()==True)&(self.lar_df.preapproval!="2")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 	
+	@edit(fields=("preapproval", "reverse_mortgage"))
 	def v614_3(self):
 		"""
 		An invalid Preapproval was provided.
@@ -628,6 +792,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.reverse_mortgage=="1")&(self.lar_df.preapproval!="2")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 	
+	@edit(fields=("preapproval", "open_end_credit"))
 	def v614_4(self):
 		"""
 		An invalid Preapproval was provided.
@@ -638,6 +803,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.open_end_credit=="1")&(self.lar_df.preapproval!="2")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("const_method",))
 	def v615_1(self):
 		"""
 		An invalid Construction Method was reported.
@@ -648,6 +814,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~self.lar_df.const_method.isin(("1","2"))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("const_method", "manufactured_interest"))
 	def v615_2(self):
 		"""
 		An invalid Construction Method was reported.
@@ -659,6 +826,7 @@ class rules_engine(object):
 							  (self.lar_df.const_method!="2")].copy()
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("const_method", "manufactured_type"))
 	def v615_3(self):
 		"""
 		An invalid Construction Method was reported.
@@ -669,6 +837,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.manufactured_type.isin(("1","2")))&(self.lar_df.const_method!="2")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("occ_type",))
 	def v616(self):
 		"""
 		An invalid Occupancy Type was reported.
@@ -679,6 +848,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.occ_type.isin(("1","2","3")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("loan_amount",))
 	def v617(self):
 		"""
 		An invalid Loan Amount was reported.
@@ -686,12 +856,11 @@ class rules_engine(object):
 		"""
 		field = "loan_amount"
 		edit_name = "v617"
-		fail_df = self.lar_df.copy()
-		fail_df["amount"] = fail_df.loan_amount
-		fail_df.amount = fail_df.amount.map(lambda x: 0 if x == "" else x)
-		fail_df = fail_df[(fail_df.amount.map(lambda x: float(x))<=0)]
+		#blank loan amounts are read as 0
+		fail_df = self.lar_df[(self.lar_df.loan_amount=="")|(self.typed.numbers("loan_amount")<=0)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_taken",))
 	def v618(self):
 		"""
 		An invalid Action Taken was reported.
@@ -702,6 +871,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.action_taken.isin(("1","2","3","4","5","6","7","8")))|(self.lar_df.action_taken=="")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_date",))
 	def v619_1(self):
 		"""
 		An invalid Action Taken Date was reported.
@@ -709,9 +879,10 @@ class rules_engine(object):
 		"""
 		field = "action_date"
 		edit_name = "v619_1"
-		fail_df = self.lar_df[(self.lar_df.action_date=="")|(self.lar_df.action_date.map(lambda x: self.valid_date(x))==False)]
+		fail_df = self.lar_df[(self.lar_df.action_date=="")|(self.valid_dates(self.lar_df.action_date)==False)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_date",))
 	def v619_2(self):
 		"""
 		An invalid Action Taken Date was reported.
@@ -719,9 +890,10 @@ class rules_engine(object):
 		"""
 		field = "action_date"
 		edit_name = "v619_2"
-		fail_df = self.lar_df[(self.lar_df.action_date.map(lambda x: str(x)[:4])!=str(self.config_data["activity_year"]["value"]))]
+		fail_df = self.lar_df[(self.lar_df.action_date.astype(str).str[:4]!=str(self.config_data["activity_year"]["value"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_date", "app_date"))
 	def v619_3(self):
 		"""
 		An invalid Action Taken Date was reported.
@@ -732,6 +904,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.action_date < self.lar_df.app_date)&(self.lar_df.app_date!="NA")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("street_address",))
 	def v620(self):
 		"""
 		An invalid Street Address was provided.
@@ -742,6 +915,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.street_address=="")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("city",))
 	def v621(self):
 		"""
 		An invalid City was provided.
@@ -752,6 +926,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.city=="")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("city", "street_address"))
 	def v622_1(self):
 		"""
 		An invalid City, State and/or Zip Code were provided.
@@ -762,6 +937,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.street_address.isin(["NA", "Exempt"]))&(self.lar_df.city=="NA")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("state", "street_address"))
 	def v622_2(self):
 		"""
 		An invalid City, State and/or Zip Code were provided.
@@ -772,6 +948,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.street_address.isin(["NA", "Exempt"]))&(self.lar_df.state=="NA")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("zip_code", "street_address"))
 	def v622_3(self):
 		"""
 		An invalid City, State and/or Zip Code were provided.
@@ -782,6 +959,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.street_address.isin(["NA", "Exempt"]))&(self.lar_df.zip_code=="NA")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("state",))
 	def v623(self):
 		"""An invalid State was provided.
 		1) State must be either a two letter state code or NA, and cannot be left blank."""
@@ -790,6 +968,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.state.isin(self.state_codes))|(self.lar_df.state=="NA")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("zip_code",))
 	def v624(self):
 		"""
 		An invalid Zip Code was provided.
@@ -798,11 +977,12 @@ class rules_engine(object):
 		"""
 		field = "zip_code"
 		edit_name = "v624"
-		fail_df = self.lar_df[((self.lar_df.zip_code.map(lambda x: len(x) 
-			not in (10, 5)))|(self.lar_df.zip_code.map(lambda x: x.replace("-","").isdigit())==False)).copy()
+		fail_df = self.lar_df[((~self.lar_df.zip_code.str.len().isin([10, 5]))|
+			(self.lar_df.zip_code.str.replace("-", "", regex=False).str.isdigit()==False))
 		&(~self.lar_df.zip_code.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("tract",))
 	def v625_1(self):
 		"""
 		An invalid Census Tract was provided.
@@ -810,9 +990,10 @@ class rules_engine(object):
 		"""
 		field = "tract"
 		edit_name = "v625_1"
-		fail_df = self.lar_df[(self.lar_df.tract!="NA")&((self.lar_df.tract.map(lambda x: len(x)!=11))|(self.lar_df.tract.map(lambda x: x.isdigit())==False))]
+		fail_df = self.lar_df[(self.lar_df.tract!="NA")&((self.lar_df.tract.str.len()!=11)|(self.lar_df.tract.str.isdigit()==False))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("tract",))
 	def v625_2(self):
 		"""
 		An invalid Census Tract was provided.
@@ -820,10 +1001,11 @@ class rules_engine(object):
 		"""
 		field = "tract"
 		edit_name = "v625_2"
-		fail_df = self.lar_df[(self.lar_df.tract!="NA")&(~self.lar_df.tract.isin(self.geographic_data["tract_fips"]))].copy()
+		fail_df = self.lar_df[(self.lar_df.tract!="NA")&(~self.lar_df.tract.isin(self.geo_index.tracts))].copy()
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
 
+	@edit(fields=("county",))
 	def v626(self):
 		"""
 		v626 An invalid County was provided.
@@ -831,9 +1013,10 @@ class rules_engine(object):
 		"""
 		field = "county"
 		edit_name = "v626"
-		fail_df = self.lar_df[(self.lar_df.county!="NA")&((self.lar_df.county.map(lambda x: len(x))!=5)|(self.lar_df.county.map(lambda x: x.isdigit())==False))]
+		fail_df = self.lar_df[(self.lar_df.county!="NA")&((self.lar_df.county.str.len()!=5)|(self.lar_df.county.str.isdigit()==False))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("county", "tract"))
 	def v627(self):
 		"""
 		An invalid Census Tract or County was provided.
@@ -842,9 +1025,10 @@ class rules_engine(object):
 		"""
 		field = "tract/county"
 		edit_name = "v627"
-		fail_df = self.lar_df[((self.lar_df.county!="NA")&(self.lar_df.tract!="NA"))&(self.lar_df.tract.map(lambda x: str(x)[:5])!=self.lar_df.county)]
+		fail_df = self.lar_df[((self.lar_df.county!="NA")&(self.lar_df.tract!="NA"))&(self.lar_df.tract.str[:5]!=self.lar_df.county)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_eth_1", "app_eth_free"))
 	def v628_1(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -856,6 +1040,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.app_eth_1.isin(("1","11", "12", "13", "14", "2", "3","4")))|((self.lar_df.app_eth_free=="")&(self.lar_df.app_eth_1==""))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_eth_5", "app_eth_4", "app_eth_2", "app_eth_3"))
 	def v628_2(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -869,6 +1054,7 @@ class rules_engine(object):
 							  ~(self.lar_df.app_eth_5.isin(("1","11", "12", "13", "14", "2","")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 	
+	@edit(fields=("app_eth_1", "app_eth_2", "app_eth_3", "app_eth_4", "app_eth_5"))
 	def v628_3(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -877,9 +1063,10 @@ class rules_engine(object):
 		field = "applicant ethnicities"
 		edit_name = "v628_3"
 		dupe_fields = ["app_eth_1", "app_eth_2", "app_eth_3", "app_eth_4", "app_eth_5"]
-		fail_df = self.lar_df[(self.lar_df.apply(lambda x: self.check_dupes(x, fields=dupe_fields), axis=1)=="fail")]
+		fail_df = self.lar_df[self.check_dupes(fields=dupe_fields)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_eth_1", "app_eth_5", "app_eth_4", "app_eth_2", "app_eth_3"))
 	def v628_4(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -891,6 +1078,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.app_eth_1.isin(("3","4")))&((self.lar_df.app_eth_2!="")|(self.lar_df.app_eth_3!="")|(self.lar_df.app_eth_4!="")|(self.lar_df.app_eth_5!=""))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_eth_basis",))
 	def v629_1(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -901,6 +1089,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.app_eth_basis.isin(("1", "2", "3")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_eth_basis", "app_eth_5", "app_eth_4", "app_eth_3", "app_eth_1", "app_eth_2"))
 	def v629_2(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -914,6 +1103,7 @@ class rules_engine(object):
 			(self.lar_df.app_eth_3!="")|(self.lar_df.app_eth_4!="")|(self.lar_df.app_eth_5!=""))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_eth_basis", "app_eth_1"))
 	def v629_3(self):
 		"""
 		An invalid Ethnicity data field was reported. 
@@ -925,6 +1115,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.app_eth_basis=="2")&(~self.lar_df.app_eth_1.isin(("1", "11", "12", "13", "14", "2", "3")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_eth_basis", "app_eth_1"))
 	def v630(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -936,6 +1127,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.app_eth_basis!="3")&(self.lar_df.app_eth_1=="4")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_eth_free", "co_app_eth_1"))
 	def v631_1(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -949,6 +1141,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.co_app_eth_free=="")&(~self.lar_df.co_app_eth_1.isin(("1","11","12","13", "14", "2", "3", "4", "5")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_eth_5", "co_app_eth_4", "co_app_eth_2", "co_app_eth_3"))
 	def v631_2(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -961,6 +1154,7 @@ class rules_engine(object):
 			(~self.lar_df.co_app_eth_4.isin(("1", "11", "12", "13", "14", "2", "")))|(~self.lar_df.co_app_eth_5.isin(("1", "11", "12", "13", "14", "2", "")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_eth_1", "co_app_eth_2", "co_app_eth_3", "co_app_eth_4", "co_app_eth_5"))
 	def v631_3(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -969,9 +1163,10 @@ class rules_engine(object):
 		field = "Co-App Ethnicities"
 		edit_name = "v631_3"
 		dupe_fields = ["co_app_eth_1", "co_app_eth_2", "co_app_eth_3", "co_app_eth_4", "co_app_eth_5"]
-		fail_df = self.lar_df[(self.lar_df.apply(lambda x: self.check_dupes(x, fields=dupe_fields), axis=1)=="fail")]
+		fail_df = self.lar_df[self.check_dupes(fields=dupe_fields)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_eth_5", "co_app_eth_4", "co_app_eth_1", "co_app_eth_2", "co_app_eth_3"))
 	def v631_4(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -986,6 +1181,7 @@ class rules_engine(object):
 			(fail_df.co_app_eth_4!="")|(fail_df.co_app_eth_5!=""))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_eth_basis",))
 	def v632_1(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -996,6 +1192,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.co_app_eth_basis.isin(("1", "2", "3", "4")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_eth_basis", "co_app_eth_5", "co_app_eth_4", "co_app_eth_3", "co_app_eth_1", "co_app_eth_2"))
 	def v632_2(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -1009,6 +1206,7 @@ class rules_engine(object):
 			(self.lar_df.co_app_eth_3!="")|(self.lar_df.co_app_eth_4!="")|(self.lar_df.co_app_eth_5!=""))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_eth_basis", "co_app_eth_1"))
 	def v632_3(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -1020,6 +1218,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.co_app_eth_basis=="2")&(~self.lar_df.co_app_eth_1.isin(("1", "11", "12", "13", "14", "2", "3")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_eth_1", "co_app_eth_basis"))
 	def v633(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -1031,6 +1230,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.co_app_eth_1=="4")&(self.lar_df.co_app_eth_basis!="3")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_eth_1", "co_app_eth_basis"))
 	def v634(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -1043,6 +1243,7 @@ class rules_engine(object):
 		((self.lar_df.co_app_eth_basis=="4")&(self.lar_df.co_app_eth_1!="5"))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df) 
 
+	@edit(fields=("app_race_1", "app_race_asian_text", "app_race_native_text", "app_race_islander_text"))
 	def v635_1(self):
 		"""
 		An invalid Race data field was reported.
@@ -1056,6 +1257,7 @@ class rules_engine(object):
 		((self.lar_df.app_race_1=="")&((self.lar_df.app_race_native_text=="")&(self.lar_df.app_race_islander_text=="")&(self.lar_df.app_race_asian_text=="")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_race_5", "app_race_4", "app_race_2", "app_race_3"))
 	def v635_2(self):
 		"""
 		An invalid Race data field was reported.
@@ -1070,6 +1272,7 @@ class rules_engine(object):
 			~(self.lar_df.app_race_5.isin(("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_race_1", "app_race_2", "app_race_3", "app_race_4", "app_race_5"))
 	def v635_3(self):
 		"""
 		An invalid Race data field was reported.
@@ -1078,9 +1281,10 @@ class rules_engine(object):
 		field = "Applicant Races"
 		edit_name = "v635_3"
 		race_fields = ["app_race_1", "app_race_2", "app_race_3", "app_race_4", "app_race_5"]
-		fail_df = self.lar_df[(self.lar_df.apply(lambda x: self.check_dupes(x, fields=race_fields), axis=1)=="fail")]
+		fail_df = self.lar_df[self.check_dupes(fields=race_fields)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_race_1", "app_race_5", "app_race_4", "app_race_2", "app_race_3"))
 	def v635_4(self):
 		"""
 		An invalid Race data field was reported.
@@ -1093,6 +1297,7 @@ class rules_engine(object):
 			|(self.lar_df.app_race_5!=""))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_race_basis",))
 	def v636_1(self):
 		"""
 		An invalid Race data field was reported.
@@ -1103,6 +1308,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.app_race_basis.isin(("1", "2", "3")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_race_basis", "app_race_5", "app_race_4", "app_race_3", "app_race_1", "app_race_2"))
 	def v636_2(self):
 		"""
 		An invalid Race data field was reported.
@@ -1117,6 +1323,7 @@ class rules_engine(object):
 			(~self.lar_df.app_race_4.isin(("1", "2", "3", "4", "5","")))|(~self.lar_df.app_race_5.isin(("1", "2", "3", "4", "5",""))))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_race_basis", "app_race_4", "app_race_3", "app_race_1", "app_race_2"))
 	def v636_3(self):
 		"""
 		An invalid Race data field was reported.
@@ -1135,6 +1342,7 @@ class rules_engine(object):
 			(~self.lar_df.app_race_4.isin(app_n_races))|(~self.lar_df.app_race_4.isin(app_n_races)))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_race_1", "app_race_basis"))
 	def v637(self):
 		"""
 		An invalid Race data field was reported.
@@ -1146,6 +1354,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.app_race_1=="7")&(self.lar_df.app_race_basis!="3")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_race_1", "co_app_race_asian_text", "co_app_race_native_text", "co_app_race_islander_text"))
 	def v638_1(self):
 		"""
 		An invalid Race data field was reported.
@@ -1161,6 +1370,7 @@ class rules_engine(object):
 			(self.lar_df.co_app_race_asian_text=="")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_race_5", "co_app_race_4", "co_app_race_2", "co_app_race_3"))
 	def v638_2(self):
 		"""
 		An invalid Race data field was reported.
@@ -1176,6 +1386,7 @@ class rules_engine(object):
 			~(self.lar_df.co_app_race_5.isin(("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_race_1", "co_app_race_2", "co_app_race_3", "co_app_race_4", "co_app_race_5"))
 	def v638_3(self):
 		"""
 		An invalid Race data field was reported.
@@ -1184,9 +1395,10 @@ class rules_engine(object):
 		field = "Co-Applicant Races"
 		edit_name = "v638_3"
 		race_fields = ["co_app_race_1", "co_app_race_2", "co_app_race_3", "co_app_race_4", "co_app_race_5"]
-		fail_df = self.lar_df[(self.lar_df.apply(lambda x: self.check_dupes(x, fields=race_fields), axis=1)=="fail")]
+		fail_df = self.lar_df[self.check_dupes(fields=race_fields)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_race_1", "co_app_race_5", "co_app_race_4", "co_app_race_2", "co_app_race_3"))
 	def v638_4(self):
 		"""
 		An invalid Race data field was reported.
@@ -1199,6 +1411,7 @@ class rules_engine(object):
 			|(self.lar_df.co_app_race_5!=""))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_race_basis",))
 	def v639_1(self):
 		"""
 		An invalid Race data field was reported.
@@ -1209,6 +1422,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(~self.lar_df.co_app_race_basis.isin(("1", "2", "3", "4")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_race_basis", "co_app_race_5", "co_app_race_4", "co_app_race_3", "co_app_race_1", "co_app_race_2"))
 	def v639_2(self):
 		"""
 		An invalid Race data field was reported.
@@ -1224,6 +1438,7 @@ class rules_engine(object):
 		(~self.lar_df.co_app_race_4.isin(("1", "2", "3", "4", "5", "")))|(~self.lar_df.co_app_race_5.isin(("1", "2", "3", "4", "5", ""))))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_race_basis", "co_app_race_5", "co_app_race_4", "co_app_race_3", "co_app_race_1", "co_app_race_2"))
 	def v639_3(self):
 		"""
 		An invalid Race data field was reported.
@@ -1242,6 +1457,7 @@ class rules_engine(object):
 		(~self.lar_df.co_app_race_5.isin(race_n)))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_race_1", "co_app_race_basis"))
 	def v640(self):
 		"""
 		An invalid Race data field was reported.
@@ -1253,6 +1469,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.co_app_race_1=="7")&(self.lar_df.co_app_race_basis!="3")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_race_1", "co_app_race_basis"))
 	def v641(self):
 		"""
 		An invalid Race data field was reported.
@@ -1265,6 +1482,7 @@ class rules_engine(object):
 		((self.lar_df.co_app_race_basis=="4")&(self.lar_df.co_app_race_1!="8"))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_sex",))
 	def v642_1(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1275,6 +1493,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(~self.lar_df.app_sex.isin(("1", "2", "3", "4", "6")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_sex_basis",))
 	def v642_2(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1285,6 +1504,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(~self.lar_df.app_sex_basis.isin(("1", "2", "3")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_sex_basis", "app_sex"))
 	def v643(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1296,6 +1516,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.app_sex_basis=="1")&(~self.lar_df.app_sex.isin(("1", "2")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_sex_basis", "app_sex"))
 	def v644_1(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1307,6 +1528,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.app_sex_basis=="2")&(~self.lar_df.app_sex.isin(("1", "2", "3", "6")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_sex", "app_sex_basis"))
 	def v644_2(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1318,6 +1540,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.app_sex=="6")&(~self.lar_df.app_sex_basis.isin(("2", "3")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_sex", "app_sex_basis"))
 	def v645(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1328,6 +1551,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.app_sex=="4")&(self.lar_df.app_sex_basis!="3")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_sex",))
 	def v646_1(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1338,6 +1562,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(~self.lar_df.co_app_sex.isin(("1", "2", "3", "4", "5", "6")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_sex_basis",))
 	def v646_2(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1349,6 +1574,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.co_app_sex_basis.isin(("1", "2", "3", "4")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_sex_basis", "co_app_sex"))
 	def v647(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1360,6 +1586,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.co_app_sex_basis=="1")&(~self.lar_df.co_app_sex.isin(("1", "2")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_sex_basis", "co_app_sex"))
 	def v648_1(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1371,6 +1598,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.co_app_sex_basis=="2")&(~self.lar_df.co_app_sex.isin(("1","2", "3", "6")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_sex", "co_app_sex_basis"))
 	def v648_2(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1384,6 +1612,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.co_app_sex=="6")&(~self.lar_df.co_app_sex_basis.isin(("2","3")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_sex", "co_app_sex_basis"))
 	def v649(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1395,6 +1624,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.co_app_sex=="4")&(self.lar_df.co_app_sex_basis!="3")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_sex_basis", "co_app_sex"))
 	def v650(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1407,6 +1637,7 @@ class rules_engine(object):
 			((self.lar_df.co_app_sex=="5")&(self.lar_df.co_app_sex_basis!="4"))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_age",))
 	def v651_1(self):
 		"""
 		An invalid Age of Applicant or Borrower was reported.
@@ -1414,9 +1645,11 @@ class rules_engine(object):
 		"""
 		field = "Applicant Age"
 		edit_name = "v651_1"
-		fail_df = self.lar_df[(self.lar_df.app_age.map(lambda x: self.check_number(field=x, min_val=0))==False)]
+		passed, failed = self.check_numbers(self.lar_df.app_age, min_val=0)
+		fail_df = self.lar_df[failed]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_taken", "app_age", "app_sex", "app_eth_1", "app_race_1"))
 	def v651_2(self):
 		"""
 		An invalid Age of Applicant or Borrower was reported.
@@ -1430,6 +1663,7 @@ class rules_engine(object):
 					(self.lar_df.app_age!="8888")&(self.lar_df.action_taken!="6")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_age",))
 	def v652_1(self):
 		"""
 		An invalid Age of Co-Applicant or Co-Borrower was reported.
@@ -1437,9 +1671,11 @@ class rules_engine(object):
 		"""
 		field = "Co-Applicant Age"
 		edit_name = "v652_1"
-		fail_df = self.lar_df[(self.lar_df.co_app_age.map(lambda x: self.check_number(field=x, min_val=0))==False)]
+		passed, failed = self.check_numbers(self.lar_df.co_app_age, min_val=0)
+		fail_df = self.lar_df[failed]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_taken", "co_app_age", "co_app_sex", "co_app_eth_1", "co_app_race_1"))
 	def v652_2(self):
 		"""
 		An invalid Age of Co-Applicant or Co-Borrower was reported.
@@ -1453,6 +1689,7 @@ class rules_engine(object):
 					(self.lar_df.co_app_age!="8888")&(self.lar_df.action_taken!="6")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("income",))
 	def v654_1(self):
 		"""
 		An invalid Income was reported.
@@ -1460,9 +1697,10 @@ class rules_engine(object):
 		"""
 		field = "Income"
 		edit_name = "v654_1"
-		fail_df = self.lar_df[(self.lar_df.income!="NA")&(self.lar_df.income.map(lambda x: x.isdigit())==False)]
+		fail_df = self.lar_df[(self.lar_df.income!="NA")&(self.lar_df.income.str.isdigit()==False)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("income", "affordable_units"))
 	def v654_2(self):
 		"""
 		An invalid Income was reported.
@@ -1470,9 +1708,10 @@ class rules_engine(object):
 		"""
 		field = "Income"
 		edit_name = "v654_2"
-		fail_df = self.lar_df[(self.lar_df.affordable_units.map(lambda x: x.isdigit())==True)&(self.lar_df.income!="NA")]
+		fail_df = self.lar_df[(self.lar_df.affordable_units.str.isdigit()==True)&(self.lar_df.income!="NA")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_taken", "income", "app_sex", "app_eth_1", "app_race_1"))
 	def v655_1(self):
 		"""
 		An invalid income was reported.
@@ -1485,6 +1724,7 @@ class rules_engine(object):
 					(self.lar_df.income!="NA")&(self.lar_df.action_taken!="6")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_taken", "income", "co_app_sex", "co_app_eth_1", "co_app_race_1"))
 	def v655_2(self):
 		"""
 		An invalid income was reported.
@@ -1497,6 +1737,7 @@ class rules_engine(object):
 					(self.lar_df.income!="NA")&(self.lar_df.action_taken!="6")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("purchaser_type",))
 	def v656_1(self):
 		"""
 		An invalid Type of Purchaser was reported.
@@ -1507,6 +1748,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.purchaser_type.isin(("0", "1", "2", "3", "4", "5", "6", "71", "72", "8", "9")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("purchaser_type", "action_taken"))
 	def v656_2(self):
 		"""
 		An invalid Type of Purchaser was reported.
@@ -1517,6 +1759,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.action_taken.isin(("2", "3", "4", "5", "7","8")))&(self.lar_df.purchaser_type!="0")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("rate_spread",))
 	def v657_1(self):
 		"""
 		An invalid Rate Spread was reported.
@@ -1525,10 +1768,11 @@ class rules_engine(object):
 
 		field = "Rate Spread"
 		edit_name = "v657_1"
-		fail_df = self.lar_df[~(self.lar_df.rate_spread.isin(["NA", "Exempt"]))&
-			(self.lar_df.rate_spread.map(lambda x: self.check_number(x))==False)]
+		passed, failed = self.check_numbers(self.lar_df.rate_spread)
+		fail_df = self.lar_df[~(self.lar_df.rate_spread.isin(["NA", "Exempt"]))&failed]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_taken", "rate_spread"))
 	def v657_2(self):
 		"""
 		An invalid Rate Spread was reported.
@@ -1540,6 +1784,7 @@ class rules_engine(object):
 			(~self.lar_df.rate_spread.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("reverse_mortgage", "rate_spread"))
 	def v657_3(self):
 		"""
 		An invalid Rate Spread was reported.
@@ -1550,6 +1795,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.reverse_mortgage=="1")&(~self.lar_df.rate_spread.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("hoepa",))
 	def v658_1(self):
 		"""
 		An invalid HOEPA Status was reported.
@@ -1560,6 +1806,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.hoepa.isin(("1", "2", "3")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("hoepa", "action_taken"))
 	def v658_2(self):
 		"""
 		An invalid HOEPA Status was reported.
@@ -1570,6 +1817,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.action_taken.isin(("2", "3", "4", "5", "7", "8")))&(self.lar_df.hoepa!="3")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("lien",))
 	def v659(self):
 		"""
 		An invalid Lien Status was reported.
@@ -1580,6 +1828,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.lien.isin(("1", "2")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_credit_score",))
 	def v660_1(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1587,9 +1836,11 @@ class rules_engine(object):
 		"""
 		field = "App Credit Score"
 		edit_name = "v660_1"
-		fail_df = self.lar_df[(self.lar_df.app_credit_score.map(lambda x: self.check_number(x))==False)]
+		passed, failed = self.check_numbers(self.lar_df.app_credit_score)
+		fail_df = self.lar_df[failed]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_score_name",))
 	def v660_2(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1600,6 +1851,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(~self.lar_df.app_score_name.isin(("1111", "1", "2", "3", "4", "5", "6", "7", "8", "9")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_credit_score", "app_score_name"))
 	def v661(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1612,6 +1864,7 @@ class rules_engine(object):
 			((self.lar_df.app_score_name=="9")&(self.lar_df.app_credit_score!="8888"))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_score_code_8", "app_score_name"))
 	def v662_1(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1624,9 +1877,10 @@ class rules_engine(object):
 		fail_df = self.lar_df[((self.lar_df.app_score_name.isin(("1111", "1", "2", "3", "4", "5", "6", "7", "9")))&
 			(self.lar_df.app_score_code_8!=""))|
 			((self.lar_df.app_score_code_8=="")&
-				(~self.lar_df.app_score_name.isin(("1", "2", "3", "4", "5", "6", "7", "9"))))]
+				(~self.lar_df.app_score_name.isin(("1111", "1", "2", "3", "4", "5", "6", "7", "9"))))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_score_name", "app_score_code_8"))
 	def v662_2(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1641,6 +1895,7 @@ class rules_engine(object):
 			((self.lar_df.app_score_code_8!="")&(self.lar_df.app_score_name!="8"))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_taken", "app_score_code_8", "app_credit_score", "app_score_name"))
 	def v663(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1657,6 +1912,7 @@ class rules_engine(object):
 			(self.lar_df.app_score_code_8!=""))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_taken", "co_app_score_code_8", "co_app_credit_score", "co_app_score_name"))
 	def v664(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1672,6 +1928,7 @@ class rules_engine(object):
 			(~self.lar_df.co_app_score_name.isin(["9", "Exempt"]))|(self.lar_df.co_app_score_code_8!=""))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_credit_score",))
 	def v665_1(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1679,9 +1936,11 @@ class rules_engine(object):
 		"""
 		field = "Co-App Credit Score"
 		edit_name = "v665_1"
-		fail_df = self.lar_df[(self.lar_df.co_app_credit_score.map(lambda x: self.check_number(x))==False)]
+		passed, failed = self.check_numbers(self.lar_df.co_app_credit_score)
+		fail_df = self.lar_df[failed]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_score_name",))
 	def v665_2(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1694,6 +1953,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.co_app_score_name.isin(("1111", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_credit_score", "co_app_score_name"))
 	def v666_1(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1706,6 +1966,7 @@ class rules_engine(object):
 			((self.lar_df.co_app_score_name=="9")&(self.lar_df.co_app_credit_score!="8888"))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_credit_score", "co_app_score_name"))
 	def v666_2(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1718,6 +1979,7 @@ class rules_engine(object):
 			((self.lar_df.co_app_score_name=="10")&(self.lar_df.co_app_credit_score!="9999"))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_score_code_8", "co_app_score_name"))
 	def v667_1(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1732,6 +1994,7 @@ class rules_engine(object):
 			((self.lar_df.co_app_score_code_8=="")&(~self.lar_df.co_app_score_name.isin(("1111", "1", "2", "3", "4", "5", "6", "7", "9", "10"))))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_score_name", "co_app_score_code_8"))
 	def v667_2(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1746,6 +2009,7 @@ class rules_engine(object):
 			((self.lar_df.co_app_score_code_8!="")&(self.lar_df.co_app_score_name!="8"))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_sex", "app_eth_1", "app_race_1", "app_credit_score"))
 	def v668_1(self):
 		"""
 		An invalid Credit Score data point was reported.
@@ -1760,6 +2024,7 @@ class rules_engine(object):
 		(~self.lar_df.app_credit_score.isin(["8888", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_sex", "co_app_eth_1", "co_app_race_1", "co_app_credit_score"))
 	def v668_2(self):
 		"""
 		An invalid Credit Score data point was reported.
@@ -1774,6 +2039,7 @@ class rules_engine(object):
 		(~self.lar_df.co_app_credit_score.isin(["8888", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("denial_1",))
 	def v669_1(self):
 		"""
 		An invalid Reason for Denial data field was reported.
@@ -1785,6 +2051,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(~self.lar_df.denial_1.isin(("1111", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("denial_4", "denial_2", "denial_3"))
 	def v669_2(self):
 		"""
 		An invalid Reason for Denial data field was reported.
@@ -1796,6 +2063,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.denial_2.isin(denials))|(~self.lar_df.denial_3.isin(denials))|(~self.lar_df.denial_4.isin(denials))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("denial_1", "denial_2", "denial_3", "denial_4"))
 	def v669_3(self):
 		"""
 		An invalid Reason for Denial data field was reported.
@@ -1804,9 +2072,10 @@ class rules_engine(object):
 		field = "Denial Reasons 1-4"
 		edit_name = "v669_3"
 		dupe_fields = ["denial_1", "denial_2", "denial_3", "denial_4"]
-		fail_df = self.lar_df[(self.lar_df.apply(lambda x: self.check_dupes(x, fields=dupe_fields), axis=1)=="fail")]
+		fail_df = self.lar_df[self.check_dupes(fields=dupe_fields)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("denial_1", "denial_4", "denial_2", "denial_3"))
 	def v669_4(self):
 		"""
 		An invalid Reason for Denial data field was reported.
@@ -1821,6 +2090,7 @@ class rules_engine(object):
 			((self.lar_df.denial_2!="")|(self.lar_df.denial_3!="")|(self.lar_df.denial_4!=""))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_taken", "denial_1"))
 	def v670_1(self):
 		"""
 		An invalid Reason for Denial data field was reported.
@@ -1833,6 +2103,7 @@ class rules_engine(object):
 							  (~self.lar_df.denial_1.isin(("1111", "1", "2", "3", "4", "5", "6", "7", "8", "9"))))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("denial_1", "action_taken"))
 	def v670_2(self):
 		"""
 		An invalid Reason for Denial data field was reported.
@@ -1844,6 +2115,7 @@ class rules_engine(object):
 							  (~self.lar_df.action_taken.isin(["3", "7"])))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_taken", "denial_1"))
 	def v670_3(self):
 		"""
 		3) If Action Taken equals 1, 2, 4, 5, 6, or 8, then Reason for Denial: 1 must equal 1111 or 10.
@@ -1854,6 +2126,7 @@ class rules_engine(object):
 							  (~self.lar_df.denial_1.isin(["1111", "10"])))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("denial_1", "action_taken"))
 	def v670_4(self):
 		"""
 		4) If Reason for Denial: 1 equals 10, then Action Taken must equal 1, 2, 4, 5, 6, or 8
@@ -1864,6 +2137,7 @@ class rules_engine(object):
 							  (~self.lar_df.action_taken.isin(("1", "2", "4", "5", "6", "8")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("denial_code_9", "denial_4", "denial_3", "denial_1", "denial_2"))
 	def v671_1(self):
 		"""
 		An invalid Reason for Denial data field was reported.
@@ -1877,6 +2151,7 @@ class rules_engine(object):
 			(self.lar_df.denial_code_9=="")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("denial_code_9", "denial_4", "denial_3", "denial_1", "denial_2"))
 	def v671_2(self):
 		"""
 		An invalid Reason for Denial data field was reported.
@@ -1889,6 +2164,7 @@ class rules_engine(object):
 			(self.lar_df.denial_code_9!="")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("loan_costs",))
 	def v672_1(self):
 		"""
 		An invalid Total Loan Costs or Total Points and Fees data field was reported.
@@ -1897,10 +2173,11 @@ class rules_engine(object):
 		"""
 		field = "Loan Costs"
 		edit_name = "v672_1"
-		fail_df = self.lar_df[(~self.lar_df.loan_costs.isin(["NA", "Exempt"]))].copy()
-		fail_df = fail_df[(fail_df.loan_costs.map(lambda x: self.check_number(x, min_val=0))==False)]
+		passed, failed = self.check_numbers(self.lar_df.loan_costs, min_val=0)
+		fail_df = self.lar_df[(~self.lar_df.loan_costs.isin(["NA", "Exempt"]))&failed]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("loan_costs", "points_fees"))
 	def v672_2(self):
 		"""
 		An invalid Total Loan Costs or Total Points and Fees data field was reported.
@@ -1908,10 +2185,11 @@ class rules_engine(object):
 		"""
 		field = "Loan Costs"
 		edit_name = "v672_2"
-		fail_df = self.lar_df[(self.lar_df.loan_costs!="NA")].copy()
-		fail_df = fail_df[(fail_df.points_fees.map(lambda x: self.check_number(x, min_val=0))==True)]
+		passed, failed = self.check_numbers(self.lar_df.points_fees, min_val=0)
+		fail_df = self.lar_df[(self.lar_df.loan_costs!="NA")&passed]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("reverse_mortgage", "loan_costs"))
 	def v672_3(self):
 		"""
 		An invalid Total Loan Costs or Total Points and Fees data field was reported.
@@ -1923,6 +2201,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.reverse_mortgage=="1")&(~self.lar_df.loan_costs.isin(["NA","Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("open_end_credit", "loan_costs"))
 	def v672_4(self):
 		"""
 		An invalid Total Loan Costs or Total Points and Fees data field was reported.
@@ -1934,6 +2213,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.open_end_credit=="1")&(~self.lar_df.loan_costs.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("business_purpose", "loan_costs"))
 	def v672_5(self):
 		"""
 		An invalid Total Loan Costs or Total Points and Fees data field was reported.
@@ -1945,6 +2225,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.business_purpose=="1")&(~self.lar_df.loan_costs.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_taken", "loan_costs"))
 	def v672_6(self):
 		"""
 		An invalid Total Loan Costs or Total Points and Fees data field was reported.
@@ -1957,6 +2238,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.action_taken.isin(("2", "3", "4", "5", "7", "8"))&(~self.lar_df.loan_costs.isin(["NA", "Exempt"])))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("points_fees",))
 	def v673_1(self):
 		"""
 		An invalid Total Points and Fees was reported.
@@ -1964,10 +2246,11 @@ class rules_engine(object):
 		"""
 		field = "Points and Fees"
 		edit_name = "v673_1"
-		fail_df = self.lar_df[~self.lar_df.points_fees.isin(["NA", "Exempt"])].copy()
-		fail_df = fail_df[(fail_df.points_fees.map(lambda x: self.check_number(x, min_val=0))==False)]
+		passed, failed = self.check_numbers(self.lar_df.points_fees, min_val=0)
+		fail_df = self.lar_df[~self.lar_df.points_fees.isin(["NA", "Exempt"])&failed]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_taken", "points_fees"))
 	def v673_2(self):
 		"""
 		An invalid Total Points and Fees was reported.
@@ -1980,6 +2263,7 @@ class rules_engine(object):
 							 (~self.lar_df.points_fees.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("reverse_mortgage", "points_fees"))
 	def v673_3(self):
 		"""
 		An invalid Total Points and Fees was reported.
@@ -1992,6 +2276,7 @@ class rules_engine(object):
 					          (~self.lar_df.points_fees.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("business_purpose", "points_fees"))
 	def v673_4(self):
 		"""
 		An invalid Total Points and Fees was reported.
@@ -2002,6 +2287,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.business_purpose=="1")&(~self.lar_df.points_fees.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("points_fees", "loan_costs"))
 	def v673_5(self):
 		"""
 		An invalid Total Points and Fees was reported.
@@ -2009,11 +2295,12 @@ class rules_engine(object):
 		"""
 		field = "Points and Fees"
 		edit_name = "v673_5"
-		fail_df = self.lar_df[(self.lar_df.points_fees!="NA")].copy()
-		fail_df = fail_df[(fail_df.loan_costs.map(lambda x: self.check_number(x, min_val=0))==True)]
+		passed, failed = self.check_numbers(self.lar_df.loan_costs, min_val=0)
+		fail_df = self.lar_df[(self.lar_df.points_fees!="NA")&passed]
 							  
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("origination_fee",))
 	def v674_1(self):
 		"""
 		An invalid Origination Charges was reported.
@@ -2022,11 +2309,12 @@ class rules_engine(object):
 		"""
 		field = "Origination Charges"
 		edit_name = "v674_1"
-		fail_df = self.lar_df[(~self.lar_df.origination_fee.isin(["NA", "Exempt"]))].copy()
-		fail_df = fail_df[(fail_df.origination_fee.map(lambda x: self.check_number(x, min_val=0))==False)]
+		passed, failed = self.check_numbers(self.lar_df.origination_fee, min_val=0)
+		fail_df = self.lar_df[(~self.lar_df.origination_fee.isin(["NA", "Exempt"]))&failed]
 							 
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("reverse_mortgage", "origination_fee"))
 	def v674_2(self):
 		"""
 		An invalid Origination Charges was reported.
@@ -2038,6 +2326,7 @@ class rules_engine(object):
 							 (~self.lar_df.origination_fee.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("open_end_credit", "origination_fee"))
 	def v674_3(self):
 		"""An invalid Origination Charges was reported.
 		3) If Open-End Line of Credit equals 1, then Origination Charges must be NA or Exempt.
@@ -2048,6 +2337,7 @@ class rules_engine(object):
 							 (~self.lar_df.origination_fee.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("business_purpose", "origination_fee"))
 	def v674_4(self):
 		"""
 		An invalid Origination Charges was reported.
@@ -2059,6 +2349,7 @@ class rules_engine(object):
 							 (~self.lar_df.origination_fee.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_taken", "origination_fee"))
 	def v674_5(self):
 		"""
 		An invalid Origination Charges was reported.
@@ -2070,6 +2361,7 @@ class rules_engine(object):
 							 (~self.lar_df.origination_fee.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("discount_points",))
 	def v675_1(self):
 		"""
 		An invalid Discount Points was reported.
@@ -2077,11 +2369,12 @@ class rules_engine(object):
 		"""
 		field = "Discount Points"
 		edit_name = "v675_1"
-		fail_df = self.lar_df[(~self.lar_df.discount_points.isin(["NA", "Exempt", ""]))].copy()
-		fail_df = fail_df[(fail_df.discount_points.map(lambda x: self.check_number(x, min_val=0))==False)]
+		passed, failed = self.check_numbers(self.lar_df.discount_points, min_val=0)
+		fail_df = self.lar_df[(~self.lar_df.discount_points.isin(["NA", "Exempt", ""]))&failed]
 		  
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("reverse_mortgage", "discount_points"))
 	def v675_2(self):
 		"""
 		An invalid Discount Points was reported.
@@ -2093,6 +2386,7 @@ class rules_engine(object):
 							 (~self.lar_df.discount_points.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("open_end_credit", "discount_points"))
 	def v675_3(self):
 		"""
 		An invalid Discount Points was reported.
@@ -2104,6 +2398,7 @@ class rules_engine(object):
 							 (~self.lar_df.discount_points.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("business_purpose", "discount_points"))
 	def v675_4(self):
 		"""
 		An invalid Discount Points was reported.
@@ -2115,6 +2410,7 @@ class rules_engine(object):
 							 (~self.lar_df.discount_points.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_taken", "discount_points"))
 	def v675_5(self):
 		"""
 		An invalid Discount Points was reported.
@@ -2126,6 +2422,7 @@ class rules_engine(object):
 							 (~self.lar_df.discount_points.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("lender_credits",))
 	def v676_1(self):
 		"""
 		An invalid Lender Credits was reported.
@@ -2133,10 +2430,11 @@ class rules_engine(object):
 		"""
 		field = "Lender Credits"
 		edit_name = "v676_1"
-		fail_df = self.lar_df[(~self.lar_df.lender_credits.isin(["NA", "Exempt", ""]))].copy()
-		fail_df = fail_df[(fail_df.lender_credits.map(lambda x: self.check_number(x, min_val=0))==False)]
+		passed, failed = self.check_numbers(self.lar_df.lender_credits, min_val=0)
+		fail_df = self.lar_df[(~self.lar_df.lender_credits.isin(["NA", "Exempt", ""]))&failed]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("reverse_mortgage", "lender_credits"))
 	def v676_2(self):
 		"""
 		An invalid Lender Credits was reported.
@@ -2147,6 +2445,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.reverse_mortgage=="1")&(~self.lar_df.lender_credits.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("open_end_credit", "lender_credits"))
 	def v676_3(self):
 		"""
 		An invalid Lender Credits was reported.
@@ -2157,6 +2456,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.open_end_credit=="1")&(~self.lar_df.lender_credits.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("business_purpose", "lender_credits"))
 	def v676_4(self):
 		"""
 		An invalid Lender Credits was reported.
@@ -2167,6 +2467,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.business_purpose=="1")&(~self.lar_df.lender_credits.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_taken", "lender_credits"))
 	def v676_5(self):
 		"""
 		An invalid Lender Credits was reported.
@@ -2179,6 +2480,7 @@ class rules_engine(object):
 							 (~self.lar_df.lender_credits.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("interest_rate",))
 	def v677_1(self):
 		"""
 		An invalid Interest Rate was reported.
@@ -2187,11 +2489,12 @@ class rules_engine(object):
 		"""
 		field = "Interest Rate"
 		edit_name = "v677_1"
-		fail_df = self.lar_df[(~self.lar_df.interest_rate.isin(["NA", "Exempt"]))].copy()
-		fail_df = fail_df[(fail_df.interest_rate.map(lambda x: self.check_number(x, min_val=0))==False)]
+		passed, failed = self.check_numbers(self.lar_df.interest_rate, min_val=0)
+		fail_df = self.lar_df[(~self.lar_df.interest_rate.isin(["NA", "Exempt"]))&failed]
 			
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_taken", "interest_rate"))
 	def v677_2(self):
 		"""
 		An invalid Interest Rate was reported.
@@ -2204,6 +2507,7 @@ class rules_engine(object):
 							 (~self.lar_df.interest_rate.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("prepayment_penalty",))
 	def v678_1(self):
 		"""
 		An invalid Prepayment Penalty Term was reported.
@@ -2212,11 +2516,12 @@ class rules_engine(object):
 		"""
 		field = "Prepayment Term"
 		edit_name = "v678_1"
-		fail_df = self.lar_df[(~self.lar_df.prepayment_penalty.isin(["NA", "Exempt"]))].copy()
-		fail_df = fail_df[(fail_df.prepayment_penalty.map(lambda x: self.check_number(x, min_val=0))==False)]
+		passed, failed = self.check_numbers(self.lar_df.prepayment_penalty, min_val=0)
+		fail_df = self.lar_df[(~self.lar_df.prepayment_penalty.isin(["NA", "Exempt"]))&failed]
 							 
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_taken", "prepayment_penalty"))
 	def v678_2(self):
 		"""
 		An invalid Prepayment Penalty Term was reported.
@@ -2227,6 +2532,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.action_taken=="6")&(~self.lar_df.prepayment_penalty.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("reverse_mortgage", "prepayment_penalty"))
 	def v678_3(self):
 		"""
 		An invalid Prepayment Penalty Term was reported.
@@ -2237,6 +2543,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.reverse_mortgage=="1")&(~self.lar_df.prepayment_penalty.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("business_purpose", "prepayment_penalty"))
 	def v678_4(self):
 		"""
 		An invalid Prepayment Penalty Term was reported.
@@ -2247,6 +2554,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.business_purpose=="1")&(~self.lar_df.prepayment_penalty.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("prepayment_penalty", "loan_term"))
 	def v678_5(self):
 		"""
 		An invalid Prepayment Penalty Term was reported.
@@ -2255,9 +2563,10 @@ class rules_engine(object):
 		field = "Prepayment Term"
 		edit_name = "v678_5"
 		fields = ["prepayment_penalty", "loan_term"]
-		fail_df = self.lar_df[(self.lar_df.apply(lambda x: self.compare_nums(x, fields=fields), axis=1)==True)]
+		fail_df = self.lar_df[self.compare_nums(fields=fields)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("dti",))
 	def v679_1(self):
 		"""
 		An invalid Debt-to-Income Ratio was reported.
@@ -2265,9 +2574,11 @@ class rules_engine(object):
 		"""
 		field = "DTI"
 		edit_name = "v679_1"
-		fail_df = self.lar_df[(self.lar_df.dti.map(lambda x: self.check_number(x))==False)&(~self.lar_df.dti.isin(["NA", "Exempt"]))]
+		passed, failed = self.check_numbers(self.lar_df.dti)
+		fail_df = self.lar_df[failed&(~self.lar_df.dti.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_taken", "dti"))
 	def v679_2(self):
 		"""
 		An invalid Debt-to-Income Ratio was reported.
@@ -2278,6 +2589,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.action_taken.isin(("4", "5", "6")))&(~self.lar_df.dti.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("affordable_units", "dti"))
 	def v679_3(self):
 		"""
 		An invalid Debt-to-Income Ratio was reported.
@@ -2285,9 +2597,11 @@ class rules_engine(object):
 		"""
 		field = "DTI"
 		edit_name = "v679_3"
-		fail_df = self.lar_df[(self.lar_df.affordable_units.map(lambda x: self.check_number(x))==True)&(~self.lar_df.dti.isin(["NA", "Exempt"]))]
+		passed, failed = self.check_numbers(self.lar_df.affordable_units)
+		fail_df = self.lar_df[passed&(~self.lar_df.dti.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_sex", "co_app_race_1", "dti", "co_app_eth_1", "app_sex", "app_eth_1", "app_race_1"))
 	def v680_1(self):
 		"""
 		An invalid Debt-to-Income Ratio was reported.
@@ -2305,6 +2619,7 @@ class rules_engine(object):
 			(~self.lar_df.dti.isin(["NA","Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_sex", "co_app_race_1", "dti", "co_app_eth_1", "app_sex", "app_eth_1", "app_race_1"))
 	def v680_2(self):
 		"""
 		An invalid Debt-to-Income Ratio was reported.
@@ -2320,6 +2635,7 @@ class rules_engine(object):
 			(~self.lar_df.dti.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("cltv",))
 	def v681_1(self):
 		"""
 		An invalid Combined Loan-to-Value Ratio was reported.
@@ -2327,10 +2643,11 @@ class rules_engine(object):
 		"""
 		field = "CLTV"
 		edit_name = "v681_1"
-		fail_df = self.lar_df[(self.lar_df.cltv.map(lambda x: self.check_number(x, min_val=0))==False)&
-							 (~self.lar_df.cltv.isin(["NA", "Exempt"]))]
+		passed, failed = self.check_numbers(self.lar_df.cltv, min_val=0)
+		fail_df = self.lar_df[failed&(~self.lar_df.cltv.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_taken", "cltv"))
 	def v681_2(self):
 		"""
 		An invalid Combined Loan-to-Value Ratio was reported.
@@ -2341,6 +2658,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.action_taken.isin(("4", "5", "6")))&(~self.lar_df.cltv.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("loan_term",))
 	def v682_1(self):
 		"""
 		An invalid Loan Term was reported.
@@ -2348,10 +2666,11 @@ class rules_engine(object):
 		"""
 		field = "Loan Term"
 		edit_name = "v682_1"
-		fail_df = self.lar_df[(self.lar_df.loan_term.map(lambda x: self.check_number(x, min_val=0))==False)&
-			(~self.lar_df.loan_term.isin(["NA", "Exempt"]))]
+		passed, failed = self.check_numbers(self.lar_df.loan_term, min_val=0)
+		fail_df = self.lar_df[failed&(~self.lar_df.loan_term.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("reverse_mortgage", "loan_term"))
 	def v682_2(self):
 		"""
 		An invalid Loan Term was reported.
@@ -2363,6 +2682,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.reverse_mortgage=="1")&(~self.lar_df.loan_term.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("intro_rate",))
 	def v683(self):
 		"""
 		An invalid Introductory Rate Period was reported.
@@ -2372,10 +2692,11 @@ class rules_engine(object):
 		field = "Introductory Rate"
 		edit_name = "v683"
 
-		fail_df = self.lar_df[(~self.lar_df.intro_rate.isin(["NA", "Exempt"]))].copy()
-		fail_df = fail_df[(fail_df.intro_rate.map(lambda x: self.check_number(x, min_val=0))==False)]
+		passed, failed = self.check_numbers(self.lar_df.intro_rate, min_val=0)
+		fail_df = self.lar_df[(~self.lar_df.intro_rate.isin(["NA", "Exempt"]))&failed]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("balloon",))
 	def v684(self):
 		"""
 		An invalid Balloon Payment was reported.
@@ -2386,6 +2707,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.balloon.isin(("1111", "1", "2")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("int_only_pmts",))
 	def v685(self):
 		"""
 		An invalid Interest Only Payments was reported.
@@ -2396,6 +2718,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(~self.lar_df.int_only_pmts.isin(("1111", "1", "2")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("neg_amort",))
 	def v686(self):
 		"""
 		An invalid Negative Amortization was reported.
@@ -2406,6 +2729,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.neg_amort.isin(("1111", "1", "2")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("non_amort_features",))
 	def v687(self):
 		"""
 		An invalid Other Non-amortizing Features was reported.
@@ -2416,6 +2740,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.non_amort_features.isin(("1111", "1", "2")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("property_value",))
 	def v688_1(self):
 		"""
 		An invalid Property Value was reported.
@@ -2424,10 +2749,11 @@ class rules_engine(object):
 		"""
 		field = "Property Value"
 		edit_name = "v688_1"
-		fail_df = self.lar_df[(~self.lar_df.property_value.isin(["NA", "Exempt"]))].copy()
-		fail_df = fail_df[(fail_df.property_value.map(lambda x: self.check_number(x, min_val=0)==False))]
+		passed, failed = self.check_numbers(self.lar_df.property_value, min_val=0)
+		fail_df = self.lar_df[(~self.lar_df.property_value.isin(["NA", "Exempt"]))&failed]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_taken", "property_value"))
 	def v688_2(self):
 		"""
 		An invalid Property Value was reported.
@@ -2440,6 +2766,7 @@ class rules_engine(object):
 							 (~self.lar_df.property_value.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("manufactured_type",))
 	def v689_1(self):
 		"""
 		An invalid Manufactured Home Secured Property Type was reported.
@@ -2451,6 +2778,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.manufactured_type.isin(("1111", "1", "2", "3")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("affordable_units", "manufactured_type"))
 	def v689_2(self):
 		"""
 		An invalid Manufactured Home Secured Property Type was reported.
@@ -2459,10 +2787,11 @@ class rules_engine(object):
 		"""
 		field = "Manufactured Property Type"
 		edit_name = "v689_2"
-		fail_df = self.lar_df[(self.lar_df.affordable_units.map(lambda x: x.isdigit())==True)&
+		fail_df = self.lar_df[(self.lar_df.affordable_units.str.isdigit()==True)&
 			(~self.lar_df.manufactured_type.isin(["1111", "3"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("const_method", "manufactured_type"))
 	def v689_3(self):
 		"""
 		An invalid Manufactured Home Secured Property Type was reported.
@@ -2473,6 +2802,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.const_method=="1")&(~self.lar_df.manufactured_type.isin(["3", "1111"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("manufactured_interest",))
 	def v690_1(self):
 		"""
 		An invalid Manufactured Home Land Property Interest was reported.
@@ -2485,6 +2815,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.manufactured_interest.isin(("1111", "1", "2", "3", "4", "5")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("affordable_units", "manufactured_interest"))
 	def v690_2(self):
 		"""
 		An invalid Manufactured Home Land Property Interest was reported.
@@ -2492,10 +2823,11 @@ class rules_engine(object):
 		"""
 		field = "Manufactured Land Interest"
 		edit_name = "v690_2"
-		fail_df = self.lar_df[(self.lar_df.affordable_units.map(lambda x: x.isdigit())==True)&
+		fail_df = self.lar_df[(self.lar_df.affordable_units.str.isdigit()==True)&
 			(~self.lar_df.manufactured_interest.isin(["5", "1111"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("const_method", "manufactured_interest"))
 	def v690_3(self):
 		"""
 		An invalid Manufactured Home Land Property Interest was reported.
@@ -2506,6 +2838,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.const_method=="1")&(~self.lar_df.manufactured_interest.isin(["5", "1111"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("total_units",))
 	def v691(self):
 		"""
 		An invalid Total Units was reported.
@@ -2513,9 +2846,11 @@ class rules_engine(object):
 		"""
 		field = "Total Units"
 		edit_name = "v691"
-		fail_df = self.lar_df[(self.lar_df.total_units.map(lambda x: self.check_number(x, min_val=0))==False)]
+		passed, failed = self.check_numbers(self.lar_df.total_units, min_val=0)
+		fail_df = self.lar_df[failed]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("affordable_units",))
 	def v692_1(self):
 		"""
 		An invalid Multifamily Affordable Units was reported.
@@ -2523,10 +2858,11 @@ class rules_engine(object):
 			"""
 		field = "Affordable Units"
 		edit_name = "v692_1"
-		fail_df = self.lar_df[(self.lar_df.affordable_units.map(lambda x: self.check_number(x))==False)&
-							 (~self.lar_df.affordable_units.isin(["NA", "Exempt"]))]
+		passed, failed = self.check_numbers(self.lar_df.affordable_units)
+		fail_df = self.lar_df[failed&(~self.lar_df.affordable_units.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("total_units", "affordable_units"))
 	def v692_2(self):
 		"""
 		An invalid Multifamily Affordable Units was reported.
@@ -2534,9 +2870,10 @@ class rules_engine(object):
 		"""
 		field = "Affordable Units"
 		edit_name = "v692_2"
-		fail_df = self.lar_df[(self.lar_df.total_units.map(lambda x: int(x)<5))&(~self.lar_df.affordable_units.isin(["NA", "Exempt"]))]
+		fail_df = self.lar_df[(self.typed.numbers("total_units")<5)&(~self.lar_df.affordable_units.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("affordable_units", "total_units"))
 	def v692_3(self):
 		"""
 		An invalid Multifamily Affordable Units was reported.
@@ -2547,10 +2884,10 @@ class rules_engine(object):
 		field = "Affordable Units"
 		edit_name = "v692_3"
 		fields = ["affordable_units", "total_units"]
-		fail_df = self.lar_df[~self.lar_df.affordable_units.isin(["Exempt", "NA"])]
-		fail_df = fail_df[fail_df.apply(lambda x: self.compare_nums(x, fields=fields), axis=1)==True]
+		fail_df = self.lar_df[~self.lar_df.affordable_units.isin(["Exempt", "NA"])&self.compare_nums(fields=fields)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_submission",))
 	def v693_1(self):
 		"""
 		An invalid Application Channel data field was reported.
@@ -2561,6 +2898,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.app_submission.isin(("1111", "1", "2", "3")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_taken", "app_submission"))
 	def v693_2(self):
 		"""
 		An invalid Application Channel data field was reported.
@@ -2571,6 +2909,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[((self.lar_df.action_taken=="6")&(~self.lar_df.app_submission.isin(["3", "1111"])))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_submission", "action_taken"))
 	def v693_3(self):
 		"""
 		Impact of S2155: Update to: 
@@ -2581,6 +2920,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[((self.lar_df.app_submission=="3")&(self.lar_df.action_taken!="6"))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("initially_payable",))
 	def v694_1(self):
 		"""
 		An invalid Application Channel data field was reported.
@@ -2591,6 +2931,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.initially_payable.isin(("1111", "1", "2", "3")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("initially_payable", "action_taken"))
 	def v694_2(self):
 		"""
 		An invalid Application Channel data field was reported.
@@ -2602,6 +2943,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.action_taken=="6")&(~self.lar_df.initially_payable.isin(["1111", "3"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("initially_payable", "action_taken"))
 	def v694_3(self):
 		"""
 		An invalid Application Channel data field was reported.
@@ -2613,6 +2955,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.action_taken=="1")&(~self.lar_df.initially_payable.isin(("1111", "1", "2")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("mlo_id",))
 	def v695_1(self):
 		"""
 		An invalid NMLSR Identifier was reported.
@@ -2622,10 +2965,11 @@ class rules_engine(object):
 		"""
 		field = "NMLS ID"
 		edit_name = "v695_1"
-		fail_df = self.lar_df[(self.lar_df.mlo_id.map(lambda x: self.check_number(x)) == False) &
-							  (~self.lar_df.mlo_id.isin(["NA", "Exempt"]))]
+		passed, failed = self.check_numbers(self.lar_df.mlo_id)
+		fail_df = self.lar_df[failed&(~self.lar_df.mlo_id.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
     
+	@edit(fields=("mlo_id",))
 	def v695_2(self):
 		"""
 		An invalid NMLSR Identifier was reported.
@@ -2634,10 +2978,11 @@ class rules_engine(object):
 		"""
 		field = "NMLS ID"
 		edit_name = "v695_2"
-		fail_df = self.lar_df[(self.lar_df.mlo_id.map(lambda x: self.check_number(x, min_val = 0))==False)&
-							 (~self.lar_df.mlo_id.isin(["NA", "Exempt"]))]
+		passed, failed = self.check_numbers(self.lar_df.mlo_id, min_val=0)
+		fail_df = self.lar_df[failed&(~self.lar_df.mlo_id.isin(["NA", "Exempt"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("aus_5", "aus_4", "aus_3", "aus_1", "aus_2"))
 	def v696_1(self):
 		"""
 		An invalid Automated Underwriting System data field was reported. 
@@ -2654,6 +2999,7 @@ class rules_engine(object):
 			(~self.lar_df.aus_5.isin(("1", "2", "3", "4", "5","", "7")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("aus_result_5", "aus_result_4", "aus_result_3", "aus_result_1", "aus_result_2"))
 	def v696_2(self):
 		"""
 		2) Automated Underwriting System Result: 1 must equal 1111, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14,
@@ -2674,6 +3020,7 @@ class rules_engine(object):
 		|(~self.lar_df.aus_result_4.isin(aus_n_results))|(~self.lar_df.aus_result_5.isin(aus_n_results))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("aus_1", "aus_2", "aus_3", "aus_4", "aus_5", "aus_result_1", "aus_result_2", "aus_result_3", "aus_result_4", "aus_result_5"))
 	def v696_3(self):
 		"""
 		An invalid Automated Underwriting System data field was reported.
@@ -2686,10 +3033,10 @@ class rules_engine(object):
 		vals_1 = ("1111", "1", "2", "3", "4", "5", "6")
 		vals_2 = ("1111", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12", "13", "14", "15", 
 			"16", "17", "18", "19", "20", "21", "22", "23", "24")
-		fail_df = self.lar_df[(self.lar_df.apply(lambda x: self.check_counts(x, fields_1=fields_1, fields_2=fields_2, vals_1=vals_1, 
-			vals_2=vals_2),axis=1)==False)]
+		fail_df = self.lar_df[self.check_counts(fields_1=fields_1, fields_2=fields_2, vals_1=vals_1, vals_2=vals_2)==False]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("aus_5", "aus_4", "aus_3", "aus_result_5", "aus_1", "aus_2", "aus_result_4", "aus_result_3", "aus_result_1", "aus_result_2"))
 	def v699(self):
 		"""
 		If Automated Underwriting System: 1; Automated Underwriting System: 2; Automated Underwriting
@@ -2710,6 +3057,7 @@ class rules_engine(object):
 			((self.lar_df.aus_5=="5")&(~self.lar_df.aus_result_5.isin(aus_results)))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("aus_1", "aus_5", "aus_4", "aus_3", "aus_2", "aus_result_5", "aus_result_4", "aus_result_3", "aus_result_1", "aus_result_2"))
 	def v700_1(self):
 		"""
 		An invalid Automated Underwriting System data field was reported.
@@ -2725,6 +3073,7 @@ class rules_engine(object):
 			(self.lar_df.aus_4!="")|(self.lar_df.aus_5!=""))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("aus_result_1", "aus_5", "aus_4", "aus_3", "aus_2", "aus_result_5", "aus_result_4", "aus_result_3", "aus_1", "aus_result_2"))
 	def v700_2(self):
 		"""
 		An invalid Automated Underwriting System data field was reported.
@@ -2740,6 +3089,7 @@ class rules_engine(object):
 			(self.lar_df.aus_4!="")|(self.lar_df.aus_5!=""))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("aus_5", "aus_result_5", "aus_4", "aus_result_4", "aus_2", "aus_result_2", "aus_3", "aus_result_3"))
 	def v701(self):
 		"""
 		An invalid Automated Underwriting System data field was reported.
@@ -2756,6 +3106,7 @@ class rules_engine(object):
 			((self.lar_df.aus_5=="")&(self.lar_df.aus_result_5!=""))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("aus_code_5", "aus_5", "aus_4", "aus_3", "aus_1", "aus_2"))
 	def v702_1(self):
 		"""
 		An invalid Automated Underwriting System data field was reported.
@@ -2769,6 +3120,7 @@ class rules_engine(object):
 			(self.lar_df.aus_code_5=="")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("aus_code_5", "aus_5", "aus_4", "aus_3", "aus_1", "aus_2"))
 	def v702_2(self):
 		"""
 		An invalid Automated Underwriting System data field was reported.
@@ -2782,6 +3134,7 @@ class rules_engine(object):
 			(self.lar_df.aus_code_5!="")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("aus_code_16", "aus_result_5", "aus_result_4", "aus_result_3", "aus_result_1", "aus_result_2"))
 	def v703_1(self):
 		"""
 		An invalid Automated Underwriting System Result data field was reported.
@@ -2795,6 +3148,7 @@ class rules_engine(object):
 			(self.lar_df.aus_result_4=="16")|(self.lar_df.aus_result_5=="16"))&(self.lar_df.aus_code_16=="")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("aus_code_16", "aus_result_5", "aus_result_4", "aus_result_3", "aus_result_1", "aus_result_2"))
 	def v703_2(self):
 		"""
 		An invalid Automated Underwriting System Result data field was reported.
@@ -2808,6 +3162,7 @@ class rules_engine(object):
 			(self.lar_df.aus_result_3!="16")&(self.lar_df.aus_result_4!="16")&(self.lar_df.aus_result_5!="16"))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_taken", "aus_1"))
 	def v704_1(self):
 		"""
 		An invalid Automated Underwriting System data field was reported.
@@ -2818,6 +3173,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.action_taken=="6")&(~self.lar_df.aus_1.isin(["6", "1111"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_taken", "aus_result_1"))
 	def v704_2(self):
 		"""
 		An invalid Automated Underwriting System data field was reported.
@@ -2829,6 +3185,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.action_taken=="6")&(~self.lar_df.aus_result_1.isin(["17", "1111"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_sex", "co_app_sex", "app_eth_1", "app_race_1", "co_app_eth_1", "co_app_race_1", "aus_1", "aus_result_1"))
 	def v705_1(self):
 		"""
 		An invalid Automated Underwriting System data field was reported.
@@ -2846,6 +3203,7 @@ class rules_engine(object):
 			((~self.lar_df.aus_1.isin(["1111","6"]))|(~self.lar_df.aus_result_1.isin(["17", "1111"])))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_sex", "co_app_sex", "app_eth_1", "app_race_1", "co_app_eth_1", "co_app_race_1", "aus_1", "aus_result_1"))
 	def v705_2(self):
 		"""
 		An invalid Automated Underwriting System data field was reported.
@@ -2864,6 +3222,7 @@ class rules_engine(object):
 			((~self.lar_df.aus_1.isin(["6", "1111"]))|(~self.lar_df.aus_result_1.isin(["17","1111"])))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("reverse_mortgage",))
 	def v706(self):
 		"""
 		An invalid Reverse Mortgage was reported.
@@ -2874,6 +3233,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.reverse_mortgage.isin(("1111", "1", "2")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("open_end_credit",))
 	def v707(self):
 		"""
 		An invalid Open-End Line of Credit was reported.
@@ -2885,6 +3245,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.open_end_credit.isin(("1111", "1", "2")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("business_purpose",))
 	def v708(self):
 		"""
 		An invalid Business or Commercial Purpose was reported.
@@ -2896,6 +3257,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[~(self.lar_df.business_purpose.isin(("1111", "1", "2")))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("zip_code", "street_address", "city"))
 	def v709(self):
 		"""
 		An invalid Property Address was reported. Please review the information below and update your file accordingly.
@@ -2908,6 +3270,7 @@ class rules_engine(object):
 			((self.lar_df.street_address != "Exempt") | (self.lar_df.city != "Exempt") | (self.lar_df.zip_code != "Exempt"))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_credit_score", "co_app_score_name", "co_app_credit_score", "app_score_name"))
 	def v710_1(self):
 		"""
 		If the Credit Score exemption election is taken:
@@ -2922,6 +3285,7 @@ class rules_engine(object):
 				(self.lar_df.app_score_name != "1111") | (self.lar_df.co_app_score_name != "1111"))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 	
+	@edit(fields=("app_credit_score", "app_score_code_8", "co_app_score_code_8"))
 	def v710_2(self):
 		"""
 		If the Credit Score exemption election is taken:
@@ -2932,10 +3296,11 @@ class rules_engine(object):
 		"""
 		field = "Credit Score"
 		edit_name = "v710_2"
-		fail_df = self.lar_df[(self.lar_df.app_credit_score == "1111") & ((self.lar_df.app_score_name != "") |
-				(self.lar_df.app_score_code_8 != "") | (self.lar_df.co_app_score_name != "") | (self.lar_df.co_app_score_code_8 != ""))]
+		fail_df = self.lar_df[(self.lar_df.app_credit_score == "1111") & ((self.lar_df.app_score_code_8 != "") |
+				(self.lar_df.co_app_score_code_8 != ""))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("denial_1", "denial_code_9", "denial_4", "denial_2", "denial_3"))
 	def v711(self):
 		"""
 		1) If the Reason for Denial exemption election is taken, Reason for Denial: 1 must be reported 1111;
@@ -2950,6 +3315,7 @@ class rules_engine(object):
 					| (self.lar_df.denial_4 != "") | (self.lar_df.denial_code_9 != ""))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("loan_costs", "points_fees"))
 	def v712(self):
 		"""
 		1) If the Total Loan Costs or Total Points and Fees exemption election is taken, Total Loan Costs and Total Points and Fees must be reported Exempt.
@@ -2960,6 +3326,7 @@ class rules_engine(object):
 					| (self.lar_df.points_fees != "Exempt"))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("aus_1", "aus_result_1"))
 	def v713_1(self):
 		"""
 		If the Automated Underwriting System exemption election is taken,
@@ -2970,6 +3337,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.aus_1 == "1111") & (self.lar_df.aus_result_1 != "1111")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 	
+	@edit(fields=("aus_1", "aus_code_16", "aus_result_5", "aus_result_4", "aus_result_3", "aus_result_2", "aus_code_5", "aus_5", "aus_4", "aus_2", "aus_3"))
 	def v713_2(self):
 		"""
 		If the Automated Underwriting System exemptionmelection is taken,
@@ -2987,6 +3355,7 @@ class rules_engine(object):
 			| (self.lar_df.aus_result_4 != "") | (self.lar_df.aus_result_5 != "") | (self.lar_df.aus_code_16 != ""))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_submission", "initially_payable"))
 	def v714(self):
 		"""
 		1) If the Application Channel exemption election isntaken, Submission of Application and Initially Payable to Your Institution must be reported 1111.
@@ -2997,6 +3366,7 @@ class rules_engine(object):
 		((self.lar_df.app_submission != "1111") | (self.lar_df.initially_payable != "1111"))]  
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
         
+	@edit(fields=("neg_amort", "non_amort_features", "int_only_pmts", "balloon"))
 	def v715(self):
 		"""
 		1) If the Non-Amortizing Features exemption electionn is taken, Balloon Payment, Interest-Only Payments,
@@ -3013,6 +3383,7 @@ class rules_engine(object):
 			| (self.lar_df.non_amort_features != "1111"))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("state", "county"))
 	def v716(self):
 		"""
 		The reported State and County are not a valid combination. If neither State nor County were
@@ -3022,12 +3393,13 @@ class rules_engine(object):
 		field = "state, county"
 		#note state is a 2 letter code, county is a length 5 string of numerals
 
-		fail_df = self.lar_df.copy()
-		#set state letter codes based on first 2 county digits
-		fail_df["state_from_county"] = fail_df.apply(lambda x: self.state_codes_rev[x.county[:2]], axis=1)
-		fail_df = fail_df[fail_df.state!=fail_df.state_from_county]
+		fail_df = self.lar_df[(self.lar_df.state!="NA")&(self.lar_df.county!="NA")]
+		#state letter codes based on first 2 county digits
+		state_from_county = fail_df.county.str[:2].map(self.state_codes_rev)
+		fail_df = fail_df[fail_df.state!=state_from_county]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(row_type="TS", fields=("contact_email",))
 	def v717(self):
 		"""
 		The required format for the Contact Person’s Email Address is name@example.com, and it cannot be left blank.
@@ -3035,9 +3407,10 @@ class rules_engine(object):
 		"""
 		edit_name = "v717"
 		field = "contact_email"
-		fail_df = self.ts_df[~self.ts_df.contact_email.apply(lambda x: "@" in x and "." in x)]
+		fail_df = self.ts_df[~(self.ts_df.contact_email.str.contains("@", regex=False)&self.ts_df.contact_email.str.contains(".", regex=False))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
     
+	@edit(row_type="TS", fields=("inst_name",))
 	def v719(self):
 		"""
 		An invalid Financial Institution Name was reported.
@@ -3048,9 +3421,11 @@ class rules_engine(object):
 		"""
 		edit_name = "v719"
 		field = "inst_name"
-		fail_df = self.ts_df[self.ts_df.inst_name.map(lambda x: self.check_number(x))]
+		passed, failed = self.check_numbers(self.ts_df.inst_name)
+		fail_df = self.ts_df[passed]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
         
+	@edit(fields=("uli",), file_level=True)
 	def q600(self):
 		"""
 		1) A duplicate ULI was reported. 
@@ -3060,17 +3435,20 @@ class rules_engine(object):
 		fail_df = self.lar_df[self.lar_df.duplicated(keep=False, subset='uli')==True]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_date", "action_date"))
 	def q601(self):
 		"""
 		1) Application Date occurs more than two years prior to Action Taken Date. 
 		"""
 		field = "Application Date"
 		edit_name = "q601"
-		fail_df = self.lar_df[self.lar_df.app_date!="NA"].copy()
-		#true return in years_between() indicates that the delta between years is greater than threshold
-		fail_df = fail_df[fail_df.apply(lambda x: self.years_between(x.app_date, x.action_date, thresh=2.0)==True, axis=1)]
+		#the row-wise years_between() returned True only when a date was invalid and None for any pair of valid dates,
+		#so rows with an invalid application or action date are the rows that fail
+		years = self.years_between(self.lar_df.app_date, self.lar_df.action_date)
+		fail_df = self.lar_df[(self.lar_df.app_date!="NA")&years.isna()]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("zip_code", "state", "street_address", "city"))
 	def q602(self):
 		"""
 		Street Address was reported NA, however City, State and Zip Code were provided. 
@@ -3081,6 +3459,7 @@ class rules_engine(object):
 			(self.lar_df.city!="NA")&(self.lar_df.state!="NA")&(self.lar_df.zip_code!="NA")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("tract", "county"))
 	def q603(self):
 		"""
 		1) The County has a population of greater than 30,000 according to the most recent decennial census and
@@ -3088,9 +3467,10 @@ class rules_engine(object):
 		"""
 		field = "County/Census Tract"
 		edit_name = "q603"
-		fail_df = self.lar_df[(self.lar_df.tract=="NA")&(~self.lar_df.county.isin(self.geographic_data[self.geographic_data.small_county=="1"]))]
+		fail_df = self.lar_df[(self.lar_df.tract=="NA")&(self.lar_df.county!="NA")&(~self.lar_df.county.isin(self.geo_index.small_counties))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("loan_type", "purchaser_type"))
 	def q605_1(self):
 		"""
 		If Type of Purchaser equals 1 or 3, then Loan Type generally should equal 1.
@@ -3100,6 +3480,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.purchaser_type.isin(["1","3"]))&(self.lar_df.loan_type!="1")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("purchaser_type", "loan_type"))
 	def q605_2(self):
 		"""
 		If Type of Purchaser equals 2, then Loan Type generally should equal 2, 3 or 4.
@@ -3109,16 +3490,17 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.purchaser_type=="2")&(~self.lar_df.loan_type.isin(["2", "3", "4"]))].copy()
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("income",))
 	def q606(self):
 		"""
 		If Income is a number, then it generally should be less than $10 million (entered as 10000).
 		"""
 		field = "Income"
 		edit_name = "q606"
-		fail_df = self.lar_df[(self.lar_df.income!="NA")].copy()
-		fail_df = fail_df[(fail_df.income.apply(lambda x: float(x)>=10000))]
+		fail_df = self.lar_df[(self.lar_df.income!="NA")&(self.typed.numbers("income")>=10000)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("lien", "loan_amount"))
 	def q607(self):
 		"""
 		If Lien Status equals 2, 
@@ -3126,10 +3508,10 @@ class rules_engine(object):
 		"""
 		field = "Loan Amount/Lien Status"
 		edit_name = "q607"
-		fail_df = self.lar_df[(self.lar_df.loan_amount!="NA")].copy()
-		fail_df = fail_df[(fail_df.lien=="2")&(fail_df.loan_amount.apply(lambda x: int(x)>250000))]
+		fail_df = self.lar_df[(self.lar_df.loan_amount!="NA")&(self.lar_df.lien=="2")&(self.typed.numbers("loan_amount")>250000)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("action_taken", "action_date", "app_date"))
 	def q608(self):
 		"""
 		If Action Taken equals 1, then the Action Taken Date generally should occur after the Application Date.
@@ -3139,6 +3521,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.action_taken=="1")&(self.lar_df.action_date <= self.lar_df.app_date)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("purchaser_type", "rate_spread"))
 	def q609(self):
 		"""
 		1) If Type of Purchaser equals 1, 2, 3, or 4, 
@@ -3146,10 +3529,10 @@ class rules_engine(object):
 		"""
 		field = "Purchaser Type/Rate Spread"
 		edit_name = "q609"
-		fail_df = self.lar_df[(~self.lar_df.rate_spread.isin(["NA", "Exempt",""]))].copy()
-		fail_df = fail_df[fail_df.purchaser_type.isin(["1","2","3","4"])&(fail_df.rate_spread.apply(lambda x: float(x)>10))]
+		fail_df = self.lar_df[self.lar_df.purchaser_type.isin(["1","2","3","4"])&(self.typed.numbers("rate_spread")>10)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)	
 
+	@edit(fields=("hoepa", "action_taken", "lien", "rate_spread"))
 	def q610(self):
 		"""
 		If Action Taken equals 1, Lien Status equals 1, and Rate Spread is greater than 6.5%, 
@@ -3157,11 +3540,11 @@ class rules_engine(object):
 		"""
 		field = "Action Taken/Lien Status/Rate Spread/HOEPA Status"
 		edit_name = "q610"
-		fail_df = self.lar_df[~self.lar_df.rate_spread.isin(["NA", "Exempt", ""])].copy()
-		fail_df = fail_df[(fail_df.action_taken=="1")&(fail_df.lien=="1")&
-			(fail_df.rate_spread.apply(lambda x: float(x)>6.5))&(fail_df.hoepa!="1")]
+		fail_df = self.lar_df[(self.lar_df.action_taken=="1")&(self.lar_df.lien=="1")&
+			(self.typed.numbers("rate_spread")>6.5)&(self.lar_df.hoepa!="1")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("rate_spread", "hoepa", "action_taken", "lien"))
 	def q611(self):
 		"""
 		If Action Taken equals 1, Lien Status equals 2, and Rate Spread is greater than 8.5%, 
@@ -3169,11 +3552,11 @@ class rules_engine(object):
 		"""
 		field = "Action Taken, Lien Status, Rate Spread/HOEPA Status"
 		edit_name = "q611"
-		fail_df = self.lar_df[~self.lar_df.rate_spread.isin(["NA", "Exempt", ""])]
-		fail_df = fail_df[(fail_df.action_taken=="1")&(fail_df.lien=="2")&(fail_df.hoepa!="1")&
-			(fail_df.rate_spread.apply(lambda x: float(x)>8.5))]
+		fail_df = self.lar_df[(self.lar_df.action_taken=="1")&(self.lar_df.lien=="2")&(self.lar_df.hoepa!="1")&
+			(self.typed.numbers("rate_spread")>8.5)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("purchaser_type", "hoepa"))
 	def q612(self):
 		"""
 		If Type of Purchaser equals 1 or 3, then HOEPA Status generally should be 2 or 3.
@@ -3184,6 +3567,7 @@ class rules_engine(object):
 		(~self.lar_df.hoepa.isin(["2","3"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 		
+	@edit(fields=("business_purpose", "loan_purpose"))
 	def q613(self):
 		"""
 		If Business or Commercial Purpose equals 1, then Loan Purpose generally should equal 1, 2, 31, 32, or 5.
@@ -3193,6 +3577,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.business_purpose=="1")&(~self.lar_df.loan_purpose.isin(["1","2","31","32","5"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_age",))
 	def q614_1(self):
 		"""
 		The Age of Applicant or Borrower generally should be between 18 and 100 unless the Age of Applicant or Borrower 
@@ -3200,11 +3585,11 @@ class rules_engine(object):
 		"""
 		field = "Age of Applicant or Borrower"
 		edit_name = "q614_1"
-		fail_df = self.lar_df[self.lar_df.app_age!="NA"].copy()
-		fail_df = fail_df[fail_df.app_age!="8888"]
-		fail_df = fail_df[~(fail_df.app_age.apply(lambda x: 18 <= int(x) <= 100))]
+		age = self.typed.numbers("app_age")
+		fail_df = self.lar_df[(self.lar_df.app_age!="NA")&(self.lar_df.app_age!="8888")&~((age>=18)&(age<=100))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_age",))
 	def q614_2(self):
 		"""
 		The Age of Co-Applicant or Co-Borrower generally should be between 18 and 100 unless the Age of CoApplicant 
@@ -3212,11 +3597,11 @@ class rules_engine(object):
 		"""
 		field = "Age of Co Applicant or Co Borrower"
 		edit_name = "q614_2"
-		fail_df = self.lar_df[self.lar_df.co_app_age!="NA"].copy()
-		fail_df = fail_df[fail_df.co_app_age!="8888"]
-		fail_df = fail_df[~(fail_df.co_app_age.apply(lambda x: 18 <= int(x) <= 100))]
+		age = self.typed.numbers("co_app_age")
+		fail_df = self.lar_df[(self.lar_df.co_app_age!="NA")&(self.lar_df.co_app_age!="8888")&~((age>=18)&(age<=100))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("loan_costs", "origination_fee"))
 	def q615_1(self):
 		"""
 		1) If Total Loan Costs and Origination Charges are not reported NA or Exempt, and are both nonzero
@@ -3224,12 +3609,13 @@ class rules_engine(object):
 		"""
 		field = "Origination Charges/Total Loan Costs/Total Points and Fees"
 		edit_name = "q615_1"
-		fail_df = self.lar_df[(~self.lar_df.origination_fee.isin(["NA", "Exempt"]))&(~self.lar_df.loan_costs.isin(["NA", "Exempt"]))].copy()
-		fail_df = fail_df[(fail_df.loan_costs.apply(lambda x: float(x) > 0)) & 
-                          (fail_df.origination_fee.apply(lambda x: float(x) > 0))&
-                          (fail_df.loan_costs<fail_df.origination_fee)]
+		#NA, Exempt and blank values are NaN in the typed columns so they fail every comparison
+		loan_costs = self.typed.numbers("loan_costs")
+		origination_fee = self.typed.numbers("origination_fee")
+		fail_df = self.lar_df[(loan_costs > 0)&(origination_fee > 0)&(loan_costs < origination_fee)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("origination_fee", "points_fees"))
 	def q615_2(self):
 		"""
 		2) If Total Points and Fees and Origination Charges are not reported NA or Exempt, and are both nonzero
@@ -3237,19 +3623,15 @@ class rules_engine(object):
 		"""
 		field = "Origination Charges/Total Loan Costs/Total Points and Fees"
 		edit_name = "q615_2"
-		fail_df = self.lar_df[(~self.lar_df.origination_fee.isin(["NA", "Exempt", ""]))&
-				(~self.lar_df.points_fees.isin(["NA", "Exempt"]))].copy()
-		#remove blanks to allow float conversion in failure test
-		blanks = fail_df[fail_df.points_fees.isin([""])].copy()
-		fail_df = fail_df[~fail_df.points_fees.isin([""])]
-		fail_df.origination_fee = fail_df.origination_fee.apply(lambda x: float(x))
-		fail_df.points_fees = fail_df.points_fees.apply(lambda x: float(x))
-		fail_df = fail_df[(fail_df.points_fees.apply(lambda x: float(x) > 0)) & 
-                        	(fail_df.origination_fee.apply(lambda x: float(x) > 0))&
-                        	(fail_df.points_fees < fail_df.origination_fee)]
-		fail_df = pd.concat([fail_df, blanks]) #add blanks back to fail_df for results reporting
+		points_fees = self.typed.numbers("points_fees")
+		origination_fee = self.typed.numbers("origination_fee")
+		origination_fee_reported = (self.typed.sentinels("origination_fee") & (NA|EXEMPT|BLANK))==0
+		#blank Total Points and Fees fail when Origination Charges are reported
+		fail_df = self.lar_df[origination_fee_reported&(((points_fees > 0)&(origination_fee > 0)&(points_fees < origination_fee))|
+			(self.typed.sentinels("points_fees")==BLANK))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("loan_costs", "discount_points"))
 	def q616_1(self):
 		"""
 		1) If Total Loan Costs and Discount Points are not reported NA or Exempt, 
@@ -3257,17 +3639,11 @@ class rules_engine(object):
 		"""
 		field = "Discount Points; Total Loan Costs; Total Points and Fees"
 		edit_name = "q616_1"
-		fail_df = self.lar_df[(~self.lar_df.loan_costs.isin(["NA", "Exempt"]))&
-				(~self.lar_df.discount_points.isin(["NA", "Exempt"]))].copy()
-		
-		#fail_df.loan_costs = fail_df.loan_costs.map({"": 0.0})
-		#fail_df.discount_points = fail_df.discount_points.map({"": 0.0})
-
-		fail_df.loan_costs = fail_df.loan_costs.apply(lambda x: float(x))
-		fail_df.discount_points = fail_df.discount_points.apply(lambda x: float(x))
-		fail_df = fail_df[(fail_df.loan_costs<fail_df.discount_points)]
+		#NA, Exempt and blank values are NaN in the typed columns so they fail every comparison
+		fail_df = self.lar_df[self.typed.numbers("loan_costs") < self.typed.numbers("discount_points")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("points_fees", "discount_points"))
 	def q616_2(self):
 		"""
 		2) If Total Points and Fees and Discount Points are not reported NA or Exempt, 
@@ -3275,17 +3651,13 @@ class rules_engine(object):
 		"""
 		field = "Discount Points; Total Loan Costs; Total Points and Fees"
 		edit_name = "q616_2"
-		fail_df = self.lar_df[(~self.lar_df.points_fees.isin(["Exempt", "NA"]))&
-							  (~self.lar_df.discount_points.isin(["NA", "Exempt"]))].copy()
-		#remove blanks to allow float conversion in failure test
-		blanks = fail_df[fail_df.points_fees.isin([""])].copy()
-		fail_df = fail_df[~fail_df.points_fees.isin([""])]
-		fail_df.points_fees = fail_df.points_fees.apply(lambda x: float(x))
-		fail_df.discount_points = fail_df.discount_points.apply(lambda x: float(x))
-		fail_df = fail_df[(fail_df.discount_points>fail_df.points_fees)]
-		fail_df = pd.concat([fail_df, blanks]) #add blanks back to fail_df for results reporting
+		discount_points_reported = (self.typed.sentinels("discount_points") & (NA|EXEMPT|BLANK))==0
+		#blank Total Points and Fees fail when Discount Points are reported
+		fail_df = self.lar_df[discount_points_reported&((self.typed.numbers("discount_points") > self.typed.numbers("points_fees"))|
+			(self.typed.sentinels("points_fees")==BLANK))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 		
+	@edit(fields=("cltv", "loan_amount", "property_value"))
 	def q617(self):
 		"""
 		If Loan Type equals 1 and Combined Loan-to-Value Ratio and Property Value are not reported NA or Exempt, 
@@ -3294,13 +3666,13 @@ class rules_engine(object):
 		"""
 		field = "cltv, Loan Amount, and Property Value"
 		edit_name = "q617"
-		fail_df = self.lar_df[(~self.lar_df.cltv.isin(["NA", "Exempt", ""]))&
-							  (~self.lar_df.property_value.isin(["NA", "Exempt",""]))].copy()
-		fail_df.cltv = fail_df.cltv.apply(lambda x: float(x))
-		fail_df["ltv"] = (fail_df.loan_amount.apply(lambda x: float(x)) / fail_df.property_value.apply(lambda x: float(x))) *100
-		fail_df = fail_df[fail_df.cltv < fail_df.ltv]
+		#NA, Exempt and blank values are NaN in the typed columns so they fail every comparison
+		with np.errstate(divide="ignore", invalid="ignore"):
+			ltv = self.typed.numbers("loan_amount") / self.typed.numbers("property_value") * 100
+		fail_df = self.lar_df[self.typed.numbers("cltv") < ltv]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("const_method", "manufactured_type"))
 	def q618(self):
 		"""
 		If Construction Method equals 2, then Manufactured Home Secured Property Type generally should not be 3.
@@ -3310,6 +3682,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.const_method=="2")&(self.lar_df.manufactured_type=="3")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("const_method", "manufactured_interest"))
 	def q619(self):
 		"""
 		If Construction Method equals 2, then Manufactured Home Land Property Interest generally should not be 5.
@@ -3319,6 +3692,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.const_method=="2")&(self.lar_df.manufactured_interest=="5")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("business_purpose", "mlo_id"))
 	def q620(self):
 		"""
 		If Business or Commercial Purpose equals 2, then NMLSR ID generally should not be NA.
@@ -3328,17 +3702,19 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.business_purpose=="2")&(self.lar_df.mlo_id=="NA")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("mlo_id",))
 	def q621(self):
 		"""
 		The NMLSR ID should be alphanumeric up to 12 characters. Your data indicates a number outside of this range.
 		"""
 		field = "NMLSR ID"
 		edit_name = "q621"
-		invalid_chars = set(string.punctuation)
-		fail_df = self.lar_df[(self.lar_df.mlo_id.apply(lambda x: len(x)>12))|
-				 			  (self.lar_df.mlo_id.apply(lambda x: any(char in invalid_chars for char in x)==True))]
+		invalid_chars = "[" + re.escape(string.punctuation) + "]"
+		fail_df = self.lar_df[(self.lar_df.mlo_id.str.len()>12)|
+				 			  (self.lar_df.mlo_id.str.contains(invalid_chars)==True)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("reverse_mortgage", "app_age"))
 	def q622(self):
 		"""
 		If Reverse Mortgage equals 1, 
@@ -3347,9 +3723,10 @@ class rules_engine(object):
 		"""
 		field = "Reverse Mortgage; Age of Applicant or Borrower"
 		edit_name = "q622"
-		fail_df = self.lar_df[(self.lar_df.reverse_mortgage=="1")&(self.lar_df.app_age.apply(lambda x: int(x)<62))]
+		fail_df = self.lar_df[(self.lar_df.reverse_mortgage=="1")&(self.typed.numbers("app_age")<62)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df) 
 
+	@edit(fields=("income", "loan_amount", "total_units"))
 	def q623(self):
 		"""
 		If Total Units is less than or equal to 4, and Income is less than or equal to $200,000 (reported as 200), 
@@ -3357,12 +3734,12 @@ class rules_engine(object):
 		"""
 		field = "Loan Amount; Total Units; Income"
 		edit_name = "q623"
-		fail_df = self.lar_df[self.lar_df.income!="NA"]
-		fail_df = fail_df[(fail_df.total_units.apply(lambda x: int(x)<=4))&
-				 (fail_df.income.apply(lambda x: float(x) <=200))&
-			 	 (fail_df.loan_amount.apply(lambda x: int(x)>=2000000))]
+		fail_df = self.lar_df[(self.lar_df.income!="NA")&(self.typed.numbers("total_units")<=4)&
+				 (self.typed.numbers("income")<=200)&
+			 	 (self.typed.numbers("loan_amount")>=2000000)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("loan_type", "total_units", "loan_amount"))
 	def q624(self):
 		"""
 		If Loan Type equals 2, and Total Units equals 1, 
@@ -3372,9 +3749,10 @@ class rules_engine(object):
 		edit_name = "q624"
 		fail_df = self.lar_df[(self.lar_df.loan_type=="2")&
 			     (self.lar_df.total_units=="1")&
-				 (self.lar_df.loan_amount.apply(lambda x: int(x)>637000))]
+				 (self.typed.numbers("loan_amount")>637000)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("loan_type", "loan_amount", "total_units"))
 	def q625(self):
 		"""
 		If Loan Type equals 3, and Total Units is less than or equal to 4, 
@@ -3383,10 +3761,11 @@ class rules_engine(object):
 		field = "Loan Type; Total Units; Loan Amount"
 		edit_name = "q625"
 		fail_df = self.lar_df[(self.lar_df.loan_type=="3")&
-				 (self.lar_df.total_units.apply(lambda x: int(x)<=4))&
-				 (self.lar_df.loan_amount.apply(lambda x: int(x)>1050000))]
+				 (self.typed.numbers("total_units")<=4)&
+				 (self.typed.numbers("loan_amount")>1050000)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("loan_amount", "purchaser_type", "total_units"))
 	def q626(self):
 		"""
 		If Type of Purchaser equals 1, 2, 3, or 4, and Total Units is less than or equal to 4, 
@@ -3395,10 +3774,11 @@ class rules_engine(object):
 		field = "Type of Purchaser; Total Units; Loan Amount"
 		edit_name = "q626"
 		fail_df = self.lar_df[(self.lar_df.purchaser_type.isin(["1","2","3","4"]))&
-							  (self.lar_df.total_units.apply(lambda x: int(x)<=4))&
-							  (self.lar_df.loan_amount.apply(lambda x: int(x)>1225000))]
+							  (self.typed.numbers("total_units")<=4)&
+							  (self.typed.numbers("loan_amount")>1225000)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("loan_amount", "total_units"))
 	def q627(self):
 		"""
 		If Total Units is greater than or equal to 5, 
@@ -3406,11 +3786,12 @@ class rules_engine(object):
 		"""
 		field = "Total Units; Loan Amount"
 		edit_name = "q627"
-		fail_df = self.lar_df[(self.lar_df.total_units.apply(lambda x: int(x)>=5))&
-							  (self.lar_df.loan_amount.apply(lambda x: int(x)<=100000))|
-							  (self.lar_df.loan_amount.apply(lambda x: int(x)>=10000000))]
+		fail_df = self.lar_df[(self.typed.numbers("total_units")>=5)&
+							  (self.typed.numbers("loan_amount")<=100000)|
+							  (self.typed.numbers("loan_amount")>=10000000)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("loan_purpose", "loan_amount", "total_units"))
 	def q628(self):
 		"""
 		If Loan Purpose equals 1, and Total Units is less than or equal to 4, 
@@ -3418,10 +3799,11 @@ class rules_engine(object):
 		"""
 		field = "Loan Purpose; Loan Amount; Total Units"
 		edit_name = "q628"
-		fail_df = self.lar_df[(self.lar_df.loan_purpose=="1")&(self.lar_df.total_units.apply(lambda x: int(x)<=4))&
-							  (self.lar_df.loan_amount.apply(lambda x: int(x)<=10000))]
+		fail_df = self.lar_df[(self.lar_df.loan_purpose=="1")&(self.typed.numbers("total_units")<=4)&
+							  (self.typed.numbers("loan_amount")<=10000)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("income", "loan_purpose", "action_taken", "total_units"))
 	def q629(self):
 		"""
 		If Action Taken equals 1, 2, 3, 4, 5, 7, or 8, and Total Units is less than or equal to 4, 
@@ -3430,20 +3812,22 @@ class rules_engine(object):
 		field = "Action Taken; Total Units; Loan Purpose; Income"
 		edit_name = "q629"
 		fail_df = self.lar_df[(self.lar_df.action_taken.isin(["1","2","3","4","5","7","8"]))&
-							  (self.lar_df.total_units.apply(lambda x: int(x)<=4))&(self.lar_df.loan_purpose.isin(["1","2","4"]))&
+							  (self.typed.numbers("total_units")<=4)&(self.lar_df.loan_purpose.isin(["1","2","4"]))&
 							  (self.lar_df.income=="NA")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("hoepa", "total_units"))
 	def q630(self):
 		"""
 		If Total Units is greater than or equal to 5, then HOEPA Status generally should equal 3.
 		"""
 		field = "Total Units; HOEPA Status"
 		edit_name = "q630"
-		fail_df = self.lar_df[(self.lar_df.total_units.apply(lambda x: int(x)>=5))&
+		fail_df = self.lar_df[(self.typed.numbers("total_units")>=5)&
 							  (self.lar_df.hoepa!="3")]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("loan_type", "total_units"))
 	def q631(self):
 		"""
 		If Loan Type equals 2, 3 or 4, then Total Units generally should be less than or equal to 4.
@@ -3451,9 +3835,10 @@ class rules_engine(object):
 		field = "Loan Type; Total Units"
 		edit_name = "q631"
 		fail_df = self.lar_df[(self.lar_df.loan_type.isin(["2","3","4"]))&
-							  (self.lar_df.total_units.apply(lambda x: int(x)>4))]
+							  (self.typed.numbers("total_units")>4)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("aus_5", "aus_4", "aus_3", "aus_result_5", "aus_1", "aus_2", "aus_result_4", "aus_result_3", "aus_result_1", "aus_result_2"))
 	def q632(self):
 		"""
 		1) If Automated Underwriting System: 1; Automated Underwriting System: 2; Automated Underwriting
@@ -3472,6 +3857,7 @@ class rules_engine(object):
 			((self.lar_df.aus_5=="3")&(~self.lar_df.aus_result_5.isin(["1","2","3","4","8","13","16","18","19"])))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("aus_5", "aus_4", "aus_3", "aus_result_5", "aus_1", "aus_2", "aus_result_4", "aus_result_3", "aus_result_1", "aus_result_2"))
 	def q633(self):
 		"""
 		1) If Automated Underwriting System: 1; Automated Underwriting System: 2; Automated Underwriting
@@ -3495,6 +3881,7 @@ class rules_engine(object):
 				"21", "22", "23", "24"])))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(row_type="macro", fields=("action_taken", "loan_purpose"))
 	def m634(self):
 		"""
 		If more than 25 loans reported Action Taken equals 1 and Loan Purpose equals 1, 
@@ -3503,14 +3890,13 @@ class rules_engine(object):
 		"""
 		field = "Action Taken; Loan Purpose"
 		edit_name = "q634"
-		action_1 = len(self.lar_df[(self.lar_df.action_taken=="1")&(self.lar_df.loan_purpose=="1")])
-		denom_count = len(self.lar_df)
-		if (action_1 * 1.0) / denom_count > .95 and len(self.lar_df)>25:
-			fail_df = self.lar_df[(self.lar_df.action_taken=="1")&(self.lar_df.loan_purpose=="1")]
+		if self.macro.fails("m634"):
+			fail_df = self.lar_df[macro_filters["m634"](self.lar_df)]
 		else:
-			fail_df = fail_df = []
+			fail_df = []
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(row_type="macro", fields=("action_taken",))
 	def m635(self):
 		"""
 		No more than 15% of the loans in the file should report Action Taken equals 2. 
@@ -3518,14 +3904,13 @@ class rules_engine(object):
 		"""
 		field = "Action Taken; Total Number of Entries Contained in Submission"
 		edit_name = "q635"
-		action_2 = len(self.lar_df[self.lar_df.action_taken=="2"])
-		denom_count = len(self.lar_df)
-		if (action_2 * 1.0) / denom_count > .15:
-			fail_df = self.lar_df[(self.lar_df.action_taken=="2")]
+		if self.macro.fails("m635"):
+			fail_df = self.lar_df[macro_filters["m635"](self.lar_df)]
 		else:
 			fail_df = []
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(row_type="macro", fields=("action_taken",))
 	def m636(self):
 		"""
 		No more than 30% of the loans in the file should report Action Taken equals 4. 
@@ -3533,14 +3918,13 @@ class rules_engine(object):
 		"""
 		field = "Action Taken; Total Number of Entries Contained in Submission"
 		edit_name = "q636"
-		action_4 = len(self.lar_df[self.lar_df.action_taken=="4"])
-		denom_count = len(self.lar_df)
-		if (action_4 * 1.0) / denom_count > .30:
-			fail_df = self.lar_df[self.lar_df.action_taken=="4"]
+		if self.macro.fails("m636"):
+			fail_df = self.lar_df[macro_filters["m636"](self.lar_df)]
 		else:
 			fail_df = []
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(row_type="macro", fields=("action_taken",))
 	def m637(self):
 		"""
 		No more than 15% of the loans in the file should report Action Taken equals 5. 
@@ -3548,14 +3932,13 @@ class rules_engine(object):
 		"""
 		field = "Action Taken; Total Number of Entries Contained in Submission"
 		edit_name = "q637"
-		action_5 = len(self.lar_df[self.lar_df.action_taken=="5"])
-		denom_count = len(self.lar_df)
-		if (action_5 * 1.0) / denom_count > .15:
-			fail_df = self.lar_df[self.lar_df.action_taken=="5"]
+		if self.macro.fails("m637"):
+			fail_df = self.lar_df[macro_filters["m637"](self.lar_df)]
 		else:
 			fail_df = []
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(row_type="macro", fields=("action_taken",))
 	def m638(self):
 		"""
 		The number of loans in the file that reported Action Taken equals 1 should be greater than or equal to 20% 
@@ -3564,17 +3947,13 @@ class rules_engine(object):
 		"""
 		field = "Action Taken"
 		edit_name = "q638"
-		action_1 = len(self.lar_df[self.lar_df.action_taken=="1"])
-		denom_count = len(self.lar_df[self.lar_df.action_taken.isin(["1","2","3","4","5","6"])])
-		if denom_count > 0:
-			if ((action_1 * 1.0) / denom_count) < .20:
-				fail_df = self.lar_df[self.lar_df.action_taken.isin(["1","2","3","4","5","6"])]
-			else:
-				fail_df = []
+		if self.macro.fails("m638"):
+			fail_df = self.lar_df[macro_filters["m638"](self.lar_df)]
 		else:
 			fail_df = []
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(row_type="macro", fields=("preapproval", "action_taken"))
 	def m639(self):
 		"""
 		If more than 1000 loans were reported with Preapproval equals 1, 
@@ -3583,13 +3962,13 @@ class rules_engine(object):
 		"""
 		field = "Action Taken; Preapproval"
 		edit_name = "q639"
-		preapprovals = len(self.lar_df[self.lar_df.preapproval=="1"])
-		if preapprovals > 1000 and len(self.lar_df[self.lar_df.action_taken=="7"])<1:
-			fail_df = self.lar_df[self.lar_df.preapproval=="1"]
+		if self.macro.fails("m639"):
+			fail_df = self.lar_df[macro_filters["m639"](self.lar_df)]
 		else:
 			fail_df = []
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(row_type="macro", fields=("income",))
 	def m640(self):
 		"""
 		No more than 20% of the loans in the file should report Income less than $10 thousand (entered as 10). 
@@ -3597,15 +3976,13 @@ class rules_engine(object):
 		"""
 		field = "Income; Total Number of Entries Contained in Submission"
 		edit_name = "q640"
-		income_less_10k = self.lar_df[self.lar_df.income!="NA"].copy()
-		income_less_10k_ct = len(income_less_10k[income_less_10k.income.apply(lambda x: float(x)<10)])
-		denom_count = len(self.lar_df)
-		if (income_less_10k_ct * 1.0) / denom_count > .20:
-			fail_df = income_less_10k
+		if self.macro.fails("m640"):
+			fail_df = self.lar_df[macro_filters["m640"](self.lar_df)]
 		else:
 			fail_df = []
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_credit_score", "app_score_name"))
 	def q642_1(self):
 		"""
 		1) If Credit Score of Applicant or Borrower equals 7777 indicating a credit score that is not a number, 
@@ -3616,6 +3993,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.app_credit_score=="7777")&(~self.lar_df.app_score_name.isin(["7","8"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_credit_score", "co_app_score_name"))
 	def q642_2(self):
 		"""
 		If Credit Score of Co-Applicant or Co-Borrower equals 7777 indicating a credit score that is not a number, 
@@ -3626,6 +4004,7 @@ class rules_engine(object):
 		fail_df = self.lar_df[(self.lar_df.co_app_credit_score=="7777")&(~self.lar_df.co_app_score_name.isin(["7","8"]))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("aus_5", "aus_4", "aus_3", "aus_result_5", "aus_1", "aus_2", "aus_result_4", "aus_result_3", "aus_result_1", "aus_result_2"))
 	def q643(self):
 		"""
 		If Automated Underwriting System: 1;
@@ -3651,6 +4030,7 @@ class rules_engine(object):
 				((self.lar_df.aus_5=="1")&(~self.lar_df.aus_result_5.isin(["1","2","3","4","5","6","7","15", "16"])))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("aus_5", "aus_4", "aus_3", "aus_result_5", "aus_1", "aus_2", "aus_result_4", "aus_result_3", "aus_result_1", "aus_result_2"))
 	def q644(self):
 		"""
 		1) If Automated Underwriting System: 1; Automated Underwriting System: 2; Automated Underwriting
@@ -3669,6 +4049,7 @@ class rules_engine(object):
 				((self.lar_df.aus_5=="2")&(~self.lar_df.aus_result_5.isin(["8","9","10","11","12","13","16"])))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("loan_amount",))
 	def q645_1(self):
 		"""
 		1) Loan Amount should generally be greater than or equal to $500 (reported 500).
@@ -3676,9 +4057,10 @@ class rules_engine(object):
 
 		field = "Loan Amount"
 		edit_name = "q645_1"
-		fail_df = self.lar_df[((self.lar_df.loan_amount.apply(lambda x: int(x) < 500)))]
+		fail_df = self.lar_df[self.typed.numbers("loan_amount") < 500]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("loan_purpose", "loan_amount"))
 	def q645_2(self):
 		"""
 		2) If Loan Purpose equals 1, then Loan Amount should generally be greater than or equal to $1,000 (reported 1000).
@@ -3686,9 +4068,10 @@ class rules_engine(object):
 		field = "Loan Amount"
 		edit_name = "q645_2"
 		fail_df = self.lar_df[(self.lar_df.loan_purpose == '1') &
-		(self.lar_df.loan_amount.apply(lambda x: int(x) <= 1000))]
+		(self.typed.numbers("loan_amount") <= 1000)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(row_type="macro", fields="all")
 	def m646(self):
 		"""
 		Your file indicates that at least one exemption code was used. 
@@ -3697,10 +4080,13 @@ class rules_engine(object):
 		"""
 		field = "Any data point eligible for an exemption code."
 		edit_name = "q646"
-		fail_df = self.lar_df.copy()
-		fail_df = fail_df[(fail_df.values == 'Exempt').any(1) | (fail_df.values == '1111').any(1)]
+		if self.macro.fails("m646"):
+			fail_df = self.lar_df[macro_filters["m646"](self.lar_df)]
+		else:
+			fail_df = []
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(row_type="macro", fields="all")
 	def m647(self):
 		"""
 		If Federal Agency equals 7, indicating a non-depository institution, exemption codes should not be used in the
@@ -3708,13 +4094,14 @@ class rules_engine(object):
 		"""
 		field = "Federal Agency; Any field eligible for exemption code."
 		edit_name = "q647"
-		if self.ts_df['federal_agency'][0] == '7':
-			#FIXME the 1111 section is too broad and may pull valid integers into the edit report
-			fail_df = fail_df[(fail_df.values == 'Exempt').any(1) | (fail_df.values == '1111').any(1)]
-			self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		#FIXME the 1111 section is too broad and may pull valid integers into the edit report
+		if self.macro.fails("m647", federal_agency=self.ts_df['federal_agency'][0]):
+			fail_df = self.lar_df[macro_filters["m647"](self.lar_df)]
 		else:
-			self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=[])
+			fail_df = []
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("uli", "action_taken", "lei"))
 	def q648(self):
 		"""
 		If Action Taken equals 1, 2, 3, 4, 5, 7, or 8, the first 20 characters of the ULI should match the reported LEI.
@@ -3722,10 +4109,11 @@ class rules_engine(object):
 		edit_name = "q648"
 		field = "uli"
 		fail_df = self.lar_df[(self.lar_df.action_taken.isin(["1", "2", "3", "4", "5", "7", "8"]))&
-							  (self.lar_df.apply(lambda x: x.uli[:20] != x.lei, axis=1))]
+							  (self.lar_df.uli.str[:20]!=self.lar_df.lei)]
 		
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("app_credit_score",))
 	def q649_1(self):
 		"""
 		If Credit Score of Applicant or Borrower does not equal 7777, 8888, or 1111, Credit Score should
@@ -3735,11 +4123,12 @@ class rules_engine(object):
 		edit_name = "q649_1"
 		fail_df = self.lar_df[~self.lar_df.app_credit_score.isin(["7777", "8888", "1111"])].copy()
 		#fail_df.app_credit_score = fail_df.app_credit_score.apply(lambda x: int(x))
-		fail_df = fail_df[fail_df.app_credit_score.apply(lambda x: self.check_number(x, 
-			min_val=301, max_val=901)==False)]
+		passed, failed = self.check_numbers(fail_df.app_credit_score, min_val=301, max_val=901)
+		fail_df = fail_df[failed]
 		#fail_df = fail_df[fail_df.apply(self.check_number(fail_df.app_credit_score, min_val=301, max_val=901)==False, axis=1)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("co_app_credit_score",))
 	def q649_2(self):
 		"""
 		If Credit Score of Co-Applicant or Co-Borrower does not equal 7777, 8888, 9999, or 1111, 
@@ -3749,10 +4138,11 @@ class rules_engine(object):
 		edit_name = "q649_2"
 		fail_df = self.lar_df[~self.lar_df.co_app_credit_score.isin(["7777", "8888", "1111"])].copy()
 		#fail_df = fail_df[~fail_df.app_credit_score.apply(lambda x: 300 < float(x) < 900)]
-		fail_df = fail_df[fail_df.co_app_credit_score.apply(lambda x: self.check_number(x, 
-			min_val=301, max_val=901)==False)]
+		passed, failed = self.check_numbers(fail_df.co_app_credit_score, min_val=301, max_val=901)
+		fail_df = fail_df[failed]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)		
 
+	@edit(fields=("interest_rate",))
 	def q650_1(self):
 		"""
 		1) The Interest Rate reported is greater than 0 but less
@@ -3761,10 +4151,11 @@ class rules_engine(object):
 		"""
 		field = "interest rate"
 		edit_name = "q650_1"
-		fail_df = self.lar_df[~self.lar_df.interest_rate.isin(["Exempt", "NA"])]
-		fail_df = fail_df[fail_df.interest_rate.apply(lambda x: 0 < float(x) < 0.5)]
+		rate = self.typed.numbers("interest_rate")
+		fail_df = self.lar_df[(rate>0)&(rate<0.5)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
      
+	@edit(fields=("interest_rate",))
 	def q650_2(self):
 		"""
 		2) The Interest Rate reported is greater than 20, which
@@ -3772,20 +4163,21 @@ class rules_engine(object):
 		"""
 		field = "interest rate"
 		edit_name = "q650_2"
-		fail_df = self.lar_df[~self.lar_df.interest_rate.isin(["Exempt", "NA"])]
-		fail_df = fail_df[fail_df.interest_rate.apply(lambda x: 20 < float(x))]
+		fail_df = self.lar_df[self.typed.numbers("interest_rate")>20]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("cltv",))
 	def q651(self):
 		"""
 		The CLTV reported is greater than 0 but less than 1, which may indicate a misplaced decimal point.
 		"""
 		field = "cltv"
 		edit_name = "q651"
-		fail_df = self.lar_df[~self.lar_df.cltv.isin(["NA", "Exempt"])].copy()
-		fail_df = fail_df[fail_df.cltv.apply(lambda x: 0 < float(x) < 1)]
+		cltv = self.typed.numbers("cltv")
+		fail_df = self.lar_df[(cltv > 0)&(cltv < 1)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("dti",))
 	def q652(self):
 		"""
 		The DTI reported is greater than 0 but less than 1, which may indicate a misplaced decimal point.
@@ -3793,30 +4185,34 @@ class rules_engine(object):
 		field = "dti"
 		edit_name = "q652"
 		fail_df = self.lar_df[~self.lar_df.dti.isin(["NA", "Exempt"])].copy()
-		fail_df = fail_df[fail_df.dti.apply(lambda x: self.check_number(x, min_val=0, max_val=1)==False)]
+		passed, failed = self.check_numbers(fail_df.dti, min_val=0, max_val=1)
+		fail_df = fail_df[failed]
 		#fail_df = fail_df[fail_df.dti.apply(lambda x: 0 < float(x) < 1)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("cltv", "action_taken"))
 	def q653_1(self):
 		"""
 		If Action Taken equals 1, 2, or 8, the CLTV should generally be between 0 and 250.
 		"""
 		field = "cltv"
 		edit_name = "q653_1"
-		fail_df = self.lar_df[~self.lar_df.cltv.isin(["NA", "Exempt"])].copy()
-		fail_df = fail_df[((fail_df.action_taken.isin(["1", "2", "8"])&~(fail_df.cltv.apply(lambda x: 0.0 < float(x) < 250))))]
+		cltv = self.typed.numbers("cltv")
+		fail_df = self.lar_df[~self.lar_df.cltv.isin(["NA", "Exempt"])&self.lar_df.action_taken.isin(["1", "2", "8"])&~((cltv>0)&(cltv<250))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("cltv", "action_taken"))
 	def q653_2(self):
 		"""
 		If Action Taken equals 3, 4, 5, 6, or 7, the CLTV should generally be between 0 and 1,000.
 		"""
 		field = "cltv"
 		edit_name = "q653_2"
-		fail_df = self.lar_df[~self.lar_df.cltv.isin(["NA", "Exempt"])].copy()
-		fail_df = fail_df[((fail_df.action_taken.isin(("3", "4", "5", "6", "7")))&~(fail_df.cltv.apply(lambda x: 0 < float(x) < 1000)))]
+		cltv = self.typed.numbers("cltv")
+		fail_df = self.lar_df[~self.lar_df.cltv.isin(["NA", "Exempt"])&self.lar_df.action_taken.isin(["3", "4", "5", "6", "7"])&~((cltv>0)&(cltv<1000))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit(fields=("income", "dti", "action_taken"))
 	def q654(self):
 		"""
 		1) If Income is greater than $5,000 (reported as 5) and Action Taken equals 1, 2, or 8, 
@@ -3826,18 +4222,18 @@ class rules_engine(object):
 		"""
 		field = "DTI"
 		edit_name = "q654"
-		fail_df = self.lar_df.copy()
-		fail_df = fail_df[~fail_df.dti.isin(["NA", "Exempt"])].copy() #filter exemptions
-		fail_df = fail_df[fail_df.income!="NA"]
-		fail_df = fail_df[(fail_df.income.apply(lambda x: float(x)>5))&
-						  (fail_df.action_taken.isin(["1","2","8"]))&
-						  (fail_df.dti.apply(lambda x: self.check_number(x, min_val=0.0, max_val=80)))]
+		#NA and Exempt DTI and NA income are NaN in the typed columns so they fail every comparison
+		dti = self.typed.numbers("dti")
+		fail_df = self.lar_df[(self.typed.numbers("income") > 5)&
+						  (self.lar_df.action_taken.isin(["1","2","8"]))&
+						  (self.typed.plain_numbers("dti"))&(dti > 0.0)&(dti < 80)]
 		#fail_df = fail_df[(fail_df.income.apply(lambda x: float(x)>5))&
 		#				  (fail_df.action_taken.isin(["1","2","8"]))&
 		#				 ~(fail_df.dti.apply(lambda x: 0.0 < float(x) < 80))]
 
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
         
+	@edit(fields=("total_units", "affordable_units"))
 	def q655(self):
 		"""
 		1) If Total Units is greater than or equal to 5 and the
@@ -3846,14 +4242,11 @@ class rules_engine(object):
 		"""
 		field = "Multifamily Affordable Units"
 		edit_name = "q655"
-		fail_df = self.lar_df.copy()
-		fail_df = self.lar_df[~self.lar_df.total_units.isin(["Exempt", "NA"])]
-		fail_df = self.lar_df[~self.lar_df.affordable_units.isin(["Exempt", "NA"])]
-		fail_df = fail_df[(fail_df.total_units.apply(lambda x: float(x)>=5))&
-                           	 (fail_df.affordable_units.apply(lambda x: float(x)>=0))]
+		fail_df = self.lar_df[(self.typed.numbers("total_units")>=5)&(self.typed.numbers("affordable_units")>=0)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
         
         
+	@edit(fields="all")
 	def q656(self):
 		"""
 		The value 1111 was entered in a field that accepts only
@@ -3866,6 +4259,7 @@ class rules_engine(object):
 		fail_df = fail_df[(fail_df.values == '1111').any(1)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
        
+	@edit(fields="all")
 	def q657(self):
 		"""
 		The value 1111 was entered in a field that does not
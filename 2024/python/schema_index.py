@@ -0,0 +1,137 @@
+#This file contains a compiled, read-only view of the LAR and TS JSON schemas.
+#Schemas are parsed once per file and shared by lar_gen, rules_engine and lar_data_constraints
+#so that field lookups are dictionary hits instead of DataFrame scans.
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+#loaded schema indexes keyed by absolute schema file path
+_schemas = {}
+
+def load_schema(schema_file):
+	"""Returns the schema_index for the schema file, parsing the file only on first use."""
+	key = os.path.abspath(schema_file)
+	if key not in _schemas:
+		_schemas[key] = schema_index(schema_file)
+	return _schemas[key]
+
+class schema_index(object):
+	"""
+	Immutable lookups of valid values for each field in a schema file.
+	Functions:
+	- valid_vals
+	- str_vals
+	- na_vals
+	- range_and_enum
+	"""
+	def __init__(self, schema_file):
+		"""
+		schema_file: JSON file with a LAR or TS schema
+		"""
+		with open(schema_file, 'r') as f:
+			schema_json = json.load(f)
+		self.schema_file = schema_file
+		self.schema_df = pd.DataFrame(schema_json) #kept for callers that use the DataFrame form of the schema
+		self.fields = tuple(row["field"] for row in schema_json)
+
+		self._valid_vals = {}
+		self._str_vals = {}
+		self._na_vals = {}
+		for row in schema_json:
+			vals = tuple(row["valid_vals"])
+			self._valid_vals[row["field"]] = {False:vals, True:vals + ("",)}
+			str_vals = tuple(str(val) for val in vals)
+			self._str_vals[row["field"]] = {False:str_vals, True:str_vals + ("",)}
+			self._na_vals[row["field"]] = frozenset(val for val in str_vals if val in ("NA", "Exempt"))
+
+	def _check_field(self, field):
+		if not field:
+			raise ValueError("must specify which field")
+		if field not in self._valid_vals:
+			raise ValueError("{field} is not in {schema}".format(field=field, schema=self.schema_file))
+
+	def valid_vals(self, field=None, empty=False):
+		"""Returns the valid values for the field as listed in the schema. Optionally adds a blank."""
+		self._check_field(field)
+		return self._valid_vals[field][empty]
+
+	def str_vals(self, field=None, empty=False):
+		"""Returns the valid values for the field as strings. Optionally adds a blank."""
+		self._check_field(field)
+		return self._str_vals[field][empty]
+
+	def na_vals(self, field=None):
+		"""Returns the set of NA and Exempt values that are valid for the field."""
+		self._check_field(field)
+		return self._na_vals[field]
+
+	def range_and_enum(self, field=None, rng_min=1, rng_max=100, dtype="int", empty=False):
+		"""
+		Returns a range_spec of the schema values for the field followed by the numeric range rng_min to rng_max.
+		Float ranges use steps of 1.01. Values are computed when drawn, the range is not built as a list.
+		"""
+		return range_spec(self.valid_vals(field=field), rng_min=rng_min, rng_max=rng_max, dtype=dtype, empty=empty)
+
+class range_spec(object):
+	"""
+	A selection list of enumerated values followed by a numeric range, with an optional blank at the end.
+	Supports len() and indexing like the tuple it stands for, so random.choice draws from it with the same weighting
+	without building the list. Every value in the list is equally likely.
+	Functions:
+	- value
+	- sample
+	"""
+	def __init__(self, enums, rng_min=1, rng_max=100, dtype="int", empty=False):
+		"""
+		enums: values listed before the range, usually the valid values of a field in the schema
+		rng_min, rng_max: the range covers rng_min up to but not including rng_max
+		dtype: "int" for whole numbers, "float" for whole numbers times 1.01
+		empty: if True a blank string follows the range
+		"""
+		self.enums = tuple(enums)
+		self.rng_min = rng_min
+		self.rng_max = rng_max
+		self.dtype = dtype
+		self.empty = empty
+		self.span = max(rng_max - rng_min, 0)
+
+	def __len__(self):
+		return len(self.enums) + self.span + int(self.empty)
+
+	def __getitem__(self, position):
+		length = len(self)
+		if position < 0:
+			position += length
+		if not 0 <= position < length:
+			raise IndexError("range_spec index out of range")
+		if position < len(self.enums):
+			return self.enums[position]
+		if position - len(self.enums) < self.span:
+			return self.value(self.rng_min + position - len(self.enums))
+		return ""
+
+	def value(self, number):
+		"""Returns the range value for a whole number in the range."""
+		if self.dtype == "float":
+			return number * 1.01
+		return number
+
+	def sample(self, n, rng, rng_max=None):
+		"""
+		Returns an object array of n values drawn uniformly with a numpy Generator, as strings.
+		rng_max: array of length n giving each draw its own upper bound in place of the range_spec's rng_max
+		"""
+		enum_count = len(self.enums)
+		span = self.span if rng_max is None else np.maximum(np.asarray(rng_max) - self.rng_min, 0)
+		picks = rng.integers(0, enum_count + span + int(self.empty), size=n)
+		nums = self.rng_min + picks - enum_count
+		if self.dtype == "float":
+			nums = nums * 1.01
+		values = nums.astype(str).astype(object)
+		is_enum = picks < enum_count
+		values[is_enum] = np.array([str(val) for val in self.enums] + [""], dtype=object)[picks[is_enum]]
+		values[picks >= enum_count + span] = "" #only drawn when empty is True
+		return values
@@ -0,0 +1,199 @@
+#This file contains a validator that checks HMDA files too large to load into one DataFrame.
+#LAR rows are read and checked in chunks. Row-local edits are run on each chunk with the rules engine.
+#File-level edits are checked from values kept across chunks: the LAR row count for s304, hashes of rows and ULIs
+#written to partition files on disk for the duplicate edits, and merged macro_aggregate counts for the macro edits.
+#A second read of the file collects the rows reported by failing duplicate and macro edits.
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from edit_results import report_columns
+from macro_aggregates import macro_aggregate, macro_filters
+import utils
+
+#TS edits that count the LAR rows that fail them, their counts are added over chunks. Other TS edits are run once.
+lar_counted_ts_edits = ("s301",)
+#edits that report rows with a value repeated elsewhere in the file
+duplicate_edits = ("s305", "s306", "q600")
+#record layouts of the hash partition files
+row_hash_dtype = np.dtype([("hash", np.uint64), ("row", np.int64)])
+uli_hash_dtype = np.dtype([("hash", np.uint64), ("row", np.int64), ("action_1", np.bool_)])
+
+class stream_validator(object):
+	"""
+	Creates the edit report of a HMDA file while holding only one chunk of LAR rows in memory.
+	The report has the same rows as rules_engine.create_edit_report run on the whole file.
+	Memory use grows with the number of failed rows kept for the report, not with the file size.
+	Functions:
+	- edit_report
+	- check_chunk
+	- write_hashes
+	- duplicate_rows
+	- collect_rows
+	"""
+	def __init__(self, rules_engine, chunksize=100000, spool_dir=None, partitions=64):
+		"""
+		rules_engine: rules_engine object used to run the edits on each chunk
+		chunksize: number of LAR rows read and checked at a time
+		spool_dir: directory for the hash partition files, the system temporary directory is used if None
+		partitions: number of hash partition files, one partition is read into memory at a time
+		"""
+		self.rules_engine = rules_engine
+		self.chunksize = chunksize
+		self.spool_dir = spool_dir
+		self.partitions = partitions
+
+	def edit_report(self, data_file, rules_list=["s","v"]):
+		"""Checks data_file with the edits in rules_list and returns the edit report DataFrame."""
+		engine = self.rules_engine
+		names = [edit_func.__name__ for edit_func in engine.edits(categories=rules_list)]
+		ts_df, chunks = utils.read_hmda_file(data_file, lar_fields=list(engine.lar_schema.fields),
+			ts_fields=list(engine.ts_schema.fields), chunksize=self.chunksize)
+		engine.load_ts_data(ts_df)
+		self.spool = tempfile.mkdtemp(prefix="hmda_stream_", dir=self.spool_dir)
+		try:
+			self.entries = {} #edit name to a list of [edit_result from the first chunk, failed ULIs, fail count]
+			self.row_count = 0
+			self.macro = macro_aggregate()
+			for chunk in chunks:
+				print("checking rows {start} to {end}".format(start=self.row_count, end=self.row_count+len(chunk)))
+				if self.row_count == 0:
+					#v609 compares ULIs to the LEI of the first row of the file
+					engine.file_lei = chunk.lei.iloc[0]
+				self.check_chunk(chunk, names)
+				self.write_hashes(chunk, names)
+				self.row_count += len(chunk)
+			if self.row_count == 0:
+				print("no LAR rows in", data_file)
+				return pd.DataFrame([], columns=report_columns)
+
+			duplicates = self.duplicate_rows(names)
+			macro_failed = self.macro.failed_edits([name for name in names if name in macro_filters],
+				federal_agency=ts_df.at[0, "federal_agency"])
+			collected = self.collect_rows(data_file, names, duplicates, macro_failed)
+		finally:
+			engine.file_lei = None
+			shutil.rmtree(self.spool, ignore_errors=True)
+
+		records = []
+		for name in names:
+			for result, failed_ulis, fail_count in self.entries.get(name, []):
+				if name == "s304":
+					fail_count = int(ts_df.at[0, "lar_entries"] != str(self.row_count))
+				elif name in collected:
+					failed_ulis = collected[name]
+				if result.bits is not None:
+					fail_count = len(failed_ulis)
+				else:
+					failed_ulis = ["ts"] if fail_count > 0 else []
+				records.append({"edit_name": result.edit_name, "row_type": result.row_type, "field": result.field,
+					"fail_count": fail_count, "failed_rows": failed_ulis})
+		return pd.DataFrame(records, columns=report_columns)
+
+	def check_chunk(self, chunk, names):
+		"""
+		Runs the edits that can be checked one chunk at a time and adds their failed ULIs to self.entries.
+		On the first chunk all edits are run so that the report fields of the file-level edits are known.
+		"""
+		engine = self.rules_engine
+		first = self.row_count == 0
+		engine.reset_results()
+		engine.load_lar_data(chunk)
+		for name in names:
+			row_type = engine.edit_registry[name].row_type
+			if not first and (name in duplicate_edits or name in macro_filters or
+				(row_type.startswith("TS") and name not in lar_counted_ts_edits)):
+				continue
+			start = len(engine.results)
+			getattr(engine, name)()
+			if first:
+				self.entries[name] = [[result, [], 0] for result in engine.results.entries(start)]
+			for entry, record in zip(self.entries[name], engine.results.records(start=start)):
+				entry[1].extend(record["failed_rows"])
+				entry[2] += record["fail_count"]
+		if any(name in macro_filters for name in names):
+			self.macro = self.macro.merge(engine.macro)
+
+	def write_hashes(self, chunk, names):
+		"""
+		Appends 64 bit hashes of the rows and ULIs of a chunk, with their row numbers in the file,
+		to partition files chosen by hash value.
+		"""
+		if not any(name in duplicate_edits for name in names):
+			return
+		rows = np.arange(self.row_count, self.row_count+len(chunk), dtype=np.int64)
+		row_records = np.empty(len(chunk), dtype=row_hash_dtype)
+		row_records["hash"] = pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+		row_records["row"] = rows
+		uli_records = np.empty(len(chunk), dtype=uli_hash_dtype)
+		uli_records["hash"] = pd.util.hash_pandas_object(chunk.uli, index=False).to_numpy()
+		uli_records["row"] = rows
+		uli_records["action_1"] = (chunk.action_taken=="1").to_numpy()
+		for kind, records in (("rows", row_records), ("ulis", uli_records)):
+			partition = records["hash"] % np.uint64(self.partitions)
+			for number in np.unique(partition):
+				with open(os.path.join(self.spool, "{kind}_{number}.bin".format(kind=kind, number=number)), "ab") as f:
+					records[partition==number].tofile(f)
+
+	def _repeated(self, records):
+		"""Returns the row numbers of records whose hash appears more than once."""
+		records = np.sort(records, order="hash")
+		repeated = np.zeros(len(records), dtype=bool)
+		same = records["hash"][1:]==records["hash"][:-1]
+		repeated[1:] |= same
+		repeated[:-1] |= same
+		return records["row"][repeated]
+
+	def duplicate_rows(self, names):
+		"""
+		Returns a dictionary of duplicate edit name to the sorted row numbers that have a repeated hash.
+		Partition files are read one at a time. Rows are confirmed against their values in collect_rows.
+		"""
+		candidates = {name:[] for name in duplicate_edits if name in names}
+		for number in range(self.partitions):
+			row_file = os.path.join(self.spool, "rows_{number}.bin".format(number=number))
+			if "s305" in candidates and os.path.exists(row_file):
+				candidates["s305"].append(self._repeated(np.fromfile(row_file, dtype=row_hash_dtype)))
+			uli_file = os.path.join(self.spool, "ulis_{number}.bin".format(number=number))
+			if os.path.exists(uli_file):
+				uli_records = np.fromfile(uli_file, dtype=uli_hash_dtype)
+				if "q600" in candidates:
+					candidates["q600"].append(self._repeated(uli_records))
+				if "s306" in candidates:
+					candidates["s306"].append(self._repeated(uli_records[uli_records["action_1"]]))
+		return {name:np.sort(np.concatenate(rows)) if rows else np.zeros(0, dtype=np.int64) for name, rows in candidates.items()}
+
+	def collect_rows(self, data_file, names, duplicates, macro_failed):
+		"""
+		Reads data_file again and returns a dictionary of edit name to the ULIs of the rows it fails, in file order,
+		for the duplicate edits and the failed macro edits. Candidate duplicate rows are kept only if their values repeat.
+		"""
+		collected = {name:[] for name in names if name in macro_filters}
+		candidate_rows = {name:[] for name in duplicates}
+		if not macro_failed and not any(len(rows) for rows in duplicates.values()):
+			collected.update({name:[] for name in duplicates})
+			return collected
+		engine = self.rules_engine
+		offset = 0
+		for chunk in utils.read_lar_chunks(data_file, list(engine.lar_schema.fields), chunksize=self.chunksize):
+			for name in macro_failed:
+				collected[name].extend(chunk.uli[macro_filters[name](chunk)])
+			for name, rows in duplicates.items():
+				positions = rows[(rows >= offset) & (rows < offset+len(chunk))] - offset
+				candidate_rows[name].append(chunk.iloc[positions])
+			offset += len(chunk)
+
+		for name, frames in candidate_rows.items():
+			candidates = pd.concat(frames) if frames else pd.DataFrame(columns=list(engine.lar_schema.fields))
+			if name == "s305":
+				repeated = candidates.duplicated(keep=False)
+			elif name == "s306":
+				repeated = candidates.duplicated(subset=["uli"], keep=False) & (candidates.action_taken=="1")
+			else:
+				repeated = candidates.duplicated(subset=["uli"], keep=False)
+			collected[name] = list(candidates.uli[repeated])
+		return collected
@@ -2,7 +2,6 @@ import json
 import os
 import pandas as pd
 import random
-import string
 import yaml
 import utils
 
@@ -164,8 +163,8 @@ class test_data_creator(object):
 		path = self.validity_path
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
-		ts.lei = ''.join(random.choice(string.ascii_uppercase + string.digits) for _ in range(10))
-		lar.lei = ''.join(random.choice(string.ascii_uppercase + string.digits) for _ in range(10))
+		ts.lei = utils.char_string_gen(10)
+		lar.lei = utils.char_string_gen(10)
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
@@ -262,7 +261,7 @@ class test_data_creator(object):
 		path = self.validity_path
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
-		ts.contact_tel = ''.join(random.choice(string.ascii_uppercase + string.digits) for _ in range(10))
+		ts.contact_tel = utils.char_string_gen(10)
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
@@ -286,7 +285,7 @@ class test_data_creator(object):
 		path = self.validity_path
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
-		ts.office_zip = ''.join(random.choice(string.ascii_uppercase + string.digits) for _ in range(5))
+		ts.office_zip = utils.char_string_gen(5)
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
@@ -310,7 +309,7 @@ class test_data_creator(object):
 		path = self.validity_path
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
-		ts.tax_id = ''.join(random.choice(string.ascii_uppercase + string.digits) for _ in range(10))
+		ts.tax_id = utils.char_string_gen(10)
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
@@ -359,7 +358,7 @@ class test_data_creator(object):
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
 		#lar.uli = lar.uli.map(lambda x: x[:-2] + "xy")
-		lar.uli = lar.lei.map(lambda x: x + ''.join(random.choice(string.ascii_uppercase+string.digits) for _ in range(10)))
+		lar.uli = lar.lei + utils.char_string_array([10] * len(lar.index))
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
@@ -673,7 +672,7 @@ class test_data_creator(object):
 		path = self.validity_path
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
-		lar.street_address = lar.street_address.map(lambda x: "".join(random.choice(string.ascii_uppercase + string.digits) for _ in range(10)))
+		lar.street_address = utils.char_string_array([10] * len(lar.index))
 		lar.city = "NA"
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
@@ -685,7 +684,7 @@ class test_data_creator(object):
 		path = self.validity_path
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
-		lar.street_address = lar.street_address.map(lambda x: "".join(random.choice(string.ascii_uppercase + string.digits) for _ in range(10)))
+		lar.street_address = utils.char_string_array([10] * len(lar.index))
 		lar.state = "NA"
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
@@ -697,7 +696,7 @@ class test_data_creator(object):
 		path = self.validity_path
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
-		street_addy = "".join(random.choice(string.ascii_uppercase + string.digits) for _ in range(10))
+		street_addy = utils.char_string_gen(10)
 		lar.street_address = lar.street_address.map(lambda x: random.choice([street_addy, street_addy, "Exempt"]))
 		lar.zip_code = "NA"
 		print("writing {name}".format(name=name))
@@ -724,7 +723,7 @@ class test_data_creator(object):
 		path = self.validity_path
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
-		zip_code = "".join(str(random.choice(string.ascii_uppercase + string.digits)) for _ in range(5))
+		zip_code = utils.char_string_gen(5)
 		lar.zip_code = lar.zip_code.map(lambda x: random.choice([zip_code, ""]))
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
@@ -736,7 +735,7 @@ class test_data_creator(object):
 		path = self.validity_path
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
-		lar.tract = lar.tract.map(lambda x: "".join(random.choice(string.ascii_uppercase + string.digits) for _ in range(11)))
+		lar.tract = utils.char_string_array([11] * len(lar.index))
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
@@ -1652,7 +1651,7 @@ class test_data_creator(object):
 		path = self.validity_path
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
-		lar.app_score_code_8 = lar.app_score_code_8.map(lambda x: ''.join(random.choice(string.ascii_uppercase + string.digits) for _ in range(20)))
+		lar.app_score_code_8 = utils.char_string_array([20] * len(lar.index))
 		lar.app_score_name = lar.app_score_name.map(lambda x: random.choice(["-1", "1", "2", "3", "4", "5", "6", "7", "9"]))
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
@@ -1682,7 +1681,7 @@ class test_data_creator(object):
 		lar.action_taken = lar.action_taken.map(lambda x: random.choice(["4", "5", "6"]))
 		lar.app_credit_score = "700"
 		lar.app_score_name = lar.app_score_name.map(lambda x: random.choice(["1", "2", "3", "4", "5", "6", "7", "8"]))
-		lar.app_score_code_8 = lar.app_score_code_8.map(lambda x: "".join(random.choice(string.ascii_uppercase + string.digits) for _ in range(20)))
+		lar.app_score_code_8 = utils.char_string_array([20] * len(lar.index))
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
@@ -1699,7 +1698,7 @@ class test_data_creator(object):
 		lar.action_taken = lar.action_taken.map(lambda x: random.choice(["4", "5", "6"]))
 		lar.co_app_credit_score = "700"
 		lar.co_app_score_name = lar.co_app_score_name.map(lambda x: random.choice(["1", "2", "3", "4", "5", "6", "7", "8"]))
-		lar.co_app_score_code_8 = lar.co_app_score_code_8.map(lambda x: "".join(random.choice(string.ascii_uppercase + string.digits) for _ in range(20)))
+		lar.co_app_score_code_8 = utils.char_string_array([20] * len(lar.index))
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
@@ -1756,7 +1755,7 @@ class test_data_creator(object):
 		path = self.validity_path
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
-		lar.co_app_score_code_8 = lar.co_app_score_code_8.map(lambda x: "".join(random.choice(string.ascii_uppercase + string.digits) for _ in range(20)))
+		lar.co_app_score_code_8 = utils.char_string_array([20] * len(lar.index))
 		lar.co_app_score_name = lar.co_app_score_name.map(lambda x: random.choice(["1", "2", "3", "4", "5", "6", "7", "9", "10"]))
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
@@ -1944,7 +1943,7 @@ class test_data_creator(object):
 		lar.denial_2 = lar.denial_2.map(lambda x: random.choice(str(random.randrange(1,9))))
 		lar.denial_3 = lar.denial_3.map(lambda x: random.choice(str(random.randrange(1,9))))
 		lar.denial_4 = lar.denial_4.map(lambda x: random.choice(str(random.randrange(1,9))))
-		lar.denial_code_9 = "".join(random.choice(string.ascii_uppercase + string.digits) for _ in range(20))
+		lar.denial_code_9 = utils.char_string_gen(20)
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
@@ -2,14 +2,18 @@
 #in order to generate clean and failing synthetic data files.
 
 #Imports the necessary libraries.
+import csv
 import math
 import json
 import os
 import random
 import string
+import tempfile
+import numpy as np
 import pandas as pd
 import yaml
 import utils
+from schema_index import load_schema
 
 state_codes = {'WA':'53', 'WI':'55', 'WV':'54', 'FL':'12', 'WY':'56', 
 'NH':'33', 'NJ':'34', 'NM':'33', 'NC':'37', 'ND':'38', 'NE':'31', 'NY':'36', 
@@ -20,95 +24,114 @@ state_codes = {'WA':'53', 'WI':'55', 'WV':'54', 'FL':'12', 'WY':'56',
 'IA':'19', 'AZ':'04', 'ID':'16', 'ME':'23', 'MD':'24', 'MA':'25', 'UT':'49', 
 'MO':'29', 'MN':'27', 'MI':'26', 'MT':'30', 'MS':'29', 'DC':'11'}
 
-def write_file(path=None, ts_input=None, lar_input=None, name="test_file.txt"):
+def write_file(path=None, ts_input=None, lar_input=None, name="test_file.txt", atomic=False):
 	"""
-	Takes a TS row and LAR data as dataframes. Writes LAR data to file and
-	re-reads it to combine with TS data to make a full file.
+	Takes a TS row and LAR data and writes them to path + name as one pipe delimited file.
+	Rows are streamed to the destination in a single pass without intermediate files.
 
 	ts_input: DataFrame of a TS row
-	lar_input: DataFrae of one or more LAR rows
+	lar_input: DataFrame of one or more LAR rows, or an iterable of LAR DataFrame chunks
+		or LAR rows (lists, tuples or dictionaries in LAR field order)
+	atomic: write to a temporary file in path and rename it over the destination when complete,
+		so a partial file is never visible under the final name
 	"""
-	
-	parts_dir = "../edits_files/file_parts/"
-	
 	#make directories for files if they do not exist
 	if not os.path.exists(path):
 		os.makedirs(path)
 
-	if not os.path.exists(parts_dir):
-		os.makedirs(parts_dir)
-
-	#write TS dataframe to file
-	ts_input.to_csv(parts_dir + "ts_data.txt", sep="|", header=False, 
-		index=False, index_label=False)
-	#write LAR dataframe to file
-	lar_input.to_csv(parts_dir + "lar_data.txt", sep="|", header=False, 
-		index=False, index_label=False)
-	#load LAR data as file rows
-	with open(parts_dir + "lar_data.txt", 'r') as lar_data:
-		lar = lar_data.readlines()
-	with open(parts_dir + "ts_data.txt", "r") as ts_data:
-		ts  = ts_data.readline()
-	with open(path + name, 'w') as final_file:
-		final_file.write(ts)
-		for line in lar:
-			final_file.write("{line}".format(line=line))
-
-
-def read_data_file(path, data_file, lar_schema=None, ts_schema=None):
+	if not atomic:
+		with open(path + name, 'w') as final_file:
+			write_rows(final_file, ts_input=ts_input, lar_input=lar_input)
+		return
+
+	fd, temp_name = tempfile.mkstemp(dir=path, prefix="." + name, suffix=".tmp")
+	try:
+		with os.fdopen(fd, 'w') as final_file:
+			write_rows(final_file, ts_input=ts_input, lar_input=lar_input)
+		os.replace(temp_name, path + name)
+	except BaseException:
+		os.remove(temp_name)
+		raise
+
+def write_rows(outfile, ts_input=None, lar_input=None):
 	"""
-	Reads a complete file (includes LAR and TS rows) into a pandas 
-	dataframe and returns them.
+	Writes a TS row and LAR rows to an open file object, pipe delimited and without headers.
+	Accepts the same ts_input and lar_input as write_file.
 	"""
-	if lar_schema is None:
-		lar_schema = pd.DataFrame(json.load(open("2022/schemas/lar_schema.json", "r")))
-	if ts_schema is None:
-		ts_schema = pd.DataFrame(json.load(open("2022/schemas/ts_schema.json", "r")))
-	
-
-	if data_file is not None:
-		with open(path+data_file, 'r') as infile:
-
-			#split TS row from file
-			ts_row = infile.readline().strip("\n")
-			ts_data = []
-			ts_data.append(ts_row.split("|"))
-
-			#split LAR rows from file
-			lar_rows = infile.readlines()
-			lar_data = [line.strip("\n").split("|") for line in lar_rows]
+	ts_input.to_csv(outfile, sep="|", header=False, index=False)
+	if isinstance(lar_input, pd.DataFrame):
+		lar_input = [lar_input]
+	row_writer = csv.writer(outfile, delimiter="|", lineterminator="\n")
+	for chunk in lar_input:
+		if isinstance(chunk, pd.DataFrame):
+			chunk.to_csv(outfile, sep="|", header=False, index=False)
+		elif isinstance(chunk, dict):
+			row_writer.writerow(chunk.values())
+		else:
+			row_writer.writerow(chunk)
 
-			#create dataframes of TS and LAR data
-			ts_df = pd.DataFrame(data=ts_data, dtype=object, columns=ts_schema.field)
-			lar_df  = pd.DataFrame(data=lar_data, dtype=object, columns=lar_schema.field)
 
-			return ts_df, lar_df
-	else:
+def read_data_file(path, data_file, lar_schema=None, ts_schema=None, chunksize=None):
+	"""
+	Reads a complete file (includes LAR and TS rows) into pandas
+	dataframes and returns them.
+	lar_schema and ts_schema: schema_index or schema DataFrame, the 2024 schemas are used if none are passed
+	chunksize: if passed, LAR data is returned as an iterator of dataframes with chunksize rows
+	"""
+	if data_file is None:
 		raise ValueError("A data file must be passed.")
+	return read_hmda_file(path+data_file, lar_fields=schema_fields(lar_schema, "2024/schemas/lar_schema.json"),
+		ts_fields=schema_fields(ts_schema, "2024/schemas/ts_schema.json"), chunksize=chunksize)
+
+def schema_fields(schema=None, schema_file=None):
+	"""Returns the field names of a schema_index or schema DataFrame, loading schema_file if no schema is passed."""
+	if schema is None:
+		schema = load_schema(schema_file)
+	if isinstance(schema, pd.DataFrame):
+		return list(schema.field)
+	return list(schema.fields)
+
+def read_hmda_file(data_file, lar_fields, ts_fields, chunksize=None):
+	"""
+	Reads a pipe delimited HMDA file. The TS row on the first line is split on its own.
+	Returns the TS dataframe and either a LAR dataframe or, if chunksize is passed,
+	an iterator of LAR dataframes with up to chunksize rows each.
+	"""
+	with open(data_file, 'r') as infile:
+		ts_row = infile.readline().rstrip("\n")
+	ts_df = pd.DataFrame(data=[ts_row.split("|")], dtype=object, columns=ts_fields)
+	if chunksize is None:
+		return ts_df, next(read_lar_chunks(data_file, lar_fields))
+	return ts_df, read_lar_chunks(data_file, lar_fields, chunksize=chunksize)
+
+def read_lar_chunks(data_file, lar_fields, chunksize=None):
+	"""
+	Yields the LAR rows of a HMDA file as dataframes of chunksize rows, or a single dataframe if chunksize is None.
+	Rows are parsed by the pandas C parser as strings, only one chunk of rows is held in memory at a time.
+	"""
+	with open(data_file, 'r') as infile:
+		infile.readline() #skip TS row
+		try:
+			lar_data = pd.read_csv(infile, sep="|", header=None, names=lar_fields, dtype=object, keep_default_na=False,
+				na_filter=False, quoting=csv.QUOTE_NONE, chunksize=chunksize)
+		except pd.errors.EmptyDataError: #the file has no LAR rows
+			if chunksize is None:
+				yield pd.DataFrame(columns=lar_fields, dtype=object)
+			return
+		if chunksize is None:
+			yield lar_data
+			return
+		for chunk in lar_data:
+			if len(chunk):
+				yield chunk.reset_index(drop=True) #each chunk is indexed from 0 like a file read on its own
 
 def unique_uli(new_lar_df=None, lei=None):
     """
     Generates a set of unique ULI's for a LAR dataframe.
     """
-
-    #Copy over ULIs with the LEI
-    new_lar_df["uli"] = new_lar_df["uli"].apply(lambda x: lei)  
-    
-    #Generates a loan ID as a random 23-character string for each LEI
-    new_lar_df["uli"] = new_lar_df["uli"].apply(lambda x: x + utils.char_string_gen(23)) 
-    
-    #Adds a check digit to each ULI
-    new_lar_df['uli'] = new_lar_df["uli"].apply(lambda x: x + utils.check_digit_gen(ULI=x))
-
-    #If ULIs are duplicated, the unique_uli function is applied again.  
-    #FIXME: remove recursion and replace with nexted loops:
-    	#for loop for length of new lar file size
-    	#while loop to create new ULIs and check against an established list for duplication
-    if len(new_lar_df['uli']) > len(set(new_lar_df['uli'])):
-        print("Re-Running")
-        self.unique_uli(new_lar_df)
-    else:
-        print("Unique ULIs Assigned")
+    #ULIs are made as a batch and any duplicated loan IDs are replaced before check digits are added.
+    new_lar_df["uli"] = uli_array(lei=lei, n=len(new_lar_df))
+    print("Unique ULIs Assigned")
 
     return new_lar_df
 
@@ -149,6 +172,22 @@ def new_lar_rows(final_row_count=None, lar_df=None, ts_df=None):
 
     return (ts_df, new_lar_df)
 
+def stream_lar_rows(lar_df=None, row_count=None, lei=None, chunksize=100000):
+	"""
+	Yields row_count LAR rows in dataframes of up to chunksize rows by cycling over the rows of lar_df.
+	Each row gets the LEI and a new ULI. Chunks are indexed by their row number in the output file
+	so only one chunk is held in memory at a time.
+	"""
+	if len(lar_df) <=0:
+		raise ValueError("LAR data has 0 rows")
+	for start in range(0, row_count, chunksize):
+		end = min(start+chunksize, row_count)
+		chunk = lar_df.iloc[np.arange(start, end) % len(lar_df)].copy()
+		chunk.index = pd.RangeIndex(start, end)
+		chunk["lei"] = lei
+		chunk["uli"] = serial_uli_array(lei=lei, row_numbers=np.arange(start, end))
+		yield chunk
+
 def row_by_row_modification(lar_df, yaml_filepath='configurations/row_by_row_modification.yaml'):
 	"""
 	Uses the inputs from the row_by_row modification yaml to modify a dataframe
@@ -159,9 +198,17 @@ def row_by_row_modification(lar_df, yaml_filepath='configurations/row_by_row_mod
 	with open(yaml_file, 'r') as f:
 		row_by_row = yaml.safe_load(f)
 	
+	return modify_rows(lar_df, row_by_row)
+
+def modify_rows(lar_df, row_by_row):
+	"""
+	Modifies values for each column in a row specified in a loaded row_by_row modification yaml.
+	Cases for rows that are not in the index of lar_df are skipped, so the cases can be applied to each chunk of a file.
+	"""
 	#Runs through each case in the file. 
-	#Modifies values for each column in a row specified in the yaml file. 
 	for case in row_by_row:
+		if row_by_row[case]["row"] not in lar_df.index:
+			continue
 		for column in row_by_row[case]["columns"]:
 			for key in column:
 				lar_df.at[row_by_row[case]["row"], str(key)] = column[key]
@@ -201,7 +248,96 @@ def change_bank(ts_data=None, lar_data=None, new_bank_name=None, new_lei=None, n
 
 def char_string_gen(length):
 	"""Generates a string of chosen length using ascii uppercase and numerical characters"""
-	return ''.join(random.choice(string.ascii_uppercase + string.digits) for _ in range(length))
+	return char_string_array([length])[0]
+
+#characters used in generated loan IDs and free text
+loan_id_chars = np.frombuffer((string.ascii_uppercase + string.digits).encode("ascii"), dtype=np.uint8)
+
+def default_rng(rng=None):
+	"""Returns rng, or a NumPy Generator seeded from the random module so that random.seed also fixes NumPy draws."""
+	if rng is None:
+		rng = np.random.default_rng(random.getrandbits(64))
+	return rng
+
+def char_matrix_strings(chars):
+	"""Returns a list of strings, one per row of a uint8 matrix of ASCII codes. Null codes are dropped."""
+	return [val.decode("ascii") for val in chars.view("S{len}".format(len=chars.shape[1])).ravel().tolist()]
+
+def char_string_array(lengths, rng=None):
+	"""
+	Returns an object array of uppercase alphanumeric strings, one per entry in lengths.
+	The characters of all strings are drawn as one block of random bytes and cut at the running total of lengths.
+	"""
+	rng = default_rng(rng)
+	lengths = np.asarray(lengths, dtype=np.int64)
+	ends = np.cumsum(lengths)
+	total = int(ends[-1]) if len(ends) else 0
+	block = loan_id_chars[rng.integers(0, len(loan_id_chars), size=total, dtype=np.uint8)].tobytes().decode("ascii")
+	strings = np.empty(len(lengths), dtype=object)
+	strings[:] = [block[start:end] for start, end in zip((ends - lengths).tolist(), ends.tolist())]
+	return strings
+
+def loan_id_array(n=0, length=23, rng=None):
+	"""Returns an object array of n random loan IDs of uppercase letters and digits."""
+	rng = default_rng(rng)
+	chars = loan_id_chars[rng.integers(0, len(loan_id_chars), size=(n, length), dtype=np.uint8)]
+	return np.array(char_matrix_strings(chars), dtype=object)
+
+def uli_array(lei=None, n=0, rng=None):
+	"""
+	Returns an object array of n unique ULIs for lei made of the LEI, a 23 character loan ID and a check digit.
+	Only duplicated loan IDs are drawn again, the rest of the batch is kept.
+	"""
+	rng = default_rng(rng)
+	loan_ids = loan_id_array(n=n, rng=rng)
+	duplicated = pd.Series(loan_ids).duplicated().values
+	while duplicated.any():
+		loan_ids[duplicated] = loan_id_array(n=duplicated.sum(), rng=rng)
+		duplicated = pd.Series(loan_ids).duplicated().values
+	ulis = lei + loan_ids
+	return ulis + check_digit_array(ulis)
+
+def serial_uli_array(lei=None, row_numbers=None, rng=None):
+	"""
+	Returns an object array of ULIs for lei whose loan IDs end with the row numbers in base 36.
+	ULIs made for different row numbers are unique without checking the ULIs already made.
+	"""
+	rng = default_rng(rng)
+	row_numbers = np.asarray(row_numbers, dtype=np.int64)
+	base36_chars = np.frombuffer((string.digits + string.ascii_uppercase).encode("ascii"), dtype=np.uint8)
+	serial = np.empty((len(row_numbers), 10), dtype=np.uint8)
+	remaining = row_numbers.copy()
+	for place in range(9, -1, -1):
+		remaining, place_values = np.divmod(remaining, 36)
+		serial[:, place] = base36_chars[place_values]
+	ulis = lei + loan_id_array(n=len(row_numbers), length=13, rng=rng) + np.array(char_matrix_strings(serial), dtype=object)
+	return ulis + check_digit_array(ulis)
+
+def check_digit_array(ulis=None, valid=True):
+	"""
+	Returns an object array with the check digit of each ULI, computed as check_digit_gen does.
+	The mod 97 remainder is updated one character position at a time across all ULIs so no large integers are built.
+	ULIs with characters other than letters and digits get a blank check digit.
+	"""
+	ulis = np.asarray(ulis, dtype=object)
+	if len(ulis) == 0:
+		return np.array([], dtype=object)
+	codes = np.char.upper(ulis.astype(str))
+	codes = codes.view(np.uint32).reshape(len(ulis), -1).astype(np.int64) #unicode code points, 0 pads shorter ULIs
+	is_digit = (codes >= 48) & (codes <= 57)
+	is_letter = (codes >= 65) & (codes <= 90)
+	#digits add one decimal place to the number and letters (A=10 to Z=35) add two
+	values = np.where(is_digit, codes - 48, np.where(is_letter, codes - 55, 0))
+	places = np.where(is_digit, 10, np.where(is_letter, 100, 1))
+	remainder = np.zeros(len(ulis), dtype=np.int64)
+	for position in range(codes.shape[1]):
+		remainder = (remainder * places[:, position] + values[:, position]) % 97
+	check_digits = 98 - (remainder * 100) % 97
+	if not valid:
+		check_digits = check_digits + 6
+	check_digits = np.array([str(digit).zfill(2)[:2] for digit in check_digits.tolist()], dtype=object)
+	check_digits[~(is_digit | is_letter | (codes == 0)).all(axis=1)] = ""
+	return check_digits
 
 def check_digit_gen(valid=True, ULI=None):
 	"""Generates a check digit for a ULI in accordance with